@@ -0,0 +1,69 @@
+"""
+Benchmark the core DelimitedReader against a naive line-by-line reader.
+
+Synthetic three-column csv files are generated in a temporary directory,
+from 1 MB up to the requested maximum size, and each is read by both
+readers. Run from the project root:
+
+    python -m benchmarks.delimited_reader_benchmark --max-size-mb 1024
+"""
+import argparse
+import os
+import tempfile
+import time
+import numpy as np
+from utils.read_delimited import DelimitedReader
+
+
+def naive_reader(filepath: str) -> dict:
+    """ Typical hand-written reader: split and convert every line in Python """
+    columns = None
+    with open(filepath) as file:
+        header = file.readline().strip().split(",")
+        columns = {name: [] for name in header}
+        for line in file:
+            for name, field in zip(header, line.strip().split(",")):
+                columns[name].append(float(field))
+    return columns
+
+
+def write_synthetic_file(filepath: str, size_mb: float) -> None:
+    """ Write a csv with a header and three float columns of roughly size_mb megabytes """
+    rng = np.random.default_rng(0)
+    target_size = size_mb * 1024 ** 2
+    rows_per_block = 100_000
+    with open(filepath, "w") as file:
+        file.write("time,voltage,current\n")
+        while file.tell() < target_size:
+            block = rng.standard_normal((rows_per_block, 3))
+            np.savetxt(file, block, delimiter=",", fmt="%.8e")
+
+
+def time_reader(reader, filepath: str) -> float:
+    start = time.perf_counter()
+    reader(filepath)
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-size-mb", type=float, default=100, help="Largest synthetic file (default 100 MB)")
+    arguments = parser.parse_args(argv)
+
+    sizes = [size for size in (1, 10, 100, 1024) if size <= arguments.max_size_mb]
+    reader = DelimitedReader()
+
+    print(f"{'size (MB)':>10} {'naive (s)':>10} {'numpy (s)':>10} {'speed-up':>9}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size in sizes:
+            filepath = os.path.join(temp_dir, f"synthetic_{size}MB.csv")
+            write_synthetic_file(filepath, size)
+
+            naive_time = time_reader(naive_reader, filepath)
+            numpy_time = time_reader(reader, filepath)
+            print(f"{size:>10} {naive_time:>10.2f} {numpy_time:>10.2f} {naive_time / numpy_time:>8.1f}x")
+            os.remove(filepath)
+
+
+if __name__ == "__main__":
+    main()
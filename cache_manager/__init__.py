@@ -0,0 +1,8 @@
+from .fingerprint import file_fingerprint, content_fingerprint, full_content_fingerprint, contents_match, data_fingerprint, reader_identity
+from .disk_cache import DiskCache
+from .columnar_store import ColumnarStore
+from .sidecar_reader import SidecarReader
+from .shared_reader import SharedReader
+from .memory_cache import MemoryCache, estimate_size
+
+__all__ = ["file_fingerprint", "content_fingerprint", "full_content_fingerprint", "contents_match", "data_fingerprint", "reader_identity", "DiskCache", "ColumnarStore", "SidecarReader", "SharedReader", "MemoryCache", "estimate_size"]
@@ -0,0 +1,29 @@
+"""
+Command line access to the on-disk data cache.
+
+Usage (from the project root):
+    python -m cache_manager stats <cache_dir>
+    python -m cache_manager purge <cache_dir>
+"""
+import argparse
+from cache_manager.disk_cache import DiskCache
+from cache_manager.columnar_store import ColumnarStore
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m cache_manager", description="Inspect or purge a data cache")
+    parser.add_argument("command", choices=("stats", "purge"))
+    parser.add_argument("cache_dir", help="Directory of the cache, as set in config.json")
+    arguments = parser.parse_args(argv)
+
+    # Both storage formats may share a directory
+    for cache in (DiskCache(arguments.cache_dir), ColumnarStore(arguments.cache_dir)):
+        if arguments.command == "purge":
+            print(f"Removed {cache.purge()} {cache.__class__.__name__} entries from {arguments.cache_dir}")
+        else:
+            stats = cache.get_stats()
+            print(f"{cache.__class__.__name__}: {stats['entries']} entries, {stats['size_mb']:.1f} MB in {arguments.cache_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import os
+import pickle
+import shutil
+import tempfile
+import numpy as np
+from cache_manager.disk_cache import DiskCache
+from utils.logging import decorate_class_with_logging, DEBUG
+
+
+@decorate_class_with_logging(log_level=DEBUG)
+class ColumnarStore(DiskCache):
+    """
+    Disk cache that stores array observables as raw typed arrays opened by memory mapping.
+
+    Overview:
+        Shares the keying, LRU eviction and purging of `DiskCache`, but every
+        entry is a directory. Each numeric, array-like observable is written as
+        its own `.npy` file, everything else (units, scalars, datetimes, ...)
+        goes into a small pickled metadata file.
+
+    - `get` opens the arrays with `mmap_mode="r"`, so nothing is read from disk
+      until a plot touches the corresponding pages.
+    - Restored arrays are read-only `numpy.memmap` views; lists of numbers are
+      returned as arrays.
+
+    Usage Notes:
+        Entries are expected to be `DataCore.export_raw_data()` dictionaries.
+        Processing code must not modify array observables in place.
+    """
+    _extension = ".cols"
+    _meta_filename = "meta.pkl"
+    shares_memory = True
+
+    def _read_entry(self, path: str):
+        with open(os.path.join(path, self._meta_filename), "rb") as meta_file:
+            exported = pickle.load(meta_file)
+
+        for observable, array_filename in exported.pop("arrays").items():
+            exported["raw_data"][observable]["data"] = np.load(os.path.join(path, array_filename), mmap_mode="r")
+        return exported
+
+    def _write_entry(self, path: str, value) -> int:
+        temp_path = tempfile.mkdtemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            raw_data = {}
+            arrays = {}
+            size = 0
+            for index, (observable, entry) in enumerate(value["raw_data"].items()):
+                array = self._as_numeric_array(entry)
+                if array is None:
+                    raw_data[observable] = entry
+                    continue
+
+                # Observable names need not be valid filenames, so arrays are numbered instead
+                array_filename = f"{index}.npy"
+                with open(os.path.join(temp_path, array_filename), "wb") as array_file:
+                    np.save(array_file, array, allow_pickle=False)
+                    size += array_file.tell()
+                raw_data[observable] = {**entry, "data": None}
+                arrays[observable] = array_filename
+
+            with open(os.path.join(temp_path, self._meta_filename), "wb") as meta_file:
+                pickle.dump({**value, "raw_data": raw_data, "arrays": arrays}, meta_file, protocol=pickle.HIGHEST_PROTOCOL)
+                size += meta_file.tell()
+
+            os.replace(temp_path, path)
+            return size
+        except OSError:
+            # Another process stored the same entry first
+            shutil.rmtree(temp_path, ignore_errors=True)
+            if not os.path.isdir(path):
+                raise
+            return self._get_entry_size(path)
+        except BaseException:
+            shutil.rmtree(temp_path, ignore_errors=True)
+            raise
+
+    def _remove_entry(self, path: str) -> None:
+        # Open memory maps can keep files locked on some platforms, those are retried on the next eviction
+        shutil.rmtree(path, ignore_errors=True)
+
+    def _get_entry_size(self, path: str) -> int:
+        return sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+
+    @staticmethod
+    def _as_numeric_array(entry) -> np.ndarray | None:
+        """ Return the observable payload as a numeric array, or None if it should be pickled instead """
+        if entry is None or not isinstance(entry.get("data"), (list, tuple, np.ndarray)):
+            return None
+        try:
+            array = np.asarray(entry["data"])
+        except ValueError:
+            # Ragged nested sequences
+            return None
+        if array.ndim == 0 or array.dtype.kind not in "biuf":
+            return None
+        return array
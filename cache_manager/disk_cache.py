@@ -0,0 +1,185 @@
+import os
+import pickle
+import hashlib
+import tempfile
+import threading
+from utils.logging import decorate_class_with_logging, DEBUG
+
+
+@decorate_class_with_logging(log_level=DEBUG)
+class DiskCache:
+    """
+    Size-capped, persistent cache of picklable objects stored in a directory.
+
+    Every entry is written to its own binary file named after a hashed key, so
+    several processes can safely share one cache directory. The modification
+    time of an entry doubles as its last access time: hits touch the file and
+    eviction removes the least recently used entries first once the total size
+    exceeds `max_size_mb`, down to `eviction_target` of it.
+
+    The total size is kept in a running index, built from one scan of the
+    directory on the first write, so writing does not list the cache. Entries
+    written or removed by other processes are accounted for at the next scan,
+    which happens before every eviction. The index is guarded by a lock, so
+    one instance can be shared by threads, e.g. plot jobs running at the same time.
+
+    - `make_key` hashes any tuple of reprable parts into a file-safe key.
+    - `get` / `put` read and write entries, counting hits and misses.
+    - `purge` removes every entry, `get_stats` summarises the cache.
+
+    Usage Notes:
+        Values are stored with the highest pickle protocol, so anything stored
+        must be picklable and its classes importable when read back. Subclasses
+        change the storage format by overriding the `_read_entry`, `_write_entry`,
+        `_remove_entry` and `_get_entry_size` hooks. `_write_entry` returns the
+        number of bytes it wrote, which goes into the size index without a stat.
+    """
+    _extension = ".pkl"
+    shares_memory = False
+    # Fraction of max_size_mb an eviction frees the cache down to, so the directory is only rescanned once per batch
+    eviction_target = 0.9
+
+    def __init__(self, cache_dir: str, max_size_mb: float = 1024):
+        if not isinstance(cache_dir, str):
+            raise ValueError("cache_dir must be a string/path")
+        if max_size_mb <= 0:
+            raise ValueError("max_size_mb must be positive")
+
+        self.cache_dir = cache_dir
+        self.max_size = int(max_size_mb * 1024 ** 2)
+        self.hits = 0
+        self.misses = 0
+        self._entry_sizes: dict[str, int] | None = None
+        self._size = 0
+        self._index_lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+    def get(self, key: str):
+        """ Return the cached value for key or None on a miss, touching the entry on a hit """
+        path = self._get_entry_path(key)
+        try:
+            value = self._read_entry(path)
+            os.utime(path)
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+            # Missing, evicted by another process or half-written entries all count as misses
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value) -> None:
+        path = self._get_entry_path(key)
+        size = self._write_entry(path, value)
+        with self._index_lock:
+            self._track(path, size)
+            if self._size > self.max_size:
+                self._evict()
+
+    def purge(self) -> int:
+        """ Remove all entries from the cache and return how many were removed """
+        removed = 0
+        with self._index_lock:
+            for path, _, _ in self._list_entries():
+                self._remove_entry(path)
+                removed += 1
+            self._set_index([])
+        return removed
+
+    def get_size(self) -> int:
+        return sum(size for _, size, _ in self._list_entries())
+
+    def get_stats(self) -> dict:
+        entries = self._list_entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(entries),
+            "size_mb": sum(size for _, size, _ in entries) / 1024 ** 2,
+        }
+
+    def __getstate__(self):
+        # Worker processes get their own lock and index
+        state = self.__dict__.copy()
+        del state["_index_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._index_lock = threading.Lock()
+
+    def _get_entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + self._extension)
+
+    def _read_entry(self, path: str):
+        with open(path, "rb") as entry_file:
+            return pickle.load(entry_file)
+
+    def _write_entry(self, path: str, value) -> int:
+        # Write to a temporary file first so readers never see a partial entry
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as entry_file:
+                pickle.dump(value, entry_file, protocol=pickle.HIGHEST_PROTOCOL)
+                size = entry_file.tell()
+            os.replace(temp_path, path)
+            return size
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def _remove_entry(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _get_entry_size(self, path: str) -> int:
+        return os.path.getsize(path)
+
+    def _list_entries(self) -> list[tuple[str, int, float]]:
+        """ List (path, size, last access) for all entries, skipping those removed concurrently """
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(self._extension):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                entries.append((path, self._get_entry_size(path), os.path.getmtime(path)))
+            except OSError:
+                continue
+        return entries
+
+    def _track(self, path: str, size: int) -> None:
+        """ Account for an entry of size bytes just written in the running size index """
+        if self._entry_sizes is None:
+            # The first scan already includes the new entry
+            self._set_index(self._list_entries())
+            return
+        self._size += size - self._entry_sizes.get(path, 0)
+        self._entry_sizes[path] = size
+
+    def _set_index(self, entries: list[tuple[str, int, float]]) -> None:
+        self._entry_sizes = {path: size for path, size, _ in entries}
+        self._size = sum(self._entry_sizes.values())
+
+    def _evict(self) -> None:
+        # Callers hold the index lock. Rescan, other processes sharing the directory may have added or removed entries
+        entries = self._list_entries()
+        total_size = sum(size for _, size, _ in entries)
+        if total_size > self.max_size:
+            # Drop least recently used entries until the cache is below the target again
+            removed = set()
+            for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+                self._remove_entry(path)
+                removed.add(path)
+                total_size -= size
+                if total_size <= self.max_size * self.eviction_target:
+                    break
+            entries = [entry for entry in entries if entry[0] not in removed]
+        self._set_index(entries)
@@ -0,0 +1,147 @@
+import os
+import hashlib
+from functools import lru_cache
+import numpy as np
+
+CONTENT_SAMPLE_SIZE = 64 * 1024
+CONTENT_SAMPLE_COUNT = 16
+
+
+def file_fingerprint(filepath: str) -> tuple[str, int, int]:
+    """
+    Return a cheap identity for a file on disk.
+
+    The fingerprint combines the absolute path, the size in bytes and the
+    modification time in nanoseconds. Any edit to the file changes at least
+    one of these, so it is suitable as part of a cache key without reading
+    the file contents.
+
+    Parameters
+    ----------
+    filepath:
+        Path to an existing file.
+
+    Returns
+    -------
+    tuple[str, int, int]
+        ``(absolute_path, size, mtime_ns)``
+    """
+    stat = os.stat(filepath)
+    return os.path.abspath(filepath), stat.st_size, stat.st_mtime_ns
+
+
+def content_fingerprint(filepath: str) -> str:
+    """
+    Return a hash of the contents of a file, identical for byte-identical copies.
+
+    Files up to ``CONTENT_SAMPLE_COUNT * CONTENT_SAMPLE_SIZE`` bytes are hashed
+    completely. Larger files are hashed from their size and evenly spaced samples,
+    including the first and last bytes, so hashing time does not grow with the
+    file. Files that differ only outside the samples get the same hash, so for
+    those a match only makes them candidates, confirm it with `contents_match`
+    before treating them as identical.
+
+    Hashes are remembered per `file_fingerprint`, so unchanged files are only
+    hashed once per process.
+    """
+    return _hash_contents(*file_fingerprint(filepath))
+
+
+@lru_cache(maxsize=4096)
+def _hash_contents(filepath: str, size: int, mtime_ns: int) -> str:
+    content_hash = hashlib.blake2b(str(size).encode(), digest_size=16)
+    with open(filepath, "rb") as file:
+        if size <= CONTENT_SAMPLE_COUNT * CONTENT_SAMPLE_SIZE:
+            content_hash.update(file.read())
+        else:
+            for sample in range(CONTENT_SAMPLE_COUNT):
+                file.seek((size - CONTENT_SAMPLE_SIZE) * sample // (CONTENT_SAMPLE_COUNT - 1))
+                content_hash.update(file.read(CONTENT_SAMPLE_SIZE))
+    return content_hash.hexdigest()
+
+
+def full_content_fingerprint(filepath: str) -> str:
+    """
+    Return a hash of all contents of a file, equal to `content_fingerprint` for
+    files small enough to be hashed completely. Remembered per `file_fingerprint`.
+    """
+    return _hash_full_contents(*file_fingerprint(filepath))
+
+
+def contents_match(first: tuple[str, int, int], second: tuple[str, int, int]) -> bool:
+    """
+    Whether two files, given by their `file_fingerprint`, hold the same bytes.
+
+    Meant to confirm a `content_fingerprint` match, large files are read
+    completely. Files that changed since they were fingerprinted never match.
+    """
+    if first == second:
+        return True
+    if first[1] != second[1]:
+        return False
+    try:
+        if file_fingerprint(first[0]) != first or file_fingerprint(second[0]) != second:
+            return False
+    except OSError:
+        return False
+    return _hash_full_contents(*first) == _hash_full_contents(*second)
+
+
+@lru_cache(maxsize=4096)
+def _hash_full_contents(filepath: str, size: int, mtime_ns: int) -> str:
+    if size <= CONTENT_SAMPLE_COUNT * CONTENT_SAMPLE_SIZE:
+        return _hash_contents(filepath, size, mtime_ns)
+    content_hash = hashlib.blake2b(str(size).encode(), digest_size=16)
+    with open(filepath, "rb") as file:
+        for block in iter(lambda: file.read(1024 ** 2), b""):
+            content_hash.update(block)
+    return content_hash.hexdigest()
+
+
+def data_fingerprint(raw_data: dict) -> str:
+    """
+    Return a hash of parsed observables, e.g. `DataCore.raw_data`.
+
+    Unlike `content_fingerprint` this covers every value, including observables
+    that do not come from the file contents (such as a datetime parsed from the
+    filename) and the dtypes arrays are stored with. Arrays are hashed from
+    their buffers, so hashing memory-mapped data reads it from disk.
+    """
+    content_hash = hashlib.blake2b(digest_size=16)
+    for observable in sorted(raw_data, key=repr):
+        entry = raw_data[observable]
+        content_hash.update(repr(observable).encode())
+        if entry is None:
+            content_hash.update(b"None")
+            continue
+        content_hash.update(repr(entry.get("units")).encode())
+        _hash_value(content_hash, entry.get("data"))
+    return content_hash.hexdigest()
+
+
+def _hash_value(content_hash, value) -> None:
+    if isinstance(value, (list, tuple, np.ndarray)):
+        try:
+            array = np.asarray(value)
+        except ValueError:
+            # Ragged nested sequences
+            array = None
+        if array is not None and array.dtype != object:
+            array = np.ascontiguousarray(array)
+            content_hash.update(f"{array.dtype.str}{array.shape}".encode())
+            content_hash.update(array.reshape(-1).view(np.uint8))
+            return
+    content_hash.update(f"{type(value).__qualname__}:{value!r}".encode())
+
+
+def reader_identity(file_reader) -> str:
+    """
+    Identify a file reader for use in cache keys.
+
+    Combines the module and qualified name of the reader (or of its class for
+    callable instances) with its optional ``version`` attribute. Readers should
+    bump ``version`` whenever their parsing changes so stale entries are not reused.
+    """
+    reader_name = getattr(file_reader, "__qualname__", type(file_reader).__qualname__)
+    reader_module = getattr(file_reader, "__module__", "")
+    return f"{reader_module}.{reader_name}:{getattr(file_reader, 'version', 0)}"
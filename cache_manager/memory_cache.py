@@ -0,0 +1,220 @@
+import sys
+import threading
+from collections import OrderedDict
+from typing import Callable
+import numpy as np
+from utils.logging import decorate_class_with_logging, DEBUG
+
+
+def estimate_size(value, exclude: tuple = ()) -> int:
+    """
+        Estimate the number of bytes held by an object and everything it references.
+
+        Arrays count their buffer, memory-mapped arrays count nothing as their data
+        stays on disk. Objects in `exclude` (and anything only reachable through
+        them) are not counted, e.g. a data object already cached under its own key.
+    """
+    seen = {id(obj) for obj in exclude}
+    size = 0
+    stack = [value]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+
+        if isinstance(obj, np.ndarray):
+            size += 0 if isinstance(obj, np.memmap) else obj.nbytes
+            continue
+
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__") and not isinstance(obj, type):
+            stack.append(vars(obj))
+    return size
+
+
+@decorate_class_with_logging(log_level=DEBUG)
+class MemoryCache:
+    """
+    Thread-safe, application-level cache of loaded objects with a memory budget.
+
+    Overview:
+        Shares parsed data and processors between background prefetching and
+        plot runs, so a file loaded once is not read again, nor its processed
+        observables recomputed, while it stays in memory.
+
+    - `get` / `put` store and retrieve entries by any hashable key.
+    - `reserve` lets a loader claim a key before loading it; other callers of
+      `get` wait for that load to finish instead of repeating it.
+    - `release` gives up a reservation, e.g. when a load fails or is cancelled.
+    - Once the estimated size of all entries exceeds `max_size_mb` the least
+      recently used entries are evicted, None disables the budget.
+    - An entry stored with a `parent` (e.g. a processor with the key of its data
+      object) is evicted together with that parent, and using it also counts as
+      using the parent. Its size should exclude the parent, which is counted once
+      under its own key.
+
+    Usage Notes:
+        Callers should not wait for a key while holding reservations of their
+        own, two loaders waiting on each other's keys never finish. Values are
+        shared, not copied. Sizes are estimated once, when an entry
+        is stored, so entries that grow afterwards (e.g. processors filling
+        `processed_data`) should be stored again to update their size.
+    """
+    # Seconds between checks of is_cancelled while waiting for a reserved key
+    _wait_interval = 0.1
+
+    def __init__(self, max_size_mb: float | None = None):
+        if max_size_mb is not None and max_size_mb <= 0:
+            raise ValueError("max_size_mb must be positive or None")
+
+        self.max_size = int(max_size_mb * 1024 ** 2) if max_size_mb is not None else None
+        self._entries: OrderedDict[object, tuple[object, int]] = OrderedDict()
+        self._pending: dict[object, threading.Event] = {}
+        self._parents: dict[object, object] = {}
+        self._children: dict[object, set] = {}
+        self._lock = threading.Lock()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, wait: bool = True, is_cancelled: Callable[[], bool] = None):
+        """
+            Return the entry for key or None, waiting for a reserved key to be loaded if wait is set.
+            is_cancelled is polled while waiting, the wait ends with None once it returns True.
+        """
+        with self._lock:
+            value = self._get_entry(key)
+            if value is not None:
+                return value
+            pending = self._pending.get(key)
+
+        if pending is not None and wait:
+            while not pending.wait(timeout=self._wait_interval):
+                if is_cancelled is not None and is_cancelled():
+                    break
+            with self._lock:
+                value = self._get_entry(key)
+                if value is not None:
+                    return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def _get_entry(self, key):
+        # Callers hold the lock
+        if key not in self._entries:
+            return None
+        self._touch(key)
+        self.hits += 1
+        return self._entries[key][0]
+
+    def _touch(self, key) -> None:
+        # Callers hold the lock, a parent is used whenever its children are so it is never evicted before them
+        parent = self._parents.get(key)
+        if parent in self._entries:
+            self._touch(parent)
+        self._entries.move_to_end(key)
+
+    def contains(self, key) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def is_pending(self, key) -> bool:
+        """ Whether key is reserved by a loader that has not stored it yet """
+        with self._lock:
+            return key in self._pending
+
+    def reserve(self, key) -> bool:
+        """ Claim key for loading, returns False if it is already cached or being loaded """
+        with self._lock:
+            if key in self._entries or key in self._pending:
+                return False
+            self._pending[key] = threading.Event()
+            return True
+
+    def release(self, key) -> None:
+        with self._lock:
+            pending = self._pending.pop(key, None)
+        if pending is not None:
+            pending.set()
+
+    def put(self, key, value, size: int = None, parent=None) -> None:
+        """
+            Store value under key, size defaults to `estimate_size(value)`. With parent set, the entry is
+            evicted together with the entry stored under parent and its default size excludes the value
+            of that entry, when it is cached.
+        """
+        with self._lock:
+            if size is None:
+                # Estimated under the lock so the parent cannot be evicted between estimating and linking
+                parent_entry = self._entries.get(parent) if parent is not None else None
+                size = estimate_size(value, exclude=(parent_entry[0],) if parent_entry is not None else ())
+            if key in self._entries:
+                self._size -= self._entries.pop(key)[1]
+            self._unlink(key)
+            if parent is not None and parent in self._entries:
+                self._parents[key] = parent
+                self._children.setdefault(parent, set()).add(key)
+            self._entries[key] = (value, size)
+            self._touch(key)
+            self._size += size
+            self._evict()
+            pending = self._pending.pop(key, None)
+        if pending is not None:
+            pending.set()
+
+    def _evict(self) -> None:
+        # Callers hold the lock, the most recent entry is always kept even if it exceeds the budget alone
+        if self.max_size is None:
+            return
+        newest = next(reversed(self._entries))
+        while self._size > self.max_size and len(self._entries) > 1:
+            oldest = next(iter(self._entries))
+            if oldest == self._parents.get(newest):
+                break
+            self._remove(oldest)
+
+    def _remove(self, key) -> None:
+        # Callers hold the lock, children go with their parent as they keep its value alive
+        _, size = self._entries.pop(key)
+        self._size -= size
+        self.evictions += 1
+        for child in self._children.pop(key, set()):
+            self._parents.pop(child, None)
+            if child in self._entries:
+                self._remove(child)
+        self._unlink(key)
+
+    def _unlink(self, key) -> None:
+        parent = self._parents.pop(key, None)
+        if parent is not None:
+            self._children.get(parent, set()).discard(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._parents.clear()
+            self._children.clear()
+            self._size = 0
+
+    def get_size(self) -> int:
+        with self._lock:
+            return self._size
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "size_mb": round(self._size / 1024 ** 2, 2),
+            }
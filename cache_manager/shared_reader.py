@@ -0,0 +1,59 @@
+import os
+from cache_manager.fingerprint import content_fingerprint, contents_match, file_fingerprint, full_content_fingerprint, reader_identity
+from cache_manager.memory_cache import MemoryCache
+from contracts.file_readers import FileReaderFn, ReaderOutput
+
+
+class SharedReader:
+    """
+    File reader wrapper that parses byte-identical files only once.
+
+    Reader outputs are stored in a `MemoryCache` under the content hash of the
+    file (see `content_fingerprint`), so a copy of an already parsed file, under
+    another label or in another dataset, gets the same output back and the data
+    objects reading it share their arrays. Large files are only hashed from
+    samples, so an output is only shared once `contents_match` confirms that the
+    file it was parsed from is identical. Files whose samples collide with a
+    different file are shared under the hash of their full contents instead.
+    Concurrent reads of identical files wait for the first one instead of
+    parsing in parallel.
+
+    Outputs that are not dictionaries, such as the generators returned by a
+    `StreamingFileReaderFn`, and reads of directories are passed through without being shared. Like the
+    wrapped reader, instances satisfy `FileReaderFn`.
+    """
+    def __init__(self, file_reader: FileReaderFn, shared_outputs: MemoryCache):
+        self.file_reader = file_reader
+        self.shared_outputs = shared_outputs
+
+    @property
+    def version(self) -> str:
+        return reader_identity(self.file_reader)
+
+    def __call__(self, filepath: str, *args, **kwargs) -> ReaderOutput:
+        if not os.path.isfile(filepath):
+            return self.file_reader(filepath, *args, **kwargs)
+
+        source = file_fingerprint(filepath)
+        key = (content_fingerprint(filepath), self.version, args, tuple(sorted(kwargs.items())))
+        entry = self.shared_outputs.get(key)
+        if entry is not None and not contents_match(entry[0], source):
+            key = (*key, full_content_fingerprint(filepath))
+            entry = self.shared_outputs.get(key)
+        if entry is not None:
+            # Arrays are shared, the dictionary itself is copied in case read_file pops from it
+            return dict(entry[1])
+
+        reserved = self.shared_outputs.reserve(key)
+        try:
+            reader_output = self.file_reader(filepath, *args, **kwargs)
+        except BaseException:
+            if reserved:
+                self.shared_outputs.release(key)
+            raise
+
+        if isinstance(reader_output, dict):
+            self.shared_outputs.put(key, (source, dict(reader_output)))
+        elif reserved:
+            self.shared_outputs.release(key)
+        return reader_output
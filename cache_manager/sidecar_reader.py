@@ -0,0 +1,38 @@
+import os
+from cache_manager.disk_cache import DiskCache
+from cache_manager.fingerprint import file_fingerprint, reader_identity
+from contracts.file_readers import FileReaderFn, ReaderOutput
+
+
+class SidecarReader:
+    """
+    File reader wrapper that converts slow-to-parse files into binary sidecars.
+
+    The first read of a file with one of the given extensions goes through the
+    wrapped reader, after which its output is written to the sidecar cache.
+    Later reads are served from that sidecar until the size or modification
+    time of the source file changes, at which point it is parsed again. Other
+    files are passed straight to the wrapped reader.
+
+    Sidecars live in a `DiskCache`, so they share its size cap, LRU eviction
+    and purging. Like the wrapped reader, instances satisfy `FileReaderFn`.
+    """
+    def __init__(self, file_reader: FileReaderFn, sidecar_cache: DiskCache, extensions=("xlsx", "xls")):
+        self.file_reader = file_reader
+        self.sidecar_cache = sidecar_cache
+        self.extensions = tuple(f".{extension.lower()}" for extension in extensions)
+
+    @property
+    def version(self) -> str:
+        return reader_identity(self.file_reader)
+
+    def __call__(self, filepath: str, *args, **kwargs) -> ReaderOutput:
+        if os.path.splitext(filepath)[1].lower() not in self.extensions:
+            return self.file_reader(filepath, *args, **kwargs)
+
+        key = self.sidecar_cache.make_key(*file_fingerprint(filepath), self.version, args, sorted(kwargs.items()))
+        reader_output = self.sidecar_cache.get(key)
+        if reader_output is None:
+            reader_output = self.file_reader(filepath, *args, **kwargs)
+            self.sidecar_cache.put(key, dict(reader_output))
+        return reader_output
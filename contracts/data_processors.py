@@ -1,8 +1,19 @@
 from abc import ABC, abstractmethod
-from contracts.data_types import Data
+from collections import OrderedDict
+import hashlib
+import inspect
+import threading
+import types
+import numpy as np
+from cache_manager import DiskCache, reader_identity
+from contracts.data_types import Data, DataCore
 from contracts.observable import Observable
 from typing import Callable, Any
 from utils.logging import  DEBUG_DATA_PROCESSOR, decorate_class_with_logging
+from utils.precision import as_typed_array
+from utils.cancellation import raise_if_cancelled
+from utils.decimation import decimation_indices
+from utils.expressions import CompiledExpression, compile_declarations, get_configured_expressions
 
 
 class DataProcessor(ABC):
@@ -33,6 +44,156 @@ class DataProcessor(ABC):
     def validate_observables(self, *args, **kwargs) -> None:
         pass
 
+def depends_on(*observables: str, provides: str = None):
+    """
+        Declare the observables a processing function reads through `get_data`.
+
+        `provides` names the observable the function computes when it is registered
+        under a name other than its own. It is only needed for projection, where the
+        worker resolves dependencies before any processor exists.
+
+        Usage:
+            @depends_on("voltage", "current", provides="voc")
+            def compute_open_circuit_voltage(self):
+                ...
+    """
+    def decorator(processing_function):
+        processing_function.depends_on = tuple(observables)
+        processing_function.provides = provides or processing_function.__name__
+        return processing_function
+    return decorator
+
+
+def _canonical(value) -> Any:
+    """ Hashable stand-in for a processing function argument, equal for equal values """
+    if isinstance(value, np.ndarray):
+        return "ndarray", value.dtype.str, value.shape, hashlib.blake2b(np.ascontiguousarray(value).tobytes(), digest_size=16).hexdigest()
+    if isinstance(value, dict):
+        return "dict", tuple(sorted((repr(key), _canonical(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return type(value).__name__, tuple(_canonical(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        # Sorted so the repr, used in disk cache keys, does not depend on hash randomisation
+        return "set", tuple(sorted((_canonical(item) for item in value), key=repr))
+    try:
+        hash(value)
+    except TypeError:
+        return "repr", repr(value)
+    return value
+
+
+def _canonical_args(args: tuple, kwargs: dict) -> tuple:
+    return _canonical(args), tuple(sorted((key, _canonical(value)) for key, value in kwargs.items()))
+
+
+def _named_arguments(function: Callable, kwargs: dict) -> dict | None:
+    """
+        The kwargs that function names as parameters, or None if it cannot be called with only those.
+
+        Functions taking *args/**kwargs may need arguments their signature does not show (elapsed_time
+        reads kwargs["experiment_datetime"]), so they are never called this way.
+    """
+    try:
+        signature = inspect.signature(function)
+    except (TypeError, ValueError):
+        return None
+    parameters = signature.parameters.values()
+    if any(parameter.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+           for parameter in parameters):
+        return None
+
+    named = {
+        parameter.name: kwargs[parameter.name] for parameter in parameters
+        if parameter.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+        and parameter.name in kwargs
+    }
+    try:
+        signature.bind(**named)
+    except TypeError:
+        return None
+    return named
+
+
+def _is_series(entry: Observable | None) -> bool:
+    return entry is not None and isinstance(entry.get("data"), (np.ndarray, list, tuple))
+
+
+def processing_version(version):
+    """
+        Declare the version of a processing function, bump it whenever its results change.
+
+        Results in a persistent processed cache are keyed on it, see
+        `DataProcessorCore.set_processed_cache`.
+    """
+    def decorator(processing_function):
+        processing_function.version = version
+        return processing_function
+    return decorator
+
+
+def cpu_heavy(processing_function):
+    """
+        Mark a processing function as expensive enough to run in worker processes.
+
+        `DeviceWorkerCore` then evaluates it for all processors in a process pool
+        before plotting instead of one file at a time on the worker thread, if it
+        can be called without arguments, see `DeviceWorkerCore.evaluate_in_parallel`.
+    """
+    processing_function.cpu_heavy = True
+    return processing_function
+
+
+def vectorized(observable: str):
+    """
+        Mark a classmethod that computes a processed observable for many processors in one call.
+
+        The function receives the list of processors plus the arguments of the request and
+        returns one Observable per processor, in the same order. It is used by
+        `DeviceWorkerCore.get_batched_data`; per-file `get_data` calls keep using the
+        regular processing function.
+
+        Usage:
+            @classmethod
+            @vectorized("power")
+            def compute_power_batch(cls, processors, *args, **kwargs):
+                voltage = np.stack([processor.get_data("voltage") for processor in processors])
+                ...
+    """
+    def decorator(batch_function):
+        batch_function.vectorizes = observable
+        return batch_function
+    return decorator
+
+
+class _DerivedObservable:
+    """ Processing function evaluating an expression over other observables of its processor """
+    def __init__(self, processor: "DataProcessorCore", observable: str, expression: CompiledExpression, units: str = None):
+        self.processor = processor
+        self.__name__ = self.provides = observable
+        self.expression = expression
+        self.depends_on = expression.names
+        self.units = units
+        # Identifies the function in processed cache keys, see `reader_identity`
+        self.version = f"{expression.expression}|{units}"
+
+    def __call__(self, *args, **kwargs) -> Observable:
+        available = set(self.processor.data.get_allowed_observables()) | set(self.processor._processed_observables)
+        unknown = [name for name in self.expression.names if name not in available]
+        if unknown:
+            raise ValueError(f"{self.__name__} = {self.expression.expression!r} uses unknown observables {unknown}")
+
+        # Arguments of the request go to processed inputs, e.g. experiment_datetime for "elapsed_hours * 60"
+        data = self.expression.evaluate({
+            name: self.processor.get_data(name, *args, **kwargs) for name in self.expression.names
+        })
+        units = self.units
+        if units is None:
+            units = self.expression.get_units({
+                name: self.processor.get_units(name, *args, **kwargs) for name in self.expression.names
+            })
+        return {"units": units, "data": data}
+
+
 @decorate_class_with_logging(log_level=DEBUG_DATA_PROCESSOR)
 class DataProcessorCore(DataProcessor):
     """
@@ -45,6 +206,38 @@ class DataProcessorCore(DataProcessor):
 
        - Maintains `_processing_functions` and `processed_data` cache.
        - get_data/get_units compute lazily and raise ValueError if unknown.
+       - Numeric results are stored as typed arrays when a dtype is declared in
+         the result, in `observable_dtypes`, or compact precision is enabled.
+       - Functions decorated with `depends_on` form a dependency graph: their
+         processed inputs are evaluated first in topological order, with the
+         keyword arguments of the request their function names, and
+         `invalidate` clears an observable together with everything derived from it.
+       - Results are memoised per observable and arguments, at most `memo_size`
+         per processor with least recently used eviction. Calls without arguments
+         are one more argument set. `processed_data` holds the latest result of
+         every observable for inspection only. `get_memo_stats` counts hits and misses.
+       - Classmethods decorated with `vectorized` compute an observable for many
+         processors at once, their results are stored with `store_result`.
+       - With a processed cache set, results are also stored on disk, keyed by
+         the processor class, the `processing_version` of the function, the
+         parsed raw data and the arguments, so they survive sessions
+         and can be shared between machines.
+       - Functions decorated with `cpu_heavy` are evaluated in a process pool by
+         the worker, so processors must be picklable (bound methods and
+         module-level functions in `_processing_functions` are).
+       - `derived_observables` declares observables as expressions over other
+         observables (e.g. ``{"current_density": "current / 0.16"}``), compiled
+         once and evaluated with NumPy, see `utils.expressions`. Units follow
+         from the inputs unless given. Processors also pick up expressions set
+         for their class name under "derived_observables" in `config.json`.
+         Names colliding with processing functions are rejected, and
+         `validate_derived_observables` checks them against the data.
+       - `lock` serialises computations on one processor, so plot jobs running
+         at the same time can share it (e.g. through the memory cache). It is
+         held while a processing function runs.
+       - Nothing is computed once the run on the current thread is cancelled,
+         long processing functions can call `utils.cancellation.raise_if_cancelled`
+         themselves (see `DeviceWorkerCore.cancel`).
        - validate_observables remains abstract for concrete checks.
 
        Usage Notes:
@@ -54,18 +247,32 @@ class DataProcessorCore(DataProcessor):
 
     processed_data: dict[str, Observable]
     processing_functions: dict[str, Callable]
+    observable_dtypes: dict[str, str] = {}
+    derived_observables: dict[str, str | dict] = {}
+    memo_size = 32
 
     def __init__(self, data: Data):
         self.data = data
         self._processing_functions = {
-            "elapsed_time": self.elapsed_time
+            "elapsed_time": self.elapsed_time,
+            "elapsed_hours": self.elapsed_hours
         }
+        for observable, (expression, units) in self.get_derived_observables().items():
+            self._processing_functions[observable] = _DerivedObservable(self, observable, expression, units)
         self.processed_data: dict[str, Observable] = {}
         for key in self._processing_functions:
             self.processed_data[key] = None
 
         self._processed_observables = self.processed_data.keys()
 
+        self._memo: OrderedDict[tuple, Observable] = OrderedDict()
+        self.memo_hits = 0
+        self.memo_misses = 0
+
+        self.processed_cache = None
+        self._source_key = None
+        self.lock = threading.RLock()
+
     def get_data(self, observable: str, *args, **kwargs):
         # If observable is available from raw data delegate to Data
         if observable in self.data.get_allowed_observables():
@@ -73,26 +280,296 @@ class DataProcessorCore(DataProcessor):
 
         # Compute processed data if needed
         elif observable in self._processed_observables:
-            if self.processed_data[observable] is None:
-                # Adds the data to the processed_data dict after computing it
-                self.processed_data[observable] = self._processing_functions[observable](*args, **kwargs)
-
-            # Simply return if already set
-            return self.processed_data[observable]['data']
+            return self._get_processed(observable, *args, **kwargs)['data']
         else:
             # FIXME: Apparently object has no attribute '__name__'. Did you mean: '__ne__'? gets triggered when ValueError is raised
             raise ValueError(f"{self.__class__.__name__} does not contain {observable} data")
 
     def get_units(self, observable: str, *args, **kwargs) -> str:
-        self.get_data(observable)
         # Return raw data
         if observable in self.data.get_allowed_observables():
             return self.data.get_units(observable)
         elif observable in self._processed_observables:
-            return self.processed_data[observable]["units"]
+            return self._get_processed(observable, *args, **kwargs)["units"]
         else:
             raise ValueError(f"{self.__class__.__name__} does not contain {observable} data")
 
+    def _get_processed(self, observable: str, *args, **kwargs) -> Observable:
+        with self.lock:
+            # Calls without arguments are keyed like any other, so they never return a result computed with arguments
+            key = (observable, _canonical_args(args, kwargs))
+            if key in self._memo:
+                self.memo_hits += 1
+                self._memo.move_to_end(key)
+                self.processed_data[observable] = self._memo[key]
+                return self._memo[key]
+
+            self.memo_misses += 1
+            disk_key = self._get_disk_key(key)
+            cached = self.processed_cache.get(disk_key) if disk_key is not None else None
+            if cached is not None:
+                return self._store(key, cached)
+
+            # Cancelled runs stop before computing anything else, processing functions may check in between as well
+            raise_if_cancelled()
+
+            # Dependencies are computed first, with the keyword arguments of this request their function names.
+            #   Others are left to the function, which requests them with the arguments it needs
+            for dependency in self.get_evaluation_order(observable)[:-1]:
+                dependency_kwargs = _named_arguments(self._processing_functions[dependency], kwargs)
+                if dependency_kwargs is not None and not self.has_result(dependency, **dependency_kwargs):
+                    self._get_processed(dependency, **dependency_kwargs)
+
+            result = self._store(key, self._processing_functions[observable](*args, **kwargs))
+            if disk_key is not None:
+                self.processed_cache.put(disk_key, result)
+            return result
+
+    def set_processed_cache(self, processed_cache: DiskCache | None, source_key: tuple = None) -> None:
+        """
+            Persist results in processed_cache, source_key identifies the input data (e.g. a
+            hash of its raw data and the data type), results are only persisted when it is set
+        """
+        if processed_cache is not None and not isinstance(processed_cache, DiskCache):
+            raise TypeError("processed_cache must be an instance of DiskCache or None")
+        self.processed_cache = processed_cache
+        self._source_key = source_key
+
+    def get_source_key(self) -> tuple | None:
+        return self._source_key
+
+    def load_persisted(self, observable: str, *args, **kwargs) -> bool:
+        """ Load a result from the processed cache into memory without computing it, returns whether it was found """
+        with self.lock:
+            key = (observable, _canonical_args(args, kwargs))
+            disk_key = self._get_disk_key(key)
+            cached = self.processed_cache.get(disk_key) if disk_key is not None else None
+            if cached is not None:
+                self._store(key, cached)
+            return cached is not None
+
+    def _get_disk_key(self, key: tuple) -> str | None:
+        if self.processed_cache is None or self._source_key is None:
+            return None
+        observable, arguments = key
+        return self.processed_cache.make_key(
+            self._source_key,
+            f"{type(self).__module__}.{type(self).__qualname__}",
+            reader_identity(self._processing_functions[observable]),
+            observable,
+            arguments
+        )
+
+    def _store(self, key: tuple, result: Observable) -> Observable:
+        result = self._apply_dtype(key[0], result)
+        self._memo[key] = result
+        if len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
+        self.processed_data[key[0]] = result
+        return result
+
+    def has_result(self, observable: str, *args, **kwargs) -> bool:
+        """ Whether get_data(observable, *args, **kwargs) would be served without computing """
+        with self.lock:
+            return (observable, _canonical_args(args, kwargs)) in self._memo
+
+    def store_result(self, observable: str, result: Observable, *args, **kwargs) -> None:
+        """ Store a result computed elsewhere, e.g. by a `vectorized` function, as if get_data computed it """
+        with self.lock:
+            if observable not in self._processed_observables:
+                raise ValueError(f"{self.__class__.__name__} does not contain {observable} data")
+            self._store((observable, _canonical_args(args, kwargs)), result)
+
+    @classmethod
+    def get_vectorized(cls, observable: str) -> Callable | None:
+        """ Function declared with `vectorized` that computes observable for many processors at once, if any """
+        for _, function in inspect.getmembers(cls, inspect.ismethod):
+            if getattr(function, "vectorizes", None) == observable:
+                return function
+        return None
+
+    def is_cpu_heavy(self, observable: str) -> bool:
+        return getattr(self._processing_functions.get(observable), "cpu_heavy", False)
+
+    def needs_arguments(self, observable: str) -> bool:
+        """ Whether the processing function of observable may need arguments, e.g. `elapsed_time` """
+        return _named_arguments(self._processing_functions[observable], {}) is None
+
+    def get_inputs(self, observable: str) -> set[str] | None:
+        """ Observables observable is computed from, directly or not, None if any function on the way does not declare them """
+        inputs = set()
+        frontier = {observable}
+        while frontier:
+            dependencies = set()
+            for name in frontier & set(self._processing_functions):
+                declared = self.get_dependencies(name)
+                if declared is None:
+                    return None
+                dependencies |= set(declared)
+            frontier = dependencies - inputs
+            inputs |= frontier
+        return inputs
+
+    def get_evaluation_copy(self, observable: str) -> "DataProcessorCore":
+        """
+            Copy of this processor holding only what computing observable takes, to send to worker processes.
+
+            Series (arrays and lists) that are not declared inputs, results other than those of its inputs
+            and the processed cache are left out. Scalars such as labels and datetimes are small and kept,
+            so functions may still read them without declaring them. Without declared inputs all raw data is kept.
+        """
+        inputs = self.get_inputs(observable)
+        with self.lock:
+            state = self.__getstate__()
+            state["_memo"] = OrderedDict(
+                (key, result) for key, result in self._memo.items() if inputs is not None and key[0] in inputs
+            )
+            state["processed_data"] = dict.fromkeys(self.processed_data)
+            state["processed_cache"] = None
+            state["_source_key"] = None
+
+        data = self.data
+        if inputs is not None and isinstance(data, DataCore):
+            data_state = data.__getstate__()
+            data_state["raw_data"] = {
+                name: entry if name in inputs or not _is_series(entry) else None for name, entry in data.raw_data.items()
+            }
+            data_state["_requested_observables"] = frozenset(
+                name for name, entry in data_state["raw_data"].items() if entry is not None
+            )
+            data = object.__new__(type(data))
+            data.__setstate__(data_state)
+        state["data"] = data
+
+        evaluation_copy = object.__new__(type(self))
+        evaluation_copy.__setstate__(state)
+        # Processing functions bound to this processor would pickle it whole, they are bound to the copy instead
+        evaluation_copy._processing_functions = {
+            name: evaluation_copy._rebind(function) for name, function in self._processing_functions.items()
+        }
+        return evaluation_copy
+
+    def _rebind(self, function: Callable) -> Callable:
+        if isinstance(function, types.MethodType) and isinstance(function.__self__, DataProcessorCore):
+            return types.MethodType(function.__func__, self)
+        if isinstance(function, _DerivedObservable):
+            return _DerivedObservable(self, function.__name__, function.expression, function.units)
+        return function
+
+    def get_memo_stats(self) -> dict:
+        with self.lock:
+            return {"hits": self.memo_hits, "misses": self.memo_misses, "entries": len(self._memo)}
+
+    def get_dependencies(self, observable: str) -> tuple[str, ...] | None:
+        """ Observables declared with `depends_on` for a processed observable, None if undeclared """
+        return getattr(self._processing_functions.get(observable), "depends_on", None)
+
+    def get_evaluation_order(self, *observables: str) -> list[str]:
+        """ Processed observables needed for observables, each listed after its dependencies """
+        order = []
+        visiting = set()
+
+        def visit(observable: str):
+            if observable in order or observable not in self._processing_functions:
+                return
+            if observable in visiting:
+                raise ValueError(f"{self.__class__.__name__} has a dependency cycle through {observable}")
+            visiting.add(observable)
+            for dependency in self.get_dependencies(observable) or ():
+                visit(dependency)
+            visiting.discard(observable)
+            order.append(observable)
+
+        for observable in observables:
+            visit(observable)
+        return order
+
+    def get_dependents(self, *observables: str) -> set[str]:
+        """ Processed observables derived, directly or not, from any of observables """
+        dependents = set()
+        frontier = set(observables)
+        while frontier:
+            frontier = {
+                observable for observable in self._processing_functions
+                if observable not in dependents and frontier.intersection(self.get_dependencies(observable) or ())
+            }
+            dependents |= frontier
+        return dependents
+
+    def invalidate(self, *observables: str) -> set[str]:
+        """
+            Clear the cached results of observables and of everything derived from them, for all
+            arguments, returns the cleared names. Without observables every result is cleared.
+            Call it when the data behind observables changes, results for other arguments stay valid otherwise.
+        """
+        with self.lock:
+            if observables:
+                invalidated = (set(observables) & set(self._processed_observables)) | self.get_dependents(*observables)
+            else:
+                invalidated = set(self._processed_observables)
+
+            for observable in invalidated:
+                self.processed_data[observable] = None
+            for key in [key for key in self._memo if key[0] in invalidated]:
+                del self._memo[key]
+            return invalidated
+
+    @classmethod
+    def get_derived_observables(cls) -> dict[str, tuple[CompiledExpression, str | None]]:
+        """
+            Compiled expressions and their declared units (None to derive them) of the derived observables
+            of this class, from `derived_observables` and the config, the config taking precedence
+        """
+        declarations = {**cls.derived_observables, **get_configured_expressions(cls.__name__)}
+        derived = compile_declarations(declarations, cls.__name__)
+
+        # A derived observable named after a method or a `depends_on` function would replace that processing function
+        provided = {function.provides for _, function in inspect.getmembers(cls, inspect.isfunction)
+                    if hasattr(function, "depends_on")}
+        colliding = sorted(observable for observable in derived if hasattr(cls, observable) or observable in provided)
+        if colliding:
+            raise ValueError(f"Derived observables {colliding} of {cls.__name__} collide with its processing functions")
+        return derived
+
+    def validate_derived_observables(self) -> None:
+        """
+            Check the derived observables once the processing functions of a subclass are registered: they may not
+            shadow raw observables nor be replaced by other processing functions, and may only use known observables
+        """
+        raw_observables = set(self.data.get_allowed_observables())
+        for observable, (expression, _) in self.get_derived_observables().items():
+            if observable in raw_observables:
+                raise ValueError(f"Derived observable {observable} of {self.__class__.__name__} collides with raw data")
+            if not isinstance(self._processing_functions.get(observable), _DerivedObservable):
+                raise ValueError(
+                    f"Derived observable {observable} of {self.__class__.__name__} collides with a processing function"
+                )
+            unknown = [name for name in expression.names
+                       if name not in raw_observables and name not in self._processed_observables]
+            if unknown:
+                raise ValueError(f"{observable} = {expression.expression!r} uses unknown observables {unknown}")
+
+    @classmethod
+    def expand_dependencies(cls, observables) -> frozenset[str]:
+        """ Observables plus all inputs they declare through `depends_on`, resolved without an instance """
+        declared = {observable: expression.names for observable, (expression, _) in cls.get_derived_observables().items()}
+        declared.update({
+            function.provides: function.depends_on
+            for _, function in inspect.getmembers(cls, inspect.isfunction)
+            if hasattr(function, "depends_on")
+        })
+        expanded = set()
+        frontier = set(observables)
+        while frontier:
+            expanded |= frontier
+            frontier = {dependency for observable in frontier for dependency in declared.get(observable, ())} - expanded
+        return frozenset(expanded)
+
+    def _apply_dtype(self, observable: str, result: Observable) -> Observable:
+        dtype = result.get("dtype") or self.observable_dtypes.get(observable)
+        data = as_typed_array(result["data"], dtype)
+        return result if data is result["data"] else {**result, "data": data}
+
     @abstractmethod
     def validate_observables(self, *args, **kwargs) -> None:
         """
@@ -101,8 +578,129 @@ class DataProcessorCore(DataProcessor):
         """
         pass
 
+    def __getstate__(self):
+        # dict_keys views and locks cannot be pickled, remember that the observables follow processed_data instead
+        state = self.__dict__.copy()
+        if isinstance(self._processed_observables, type({}.keys())):
+            state["_processed_observables"] = None
+        state.pop("lock", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self._processed_observables is None:
+            self._processed_observables = self.processed_data.keys()
+        self.lock = threading.RLock()
+
+    @depends_on("datetime")
     def elapsed_time(self, *args, **kwargs) -> Observable:
         # Get a reference timestamp from *args
         reference_datetime = kwargs["experiment_datetime"]
         data_datetime = self.get_data("datetime")
-        return {"units": "$Elapsed ~time ~(hrs)$", "data": data_datetime - reference_datetime}
\ No newline at end of file
+        return {"units": "$Elapsed ~time ~(hrs)$", "data": data_datetime - reference_datetime}
+
+    @depends_on("datetime")
+    def elapsed_hours(self, *args, **kwargs) -> Observable:
+        # Same as elapsed_time but as float hours, see compute_elapsed_hours
+        return self.compute_elapsed_hours([self], *args, **kwargs)[0]
+
+    @classmethod
+    @vectorized("elapsed_hours")
+    def compute_elapsed_hours(cls, processors: list, *args, **kwargs) -> list[Observable]:
+        """
+            Hours between kwargs["experiment_datetime"] and the datetime of every processor,
+            computed as a single datetime64 operation instead of a timedelta per file.
+        """
+        reference_datetime = np.datetime64(kwargs["experiment_datetime"], "us")
+        datetimes = [processor.get_data("datetime") for processor in processors]
+        units = "$Elapsed ~time ~(hrs)$"
+
+        # Files usually carry one datetime each, then all of them fit in one array
+        if not any(isinstance(value, (list, tuple, np.ndarray)) for value in datetimes):
+            hours = (np.array(datetimes, dtype="datetime64[us]") - reference_datetime) / np.timedelta64(1, "h")
+            return [{"units": units, "data": value} for value in hours]
+
+        arrays = [np.asarray(value, dtype="datetime64[us]") for value in datetimes]
+        hours = (np.concatenate([array.ravel() for array in arrays]) - reference_datetime) / np.timedelta64(1, "h")
+        parts = np.split(hours, np.cumsum([array.size for array in arrays])[:-1])
+        return [{"units": units, "data": part.reshape(array.shape)[()]} for part, array in zip(parts, arrays)]
+
+
+@decorate_class_with_logging(log_level=DEBUG_DATA_PROCESSOR)
+class DecimatedProcessor(DataProcessor):
+    """
+       Read-only view of a processor that returns its series downsampled for plotting.
+
+       Overview:
+           Sits between the processors of a worker and a plotter, so traces of
+           millions of points are reduced to about two points per pixel of
+           `width` while keeping their visual shape (see `utils.decimation`).
+
+       - The points to keep are chosen once, on the first request, from every
+         observable in `observables` (default: all raw observables) that holds
+         the longest series, and their union is applied to every series of that
+         length so x and y stay paired. Shorter series and scalars pass through
+         unchanged. Only raw data, results the processor already holds and the
+         requested series are considered, nothing is computed to choose points.
+       - Anything else, e.g. `data`, is taken from the wrapped processor.
+
+       Usage Notes:
+           The wrapped `processor` keeps the full resolution, use it for export.
+    """
+    def __init__(self, processor: DataProcessor, method: str, width: int, observables=None):
+        self.processor = processor
+        self.method = method
+        self.width = width
+        self.observables = observables
+        self._indices = None
+        self._length = None
+
+    def get_data(self, observable: str, *args, **kwargs) -> Any:
+        data = self.processor.get_data(observable, *args, **kwargs)
+        if self._indices is None:
+            self._set_indices(observable, data)
+        if self._length is not None and np.ndim(data) == 1 and len(data) == self._length:
+            return np.asarray(data)[self._indices]
+        return data
+
+    def _set_indices(self, requested: str, requested_data: Any) -> None:
+        observables = self.observables
+        if observables is None:
+            observables = self.processor.data.get_allowed_observables()
+        series = []
+        for observable in sorted(set(observables) | {requested}):
+            value = requested_data if observable == requested else self._get_available(observable)
+            if value is None:
+                continue
+            array = np.asarray(value)
+            if array.ndim == 1 and array.dtype.kind in "biuf":
+                series.append(array)
+
+        self._length = max((len(array) for array in series), default=None)
+        self._indices = np.unique(np.concatenate([
+            decimation_indices(array, self.method, self.width) for array in series if len(array) == self._length
+        ])) if series else np.empty(0, dtype=np.int64)
+
+    def _get_available(self, observable: str) -> Any:
+        # Raw data or results already computed, choosing the points to keep never computes anything
+        data = getattr(self.processor, "data", None)
+        if data is not None and observable in data.get_allowed_observables():
+            try:
+                return data.get_data(observable)
+            except ValueError:
+                # Observables that were not read, e.g. outside the projection of this run
+                return None
+        processed = getattr(self.processor, "processed_data", {}).get(observable)
+        return processed["data"] if processed is not None else None
+
+    def get_units(self, observable: str, *args, **kwargs) -> str:
+        return self.processor.get_units(observable, *args, **kwargs)
+
+    def validate_observables(self, *args, **kwargs) -> None:
+        return self.processor.validate_observables(*args, **kwargs)
+
+    def __getattr__(self, name: str):
+        # Only called for attributes this view does not have itself
+        if name == "processor":
+            raise AttributeError(name)
+        return getattr(self.processor, name)
@@ -2,8 +2,11 @@ from abc import ABC, abstractmethod
 import os
 from utils.custom_datetime import CustomDatetime
 from contracts.observable import Observable
-from contracts.file_readers import FileReaderFn
-from typing import Any
+from contracts.file_readers import FileReaderFn, StreamingFileReaderFn, ReaderOutput
+from typing import Any, Callable
+from utils.chunk_reducers import default_reducer
+from utils.precision import as_typed_array
+from cache_manager.fingerprint import reader_identity
 from utils.logging import DEBUG_DATA_TYPE, decorate_class_with_logging
 
 # Abstract class_utils for all data types
@@ -55,15 +58,26 @@ class DataCore(Data):
         - Leaves `read_file` abstract so subclasses can:
             - call `self.file_reader(filepath)`
             - interpret its output into domain-specific observables.
+        - `export_raw_data` / `restore_raw_data` let callers cache parsed observables.
+        - `_read_file_in_chunks` consumes a `StreamingFileReaderFn`, reducing each
+          key chunk by chunk so peak memory is bounded by the chunk size.
+        - `set_requested_observables` narrows which observables `read_file` has to
+          parse; subclasses check `_is_requested` before parsing a column.
+        - `apply_observable_dtypes` stores numeric observables as typed arrays, using
+          the entry's `dtype`, then `observable_dtypes`, then the compact precision mode.
 
         Usage Notes:
             Subclasses must implement `read_file` and populate `raw_data` / `_allowed_observables`.
             `get_data` raises ValueError for unsupported observables.
     """
     raw_data: dict[str, Observable]
-    def __init__(self, file_reader: FileReaderFn):
+    default_chunk_size = 100_000
+    observable_dtypes: dict[str, str] = {}
+
+    def __init__(self, file_reader: FileReaderFn | StreamingFileReaderFn):
         self.raw_data: dict[str, Observable] = {}
         self._allowed_observables = {}
+        self._requested_observables = None
         self.file_reader = file_reader
 
     @abstractmethod
@@ -71,12 +85,43 @@ class DataCore(Data):
         pass
 
     def _get_datetime_from_filename(self, filepath: str) -> None:
-        datetime = CustomDatetime()
+        datetime = CustomDatetime.shared()
         filename = os.path.basename(filepath)
         self.raw_data['datetime'] = {"units": None, "data": datetime.create_datetime_from_string(filename)}
 
+    def _read_file_in_chunks(self, filepath: str, reducers: dict[str, Callable] = None,
+                             chunk_size: int = None) -> ReaderOutput:
+        """
+            Read a file through a streaming file_reader, folding every key into a reducer.
+
+            `reducers` maps reader keys to factories of objects with `update(chunk)` and
+            `result()` (see utils.chunk_reducers). Keys without a reducer are concatenated,
+            or kept from the first chunk when they are not sequences.
+        """
+        reducers = reducers or {}
+        active_reducers = {}
+        for chunk in self.file_reader(filepath, chunk_size or self.default_chunk_size):
+            for key, value in chunk.items():
+                if key not in active_reducers:
+                    active_reducers[key] = reducers[key]() if key in reducers else default_reducer(value)
+                active_reducers[key].update(value)
+
+        return {key: reducer.result() for key, reducer in active_reducers.items()}
+
+    def set_requested_observables(self, observables) -> None:
+        """ Only parse these observables in read_file, None requests everything """
+        self._requested_observables = frozenset(observables) if observables is not None else None
+
+    def get_requested_observables(self) -> frozenset[str] | None:
+        return self._requested_observables
+
+    def _is_requested(self, observable: str) -> bool:
+        return self._requested_observables is None or observable in self._requested_observables
+
     def get_data(self, observable: str) -> Any:
         if observable in self._allowed_observables:
+            if self.raw_data.get(observable) is None and not self._is_requested(observable):
+                raise ValueError(f"{self.__class__.__name__} did not read {observable} data, it was not requested")
             return self.raw_data[observable]['data']
         else:
             raise ValueError(f"{self.__class__.__name__} does not contain {observable} data")
@@ -87,3 +132,46 @@ class DataCore(Data):
 
     def get_allowed_observables(self):
         return self._allowed_observables
+
+    def apply_observable_dtypes(self, compact: bool = None) -> None:
+        """ Convert numeric raw observables to typed arrays, compact defaults to the application-wide setting """
+        for observable, entry in self.raw_data.items():
+            if entry is None:
+                continue
+            dtype = entry.get("dtype") or self.observable_dtypes.get(observable)
+            data = as_typed_array(entry["data"], dtype, compact)
+            if data is not entry["data"]:
+                self.raw_data[observable] = {**entry, "data": data}
+
+    def get_file_reader_version(self) -> str:
+        """ Identify the file reader, readers may set a `version` attribute that is bumped when parsing changes """
+        return reader_identity(self.file_reader)
+
+    def export_raw_data(self) -> dict:
+        """ Return the parsed observables in a form that can be cached and passed to restore_raw_data """
+        return {
+            "raw_data": dict(self.raw_data),
+            "allowed_observables": list(self._allowed_observables),
+        }
+
+    def restore_raw_data(self, exported: dict) -> None:
+        """ Fill raw_data from an export without overwriting observables set at construction (e.g. labels) """
+        for observable, entry in exported["raw_data"].items():
+            if self.raw_data.get(observable) is None:
+                self.raw_data[observable] = entry
+
+        # Subclasses that declare their observables while reading need them restored as well
+        if not self._allowed_observables:
+            self._allowed_observables = exported["allowed_observables"]
+
+    def __getstate__(self):
+        # dict_keys views cannot be pickled, remember that the observables follow raw_data instead
+        state = self.__dict__.copy()
+        if isinstance(self._allowed_observables, type({}.keys())):
+            state["_allowed_observables"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self._allowed_observables is None:
+            self._allowed_observables = self.raw_data.keys()
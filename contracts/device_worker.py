@@ -1,11 +1,30 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
 from dataset_manager.dataset import DataSet
+from cache_manager import DiskCache, MemoryCache, SharedReader, SidecarReader, content_fingerprint, data_fingerprint, file_fingerprint, full_content_fingerprint
 from PyQt5 import QtCore
+import logging
+import numpy as np
+import os
+import traceback
 import uuid
-from utils.logging import DEBUG_WORKER, decorate_class_with_logging
+from utils.logging import DEBUG_WORKER, ConsoleLogging, decorate_class_with_logging
 from contracts.plotter_options import PlotterOptions
-from contracts.data_types import Data
-from contracts.data_processors import DataProcessor
+from utils.precision import get_compact_precision
+from contracts.data_types import Data, DataCore
+from contracts.data_processors import DataProcessor, DataProcessorCore, DecimatedProcessor, _canonical_args
+from contracts.observable import AggregatedObservable, BatchedObservable
+from utils.aggregation import RunningStatistics
+from utils.batching import AppendableBatch, batch_values, split_batch
+from utils.cancellation import CancellationToken, set_current_token
+from utils.decimation import METHODS as DECIMATION_METHODS
+from utils.errors.errors import RunCancelledError
+from utils.progress import ProgressTracker
+
+
+# Plot width in pixels that decimated traces are sized for unless the "decimation_width" option is set
+DEFAULT_DECIMATION_WIDTH = 2000
 
 
 # This custom metaclass is needed to make ABC and QObject multiple inheritance possible
@@ -37,6 +56,7 @@ class DeviceWorker(ABC, QtCore.QObject, metaclass=WorkerMeta):
 
         - Required methods: set_data, run, set_data_type, set_processor_type.
         - Provides a short `identifier` used for run labelling.
+        - Holds a `cancellation_token`, `cancel` asks a running worker to stop.
 
         Usage Notes:
             Concrete workers should implement thread-safe run logic and emit signals.
@@ -44,6 +64,11 @@ class DeviceWorker(ABC, QtCore.QObject, metaclass=WorkerMeta):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.identifier = str(uuid.uuid4())[:4]
+        self.cancellation_token = CancellationToken()
+
+    def cancel(self):
+        """ Ask the run to stop, safe to call from any thread, the run checks the token at safe points """
+        self.cancellation_token.cancel()
 
     @abstractmethod
     def set_data(self, dataset: DataSet):
@@ -61,6 +86,124 @@ class DeviceWorker(ABC, QtCore.QObject, metaclass=WorkerMeta):
     def set_processor_type(self, processor_type):
         pass
 
+
+def requires_observables(*observables: str):
+    """
+        Declare which observables a plot method needs.
+
+        Files are then read with only these observables requested (see
+        `DataCore.set_requested_observables`) and every processor is validated
+        against them before plotting.
+
+        Usage:
+            @requires_observables("voltage", "current")
+            def plot_iv_curve(self, title: str):
+                ...
+    """
+    def decorator(plot_function):
+        plot_function.required_observables = frozenset(observables)
+        return plot_function
+    return decorator
+
+
+def _read_file(data: Data, filepath: str, sidecar_cache: DiskCache = None, shared_outputs: MemoryCache = None) -> None:
+    """
+        Read a file into data, going through binary sidecars for spreadsheets when a sidecar cache
+        is set and sharing the output of byte-identical files when a shared output cache is set
+    """
+    if (sidecar_cache is None and shared_outputs is None) or not isinstance(data, DataCore) or not isinstance(filepath, str):
+        data.read_file(filepath)
+        return
+
+    file_reader = data.file_reader
+    if sidecar_cache is not None:
+        data.file_reader = SidecarReader(data.file_reader, sidecar_cache)
+    if shared_outputs is not None:
+        data.file_reader = SharedReader(data.file_reader, shared_outputs)
+    try:
+        data.read_file(filepath)
+    finally:
+        data.file_reader = file_reader
+
+
+def _read_data(data_type, label: str, filepath: str, disk_cache: DiskCache = None,
+               requested_observables: frozenset[str] = None, sidecar_cache: DiskCache = None,
+               shared_outputs: MemoryCache = None, compact_precision: bool = False) -> tuple[Data, bool]:
+    """
+        Instantiate a data object and read its file, or restore it from the disk cache.
+
+        Kept at module level so worker processes can pickle it, which is also why
+        the compact precision mode is passed explicitly instead of read from the
+        application-wide setting. Returns the data object and whether it was
+        served from the cache.
+    """
+    data = data_type(label)
+    if requested_observables is not None and isinstance(data, DataCore):
+        data.set_requested_observables(requested_observables)
+
+    # Only DataCore subclasses expose their raw data for caching
+    if disk_cache is None or not isinstance(data, DataCore) or not isinstance(filepath, str):
+        _read_file(data, filepath, sidecar_cache, shared_outputs)
+        if isinstance(data, DataCore):
+            data.apply_observable_dtypes(compact_precision)
+        return data, False
+
+    # Projected reads hold fewer observables and are therefore cached separately
+    key = disk_cache.make_key(
+        *file_fingerprint(filepath),
+        f"{data_type.__module__}.{data_type.__qualname__}",
+        data.get_file_reader_version(),
+        sorted(requested_observables) if requested_observables is not None else None,
+        compact_precision
+    )
+    cached = disk_cache.get(key)
+    if cached is not None:
+        data.restore_raw_data(cached)
+        return data, True
+
+    _read_file(data, filepath, sidecar_cache, shared_outputs)
+    data.apply_observable_dtypes(compact_precision)
+    disk_cache.put(key, data.export_raw_data())
+    return data, False
+
+
+def _cache_data(*args, **kwargs) -> tuple[None, bool]:
+    """ Make sure a file is in the disk cache without sending its data back to the calling process """
+    return None, _read_data(*args, **kwargs)[1]
+
+
+def _read_group(read_function: partial, filepaths: dict, share_outputs: bool = False) -> tuple[dict, int]:
+    """
+        Read several files in one worker process.
+
+        Files with identical contents are grouped so they can share one parse, a
+        process-local cache stands in for the shared output cache of the parent.
+        Returns the read_function results per label and the number of parses saved.
+    """
+    shared_outputs = MemoryCache() if share_outputs else None
+    if shared_outputs is not None:
+        read_function = partial(read_function, shared_outputs=shared_outputs)
+    results = {label: read_function(label, filepath) for label, filepath in filepaths.items()}
+    return results, shared_outputs.hits if shared_outputs is not None else 0
+
+
+def _evaluate_observable(processor: DataProcessorCore, observable: str, args: tuple, kwargs: dict):
+    """ Compute a processed observable in a worker process and send back only its result """
+    processor.get_data(observable, *args, **kwargs)
+    return processor.processed_data[observable]
+
+
+def memory_cache_key(data_type, label: str, filepath: str, requested_observables: frozenset[str] = None) -> tuple:
+    """ Key of a data object in a MemoryCache, the fingerprint makes edited files miss """
+    return (
+        label,
+        *file_fingerprint(filepath),
+        f"{data_type.__module__}.{data_type.__qualname__}",
+        tuple(sorted(requested_observables)) if requested_observables is not None else None,
+        get_compact_precision()
+    )
+
+
 @decorate_class_with_logging(log_level=DEBUG_WORKER)
 class DeviceWorkerCore(DeviceWorker):
     """
@@ -72,14 +215,59 @@ class DeviceWorkerCore(DeviceWorker):
 
         - Manages `device`, `dataset`, `plot_type`, `options`, and `data_processors`.
         - Populates processors per-file and emits `progress`/`finished` signals.
-        - `set_data_type` / `set_processor_type` are simple setters.
+          Progress is weighted by file size and emitted at most every
+          `utils.progress.PROGRESS_INTERVAL` seconds, `progress_status` carries
+          the read throughput (MB/s, files/s) and the estimated time remaining.
+        - `set_data_type` / `set_processor_type` / `set_max_workers` / `set_disk_cache` /
+          `set_sidecar_cache` are simple setters.
+        - Files are read serially by default, or in a process pool when
+          `max_workers` is larger than one.
+        - With a `DiskCache` set, parsed raw data is reused across runs and the
+          hit/miss counts are reported to the console. A `ColumnarStore` hands
+          out memory-mapped arrays instead of copies.
+        - Plot methods decorated with `requires_observables` only have those
+          observables, and the inputs they declare through `depends_on`, read.
+          Processors are validated against them.
+        - With a sidecar cache set, xlsx/xls files are parsed once and later read
+          from binary sidecars until the source file changes.
+        - With a `MemoryCache` set, data objects already loaded (e.g. by the
+          dataset prefetcher) and processors built by earlier runs are reused,
+          including their computed observables. New ones are added to it.
+        - `get_batched_data` returns an observable for all labels as one array,
+          computed in a single call for processors that declare it `vectorized`.
+        - `get_plot_processors` hands plotters downsampled views of the processors
+          when the "decimation" option is set, `data_processors` keep the full
+          resolution for export.
+        - `get_aggregated_data` reduces an observable to its mean, std, min and
+          max across labels in one streaming pass.
+        - `get_elapsed_hours` computes the elapsed time of every label in one
+          datetime64 operation and returns it sorted chronologically.
+        - `get_appended_data` concatenates an observable over all labels and, with
+          a memory cache set, only appends the labels added since the last run.
+        - Processing functions marked `cpu_heavy` that the plot requires are
+          evaluated for all labels in a process pool before plotting, failures
+          are reported per label (see `evaluate_in_parallel`).
+        - With a processed cache set, processors persist their results on disk
+          keyed by a hash of their raw data (see `DataProcessorCore`).
+        - `cancel` stops a run between files or processing steps: data it was
+          still loading is released, nothing is plotted or cached and
+          `cancelled` is emitted before `finished`.
+        - A run that fails is reported to the console and emits `failed` with the
+          error before `finished`, so whatever started it is always told it ended.
+        - With a shared output cache set, byte-identical files (by content hash)
+          are parsed once and their data objects share the parsed arrays. The
+          number of parses saved is reported to the console.
 
         Usage Notes:
             Subclasses provide plotting methods referenced by `plot_type` and may
-            extend run behaviour if needed.
+            extend run behaviour if needed. Parallel reading pickles the data
+            objects, so their `file_reader` must be a module-level callable.
     """
     finished = QtCore.pyqtSignal()
     progress = QtCore.pyqtSignal(int)
+    progress_status = QtCore.pyqtSignal(str)
+    cancelled = QtCore.pyqtSignal()
+    failed = QtCore.pyqtSignal(str)
 
     def __init__(self, device, dataset, plot_type, options: PlotterOptions):
         super().__init__()
@@ -96,6 +284,13 @@ class DeviceWorkerCore(DeviceWorker):
 
         self.processor_type = None
         self.data_type = None
+        self.max_workers = 1
+        self.disk_cache = None
+        self.sidecar_cache = None
+        self.memory_cache = None
+        self.shared_outputs = None
+        self.processed_cache = None
+        self._processor_keys = {}
 
     def set_data_type(self, data_type):
         if not issubclass(data_type, Data):
@@ -107,6 +302,47 @@ class DeviceWorkerCore(DeviceWorker):
             raise TypeError("processor_type must be a subclass of DataProcessor")
         self.processor_type = processor_type
 
+    def set_max_workers(self, max_workers: int):
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError("max_workers must be a positive integer")
+        self.max_workers = max_workers
+
+    def set_disk_cache(self, disk_cache: DiskCache | None):
+        if disk_cache is not None and not isinstance(disk_cache, DiskCache):
+            raise TypeError("disk_cache must be an instance of DiskCache or None")
+        self.disk_cache = disk_cache
+
+    def set_sidecar_cache(self, sidecar_cache: DiskCache | None):
+        if sidecar_cache is not None and not isinstance(sidecar_cache, DiskCache):
+            raise TypeError("sidecar_cache must be an instance of DiskCache or None")
+        self.sidecar_cache = sidecar_cache
+
+    def set_memory_cache(self, memory_cache: MemoryCache | None):
+        if memory_cache is not None and not isinstance(memory_cache, MemoryCache):
+            raise TypeError("memory_cache must be an instance of MemoryCache or None")
+        self.memory_cache = memory_cache
+
+    def set_shared_outputs(self, shared_outputs: MemoryCache | None):
+        if shared_outputs is not None and not isinstance(shared_outputs, MemoryCache):
+            raise TypeError("shared_outputs must be an instance of MemoryCache or None")
+        self.shared_outputs = shared_outputs
+
+    def set_processed_cache(self, processed_cache: DiskCache | None):
+        if processed_cache is not None and not isinstance(processed_cache, DiskCache):
+            raise TypeError("processed_cache must be an instance of DiskCache or None")
+        self.processed_cache = processed_cache
+
+    def get_read_function(self, requested_observables: frozenset[str] = None) -> partial:
+        """ Callable reading (label, filepath) into a data object with the caches configured on this worker """
+        return partial(
+            _read_data, self.data_type,
+            disk_cache=self.disk_cache,
+            requested_observables=requested_observables,
+            sidecar_cache=self.sidecar_cache,
+            shared_outputs=self.shared_outputs,
+            compact_precision=get_compact_precision()
+        )
+
     def set_data(self, dataset: DataSet):
         if not isinstance(dataset, DataSet):
             raise TypeError("dataset must be an instance of DataSet")
@@ -120,26 +356,542 @@ class DeviceWorkerCore(DeviceWorker):
         if colours is not None:
             self.options.add_option(label="colours", value=colours)
 
-        # Progress housekeeping
-        nr_of_files = len(filepaths)
-        counter = 0
-
-        # Read the dataset and instantiate a processor for each file
+        # Reuse processors and data already in memory, then read the rest, in worker processes if allowed
+        required_observables = self.get_required_observables()
+        read_observables = self.get_read_observables()
+        read_function = self.get_read_function(read_observables)
+        processor_hits = self._get_memory_cached_processors(filepaths, read_observables)
+        unprocessed_filepaths = {key: filepaths[key] for key in filepaths if key not in processor_hits}
+        memory_hits, data_keys, reserved_keys, loading_elsewhere = self._get_memory_cached_data(
+            unprocessed_filepaths, read_observables)
+        unread_filepaths = {key: unprocessed_filepaths[key] for key in unprocessed_filepaths
+                            if key not in memory_hits and key not in loading_elsewhere}
+        try:
+            if self.max_workers > 1 and len(unread_filepaths) > 1:
+                data_objects, cache_hits, shared_parses = self._read_files_in_parallel(unread_filepaths, read_function)
+            else:
+                data_objects, cache_hits, shared_parses = self._read_files_serially(unread_filepaths, read_function)
+        except BaseException:
+            for key in reserved_keys:
+                self.memory_cache.release(data_keys[key])
+            raise
+        for key in reserved_keys:
+            self.memory_cache.put(data_keys[key], data_objects[key])
+
+        # Only wait for other runs once this one holds no reservations, so runs never wait on each other
+        awaited_hits, awaited_reads = self._wait_for_memory_cached_data(
+            loading_elsewhere, unprocessed_filepaths, read_function, data_keys)
+        memory_hits.update(awaited_hits)
+        data_objects.update(awaited_reads)
+        data_objects.update(memory_hits)
+
+        # Instantiate the missing processors, labels follow the dataset order regardless of completion order
+        for key in filepaths:
+            self.cancellation_token.raise_if_cancelled()
+            if key in processor_hits:
+                self.data_processors[key] = processor_hits[key]
+            else:
+                self.data_processors[key] = self.processor_type(data_objects[key])
+                if isinstance(self.data_processors[key], DataProcessorCore):
+                    self.data_processors[key].validate_derived_observables()
+                if key in data_keys:
+                    self._processor_keys[key] = self._get_processor_key(data_keys[key])
+            self._set_processed_cache(self.data_processors[key], data_keys.get(key))
+            if required_observables is not None:
+                self.data_processors[key].validate_observables(*required_observables)
+
+        if self.disk_cache is not None:
+            ConsoleLogging().console_print(
+                level=logging.INFO,
+                message=f"(run {self.identifier}) disk cache: {cache_hits} hits, {len(unread_filepaths) - cache_hits} misses"
+            )
+        if self.memory_cache is not None:
+            ConsoleLogging().console_print(
+                level=logging.INFO,
+                message=f"(run {self.identifier}) memory cache: {len(processor_hits)} processors and "
+                        f"{len(memory_hits)} data objects of {len(filepaths)} files reused"
+            )
+        if self.shared_outputs is not None:
+            ConsoleLogging().console_print(
+                level=logging.INFO,
+                message=f"(run {self.identifier}) dedup: {shared_parses} of {len(unread_filepaths)} files read "
+                        f"were identical to a file parsed before"
+            )
+
+    def get_batched_data(self, observable: str, *args, labels: list[str] = None, ragged: str = "padded",
+                         **kwargs) -> BatchedObservable:
+        """
+            Return observable for all (or the given) labels as a single array.
+
+            Equal-length series are stacked into a 2-D array, ragged ones are padded or
+            concatenated with offsets depending on `ragged` (see utils.batching.batch_values).
+            Remaining arguments are passed to the processing function.
+        """
+        labels = list(self.data_processors) if labels is None else list(labels)
+        processors = [self.data_processors[label] for label in labels]
+        self._evaluate_vectorized(observable, processors, *args, **kwargs)
+
+        units = {processor.get_units(observable, *args, **kwargs) for processor in processors}
+        if len(units) > 1:
+            raise ValueError(f"{observable} has different units across labels: {units}")
+
+        values = [processor.get_data(observable, *args, **kwargs) for processor in processors]
+        return {"labels": labels, "units": units.pop() if units else None, **batch_values(values, ragged)}
+
+    def get_plot_processors(self) -> dict:
+        """
+            Processors to pass to `Plotter.ready_plot`.
+
+            With the "decimation" option set to one of utils.decimation.METHODS ("minmax" or "lttb"),
+            every processor is wrapped in a `DecimatedProcessor` that keeps about two points per pixel
+            of "decimation_width" (default `DEFAULT_DECIMATION_WIDTH`). Otherwise, or with "none", the
+            processors are returned as they are.
+        """
+        method = self.options.get_option("decimation")
+        if method in (None, "none"):
+            return self.data_processors
+        if method not in DECIMATION_METHODS:
+            raise ValueError(f"decimation must be 'none' or one of {DECIMATION_METHODS}")
+        width = self.options.get_option("decimation_width") or DEFAULT_DECIMATION_WIDTH
+        observables = self.get_required_observables()
+        return {
+            label: DecimatedProcessor(processor, method, int(width), observables)
+            for label, processor in self.data_processors.items()
+        }
+
+    def get_aggregated_data(self, observable: str, *args, labels: list[str] = None, ddof: int = 0,
+                            **kwargs) -> AggregatedObservable:
+        """
+            Return the point-wise count, mean, standard deviation, minimum and maximum of observable
+            across all (or the given) labels, e.g. to plot mean ± std over many devices.
+
+            Labels are visited one at a time and combined with Welford's algorithm (see
+            utils.aggregation.RunningStatistics), so memory grows with the series length rather than
+            with the number of labels. Series of different lengths are aligned on their first point.
+        """
+        labels = list(self.data_processors) if labels is None else list(labels)
+        statistics = RunningStatistics()
+        units = set()
+        for label in labels:
+            self.cancellation_token.raise_if_cancelled()
+            processor = self.data_processors[label]
+            statistics.update(processor.get_data(observable, *args, **kwargs))
+            units.add(processor.get_units(observable, *args, **kwargs))
+        if len(units) > 1:
+            raise ValueError(f"{observable} has different units across labels: {units}")
+        return {"labels": labels, "units": units.pop() if units else None, **statistics.result(ddof)}
+
+    def get_elapsed_hours(self, labels: list[str] = None, experiment_datetime=None) -> BatchedObservable:
+        """
+            Return the hours elapsed since experiment_datetime (default: the experiment date of the
+            dataset) for all (or the given) labels, sorted chronologically.
+
+            All labels are computed in one datetime64 operation by the `vectorized` elapsed_hours
+            of the processor, after which each processor also holds its own value, e.g.
+            `get_data("elapsed_hours", experiment_datetime=...)`. Labels are ordered by their
+            earliest value, files with a single datetime give a flat sorted array.
+        """
+        if experiment_datetime is None:
+            experiment_datetime = self.options.get_option("experiment_datetime")
+        batched = self.get_batched_data("elapsed_hours", labels=labels, ragged="offsets",
+                                        experiment_datetime=experiment_datetime)
+
+        data, lengths = batched["data"], batched["lengths"]
+        if batched["layout"] == "stacked" and data.ndim == 1:
+            order = np.argsort(data, kind="stable")
+            return {**batched, "labels": [batched["labels"][index] for index in order],
+                    "data": data[order], "lengths": lengths[order]}
+
+        values = split_batch(batched)
+        order = np.argsort([np.min(value) for value in values], kind="stable")
+        return {
+            "labels": [batched["labels"][index] for index in order],
+            "units": batched["units"],
+            **batch_values([values[index] for index in order], ragged="offsets")
+        }
+
+    def get_appended_data(self,observable: str, *args, labels: list[str] = None, **kwargs) -> BatchedObservable:
+        """
+            Return observable for all (or the given) labels concatenated in label order, e.g. an
+            elapsed-time series over a growing dataset, in the "offsets" layout of `get_batched_data`.
+
+            With a memory cache set the concatenation is kept between runs. A later run
+            only computes and appends the labels added since (see `DataSet.refresh_filepaths`),
+            labels whose file changed are recomputed from the first change onwards.
+        """
+        labels = list(self.data_processors) if labels is None else list(labels)
+        source_keys = [self._processor_keys.get(label) for label in labels]
+
+        appended, appended_key = None, None
+        if self.memory_cache is not None:
+            appended_key = (
+                "appended", self.dataset.get_name(),
+                f"{self.processor_type.__module__}.{self.processor_type.__qualname__}",
+                observable, _canonical_args(args, kwargs)
+            )
+            appended = self.memory_cache.get(appended_key, wait=False)
+        if appended is None:
+            appended = AppendableBatch()
+
+        # Jobs running at the same time share the batch through the memory cache
+        with appended.lock:
+            appended.truncate(appended.valid_prefix(labels, source_keys))
+            reused = len(appended.labels)
+
+            for label, source_key in zip(labels[reused:], source_keys[reused:]):
+                self.cancellation_token.raise_if_cancelled()
+                processor = self.data_processors[label]
+                appended.extend(
+                    label, processor.get_data(observable, *args, **kwargs), source_key,
+                    units=processor.get_units(observable, *args, **kwargs)
+                )
+            if appended_key is not None:
+                self.memory_cache.put(appended_key, appended)
+            batched = appended.to_batched()
+
+        if appended_key is not None:
+            ConsoleLogging().console_print(
+                level=logging.INFO,
+                message=f"(run {self.identifier}) {observable}: {reused} labels reused, {len(labels) - reused} appended"
+            )
+        return batched
+
+    def evaluate_in_parallel(self, observable: str, *args, labels: list[str] = None, **kwargs) -> dict[str, Exception]:
+        """
+            Compute a processed observable for all (or the given) labels in up to `max_workers` processes.
+
+            Results are stored in each processor as if get_data computed them. Worker processes
+            receive `DataProcessorCore.get_evaluation_copy`, with only the raw data and results
+            the observable is computed from. Labels that fail are reported to the console and
+            returned with their exception, the others are unaffected.
+        """
+        labels = list(self.data_processors) if labels is None else list(labels)
+        pending = [
+            label for label in labels
+            if isinstance(self.data_processors[label], DataProcessorCore)
+            and not self.data_processors[label].has_result(observable, *args, **kwargs)
+            and not self.data_processors[label].load_persisted(observable, *args, **kwargs)
+        ]
+        errors = {}
+        if self.max_workers > 1 and len(pending) > 1:
+            with ProcessPoolExecutor(max_workers=min(self.max_workers, len(pending))) as executor:
+                futures = {
+                    executor.submit(
+                        _evaluate_observable, self.data_processors[label].get_evaluation_copy(observable),
+                        observable, args, kwargs
+                    ): label
+                    for label in pending
+                }
+                for future in as_completed(futures):
+                    if self.cancellation_token.is_cancelled():
+                        for queued in futures:
+                            queued.cancel()
+                        self.cancellation_token.raise_if_cancelled()
+                    label = futures[future]
+                    try:
+                        self.data_processors[label].store_result(observable, future.result(), *args, **kwargs)
+                    except Exception as exc:
+                        errors[label] = exc
+        else:
+            for label in pending:
+                try:
+                    self.data_processors[label].get_data(observable, *args, **kwargs)
+                except RunCancelledError:
+                    raise
+                except Exception as exc:
+                    errors[label] = exc
+
+        for label, exc in errors.items():
+            ConsoleLogging().console_print(
+                level=logging.WARNING,
+                message=f"(run {self.identifier}) computing {observable} failed for {label}: {exc!r}"
+            )
+        return errors
+
+    def _evaluate_cpu_heavy(self) -> None:
+        # Only observables the plot declared can be computed ahead. Their arguments are unknown until the plot requests
+        #   them, so those whose function may need any are left to the plot
+        required_observables = self.get_required_observables()
+        if not required_observables or not self.data_processors:
+            return
+        processor = next(iter(self.data_processors.values()))
+        if not isinstance(processor, DataProcessorCore):
+            return
+        for observable in processor.get_evaluation_order(*sorted(required_observables)):
+            if processor.is_cpu_heavy(observable) and not processor.needs_arguments(observable):
+                self.evaluate_in_parallel(observable)
+
+    def _evaluate_vectorized(self, observable: str, processors: list, *args, **kwargs) -> None:
+        # Only processors of one DataProcessorCore type can share a vectorized implementation
+        processor_types = {type(processor) for processor in processors}
+        if len(processor_types) != 1 or not issubclass(next(iter(processor_types)), DataProcessorCore):
+            return
+        batch_function = next(iter(processor_types)).get_vectorized(observable)
+        missing = [processor for processor in processors if not processor.has_result(observable, *args, **kwargs)]
+        if batch_function is None or not missing:
+            return
+
+        results = batch_function(missing, *args, **kwargs)
+        if len(results) != len(missing):
+            raise ValueError(f"{batch_function.__name__} returned {len(results)} results for {len(missing)} processors")
+        for processor, result in zip(missing, results):
+            processor.store_result(observable, result, *args, **kwargs)
+
+    def _set_processed_cache(self, processor: DataProcessor, data_key: tuple = None) -> None:
+        """
+            Key the processed cache of processor on its parsed data rather than paths, so machines
+            sharing the cache directory share results.
+
+            Hashing the raw data costs a pass over all of it (and pages in memory mapped columns),
+            so with a memory cache the key is remembered next to the data object under data_key,
+            which changes whenever the file does.
+        """
+        if not isinstance(processor, DataProcessorCore):
+            return
+        if self.processed_cache is None or not isinstance(processor.data, DataCore):
+            processor.set_processed_cache(None)
+            return
+        if processor.processed_cache is self.processed_cache and processor.get_source_key() is not None:
+            # Processors reused from the memory cache were keyed by an earlier run
+            return
+
+        reader_version = processor.data.get_file_reader_version()
+        memo_key = (*data_key, "source_key", reader_version) if data_key is not None else None
+        source_key = self.memory_cache.get(memo_key, wait=False) if memo_key is not None else None
+        if source_key is None:
+            # Hashes all raw data, including observables taken from the filename, not only sampled file contents
+            source_key = (
+                data_fingerprint(processor.data.raw_data),
+                f"{type(processor.data).__module__}.{type(processor.data).__qualname__}",
+                reader_version,
+                get_compact_precision()
+            )
+            if memo_key is not None:
+                self.memory_cache.put(memo_key, source_key, parent=data_key)
+        processor.set_processed_cache(self.processed_cache, source_key)
+
+    def get_required_observables(self) -> frozenset[str] | None:
+        """ Observables declared by the selected plot method through `requires_observables`, None if undeclared """
+        plot_function = getattr(self, self.plot_type, None) if self.plot_type else None
+        return getattr(plot_function, "required_observables", None)
+
+    def get_read_observables(self) -> frozenset[str] | None:
+        """ Required observables plus the inputs their processing functions declare through `depends_on` """
+        required_observables = self.get_required_observables()
+        if required_observables is None or not issubclass(self.processor_type, DataProcessorCore):
+            return required_observables
+        return self.processor_type.expand_dependencies(required_observables)
+
+    def _get_processor_key(self, data_key: tuple) -> tuple:
+        # Processors memoise their results per argument, so one processor serves every dataset holding the file
+        return (*data_key, f"{self.processor_type.__module__}.{self.processor_type.__qualname__}")
+
+    def _get_memory_cached_processors(self, filepaths: dict, requested_observables: frozenset[str] | None) -> dict:
+        """ Return the processors of earlier runs found in the memory cache, a processor of a full read serves any projection """
+        processor_hits = {}
+        self._processor_keys = {}
+        if self.memory_cache is None:
+            return processor_hits
+
+        for key, filepath in filepaths.items():
+            if not isinstance(filepath, str):
+                continue
+
+            data_keys = [memory_cache_key(self.data_type, key, filepath)]
+            if requested_observables is not None:
+                data_keys.append(memory_cache_key(self.data_type, key, filepath, requested_observables))
+            for data_key in data_keys:
+                processor_key = self._get_processor_key(data_key)
+                processor = self.memory_cache.get(processor_key, wait=False)
+                if processor is not None:
+                    processor_hits[key] = processor
+                    self._processor_keys[key] = processor_key
+                    break
+        return processor_hits
+
+    def _get_memory_cached_data(self, filepaths: dict, requested_observables: frozenset[str] | None) -> tuple[dict, dict, set, dict]:
+        """
+            Look up data objects in the memory cache without waiting.
+
+            Returns the data objects found, the memory key of every file (where its
+            data is or will be cached), the files reserved for this run to store and
+            the files another run is loading, with the key to wait for.
+        """
+        memory_hits = {}
+        data_keys = {}
+        reserved_keys = set()
+        loading_elsewhere = {}
+        if self.memory_cache is None:
+            return memory_hits, data_keys, reserved_keys, loading_elsewhere
+
+        for key, filepath in filepaths.items():
+            if not isinstance(filepath, str):
+                continue
+
+            # A full read also serves any projection
+            full_key = memory_cache_key(self.data_type, key, filepath)
+            memory_key = memory_cache_key(self.data_type, key, filepath, requested_observables)
+            data = self.memory_cache.get(full_key, wait=False)
+            if data is not None:
+                memory_hits[key] = data
+                data_keys[key] = full_key
+                continue
+            if self.memory_cache.is_pending(full_key):
+                # Still being prefetched
+                loading_elsewhere[key] = data_keys[key] = full_key
+                continue
+
+            data_keys[key] = memory_key
+            data = self.memory_cache.get(memory_key, wait=False) if requested_observables is not None else None
+            if data is not None:
+                memory_hits[key] = data
+            elif self.memory_cache.reserve(memory_key):
+                reserved_keys.add(key)
+            else:
+                loading_elsewhere[key] = memory_key
+        return memory_hits, data_keys, reserved_keys, loading_elsewhere
+
+    def _wait_for_memory_cached_data(self, loading_elsewhere: dict, filepaths: dict, read_function: partial,
+                                     data_keys: dict) -> tuple[dict, dict]:
+        """
+            Wait for the data objects other runs are loading.
+
+            Must only be called once this run has stored or released its own reservations,
+            otherwise two runs can wait on each other. Files whose load failed or was
+            cancelled elsewhere are read here instead and not cached. Returns the data
+            objects received and those read.
+        """
+        memory_hits = {}
+        data_objects = {}
+        for key, data_key in loading_elsewhere.items():
+            data = self.memory_cache.get(data_key, is_cancelled=self.cancellation_token.is_cancelled)
+            self.cancellation_token.raise_if_cancelled()
+            if data is not None:
+                memory_hits[key] = data
+                continue
+
+            del data_keys[key]
+            data_objects[key], _ = read_function(key, filepaths[key])
+        return memory_hits, data_objects
+
+    def update_memory_cache(self) -> None:
+        """ Store this run's processors, with the observables they computed, in the memory cache """
+        if self.memory_cache is None:
+            return
+        for key, processor_key in self._processor_keys.items():
+            # Processor keys extend the key of their data object, which is accounted for under its own key.
+            #   The processor keeps that data alive, so it is evicted with it.
+            #   Its lock keeps other runs sharing it from adding results while its size is estimated
+            processor = self.data_processors[key]
+            with processor.lock:
+                self.memory_cache.put(processor_key, processor, parent=processor_key[:-1])
+
+    def _read_files_serially(self, filepaths: dict, read_function: partial) -> tuple[dict, int, int]:
+        data_objects = {}
+        cache_hits = 0
+        shared_before = self.shared_outputs.hits if self.shared_outputs is not None else 0
+        tracker = ProgressTracker.from_filepaths(filepaths)
         for key in filepaths:
-            data = self.data_type(key)
-            data.read_file(filepaths[key])
-            self.data_processors[key] = self.processor_type(data)
+            self.cancellation_token.raise_if_cancelled()
+            data_objects[key], cache_hit = read_function(key, filepaths[key])
+            cache_hits += cache_hit
 
             # Emit progress signal
-            counter += 1
-            self.progress.emit(int(100*counter/nr_of_files))
+            if tracker.advance(key):
+                self._emit_progress(tracker)
+        shared_parses = self.shared_outputs.hits - shared_before if self.shared_outputs is not None else 0
+        return data_objects, cache_hits, shared_parses
+
+    def _emit_progress(self, tracker: ProgressTracker) -> None:
+        self.progress.emit(tracker.get_progress())
+        self.progress_status.emit(tracker.get_status())
+
+    def _group_by_content(self, filepaths: dict) -> list[dict]:
+        """ Split filepaths into groups of byte-identical files, anything that is not a file gets its own group """
+        candidates = {}
+        for key, filepath in filepaths.items():
+            is_file = isinstance(filepath, str) and os.path.isfile(filepath)
+            group_key = content_fingerprint(filepath) if is_file else key
+            candidates.setdefault(group_key, {})[key] = filepath
+
+        # Sampled hashes only find candidates, files sharing one are only grouped if all their contents match
+        groups = []
+        for group in candidates.values():
+            if len(group) == 1:
+                groups.append(group)
+                continue
+            confirmed = {}
+            for key, filepath in group.items():
+                confirmed.setdefault(full_content_fingerprint(filepath), {})[key] = filepath
+            groups.extend(confirmed.values())
+        return groups
+
+    def _read_files_in_parallel(self, filepaths: dict, read_function: partial) -> tuple[dict, int, int]:
+        data_objects = {}
+        cache_hits = 0
+        shared_parses = 0
+        tracker = ProgressTracker.from_filepaths(filepaths)
+        # Memory-mapped data would be copied when sent back, so workers only fill the cache in that case
+        shares_memory = self.disk_cache is not None and self.disk_cache.shares_memory
+        pool_function = partial(_cache_data, *read_function.args, **read_function.keywords) if shares_memory else read_function
+
+        # The shared output cache stays in this process, identical files are read together so they still share a parse
+        share_outputs = self.shared_outputs is not None
+        pool_function = partial(pool_function, shared_outputs=None)
+        groups = self._group_by_content(filepaths) if share_outputs else [{key: filepaths[key]} for key in filepaths]
+
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(groups))) as executor:
+            futures = [executor.submit(_read_group, pool_function, group, share_outputs) for group in groups]
+
+            # Collect the files as they complete and report progress on each of them
+            for future in as_completed(futures):
+                if self.cancellation_token.is_cancelled():
+                    # Files already being read finish, the others never start
+                    for queued in futures:
+                        queued.cancel()
+                    self.cancellation_token.raise_if_cancelled()
+                results, group_shared_parses = future.result()
+                shared_parses += group_shared_parses
+                for key, (data, cache_hit) in results.items():
+                    data_objects[key] = data
+                    cache_hits += cache_hit
+                if tracker.advance(*results):
+                    self._emit_progress(tracker)
+
+        if shares_memory:
+            for key in filepaths:
+                data_objects[key], _ = read_function(key, filepaths[key])
+        return data_objects, cache_hits, shared_parses
 
     def run(self):
-        # Set the data
-        self.set_data(self.dataset)
-
-        # Grab the correct plot and execute it, including uuid in the title
-        title = f"{self.dataset.get_name()} (run {self.identifier})"
-        plot_type = getattr(self, self.plot_type)
-        plot_type(title=title)
-        self.finished.emit()
+        # Processing functions running on this thread check the token of this run
+        set_current_token(self.cancellation_token)
+        try:
+            # Set the data
+            self.set_data(self.dataset)
+            self._evaluate_cpu_heavy()
+            self.cancellation_token.raise_if_cancelled()
+
+            # Grab the correct plot and execute it, including uuid in the title
+            title = f"{self.dataset.get_name()} (run {self.identifier})"
+            plot_type = getattr(self, self.plot_type)
+            plot_type(title=title)
+            self.update_memory_cache()
+        except RunCancelledError:
+            # Drop everything this run loaded, entries other runs stored in the memory cache stay
+            self.data_processors = None
+            self._processor_keys = {}
+            ConsoleLogging().console_print(level=logging.INFO, message=f"(run {self.identifier}) cancelled")
+            self.cancelled.emit()
+        except Exception as exc:
+            # Raising out of a Qt slot would abort the application, the error is reported instead
+            self.data_processors = None
+            self._processor_keys = {}
+            ConsoleLogging().console_print(
+                level=logging.ERROR,
+                message=f"(run {self.identifier}) failed: {exc!r}\n{traceback.format_exc()}"
+            )
+            self.failed.emit(repr(exc))
+        finally:
+            set_current_token(None)
+            self.finished.emit()
@@ -12,13 +12,25 @@ Responsibilities:
     - Return structured raw data as a mapping of semantic keys
       (e.g. "x_axis", "y_axis", "current", "meta") to Python objects.
     - Perform no higher-level processing or conversion to observables.
+
+A *streaming file reader* is any callable matching `StreamingFileReaderFn`:
+    (path: str, chunk_size: int) -> Iterator[ReaderOutput]
+
+Responsibilities:
+    - Yield consecutive chunks of at most `chunk_size` rows, each chunk using
+      the same keys a regular reader would return for the whole file.
+    - Never hold more than one chunk in memory, so very large files can be
+      decimated or aggregated while reading (see `DataCore._read_file_in_chunks`).
 """
 
-from typing import Any, Mapping, Callable, TypeAlias
+from typing import Any, Mapping, Callable, Iterator, TypeAlias
 
 # Every reader returns a mapping from string keys to "data blobs"
 # A blob can be: list/array, dict, scalar, whatever the Data class expects.
 ReaderOutput: TypeAlias = Mapping[str, Any]
 
 # Contract for reader functions
-FileReaderFn: TypeAlias = Callable[[str], ReaderOutput]
\ No newline at end of file
+FileReaderFn: TypeAlias = Callable[[str], ReaderOutput]
+
+# Contract for reader functions that yield a file chunk by chunk
+StreamingFileReaderFn: TypeAlias = Callable[[str, int], Iterator[ReaderOutput]]
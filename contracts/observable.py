@@ -9,11 +9,54 @@ An Observable bundles a payload together with its display units:
 
 - ``units``: Human-readable unit string, or ``None`` for unitless data.
 - ``data``: The underlying payload (e.g. list, array, scalar, etc.).
+- ``dtype``: Optional NumPy dtype (e.g. ``"float32"``) numeric data is stored
+  as, see `utils.precision.as_typed_array`.
+
+A BatchedObservable holds one observable for several labels at once, as
+returned by `DeviceWorkerCore.get_batched_data`:
+
+- ``labels``: Labels in the order of the first axis of ``data``.
+- ``layout``: ``"stacked"``, ``"padded"`` or ``"offsets"``, see `utils.batching.batch_values`.
+- ``lengths`` / ``offsets``: Points per label, and series starts for the offsets layout.
+
+An AggregatedObservable holds point-wise statistics of one observable across
+labels, as returned by `DeviceWorkerCore.get_aggregated_data`:
+
+- ``labels`` / ``units``: Labels that were aggregated and their common units.
+- ``count``: Number of labels contributing to every point.
+- ``mean`` / ``std`` / ``min`` / ``max``: Statistics per point, NaN where no label contributes.
 """
 
 from typing import TypedDict, Any
+import numpy as np
+
+
+class _ObservableOptions(TypedDict, total=False):
+    dtype: str | None
+
 
 # Contract for items to use in data dictionaries
-class Observable(TypedDict):
+class Observable(_ObservableOptions):
     units: str | None
     data: Any
+
+
+# Contract for one observable across several labels
+class BatchedObservable(TypedDict):
+    labels: list[str]
+    units: str | None
+    layout: str
+    data: np.ndarray
+    lengths: np.ndarray
+    offsets: np.ndarray | None
+
+
+# Contract for point-wise statistics of one observable across several labels
+class AggregatedObservable(TypedDict):
+    labels: list[str]
+    units: str | None
+    count: np.ndarray
+    mean: np.ndarray
+    std: np.ndarray
+    min: np.ndarray
+    max: np.ndarray
@@ -20,7 +20,8 @@ class DataSet:
         The class does *not* interpret the contents of the files; it only tracks their
         locations and minimal metadata. Filepaths can be:
         - Added manually via `add_filepath`, or
-        - Auto-populated from a root directory using `construct_filepaths(...)`.
+        - Auto-populated from a root directory using `construct_filepaths(...)`, and
+        - Extended with files that appeared since using `refresh_filepaths()`.
 
         Structure types
         ----------------
@@ -160,6 +161,32 @@ class DataSet:
 
         return errors
 
+    def refresh_filepaths(self, root_dir: str = None) -> list[str]:
+        """
+        Will add the files that appeared since the dataset was constructed, for growing flat datasets. Scans
+            root_dir, or every directory already holding a file of the dataset, and appends new files in natural
+            order after the existing ones. Files already in the dataset (by path or label) are left alone.
+            Returns the labels that were added.
+        """
+        if self.get_structure_type() != "flat":
+            raise ValueError("Only flat datasets can be refreshed")
+
+        known_paths = set(self.filepaths.values())
+        root_dirs = [root_dir] if root_dir is not None else list(dict.fromkeys(
+            os.path.dirname(path) for path in self.filepaths.values() if isinstance(path, str)
+        ))
+        new_labels = []
+        for directory in root_dirs:
+            for item in natsort.natsorted(os.listdir(directory)):
+                path = f"{directory}/{item}"
+                label = Path(path).stem
+                if path in known_paths or label in self.filepaths.keys():
+                    continue
+                if self._check_valid_path(path)[0]:
+                    self.add_filepath(path=path, label=label)
+                    new_labels.append(label)
+        return new_labels
+
     def construct_filepaths_recursive(self, root_dir) -> str:
         raise NotImplementedError
 
@@ -1,5 +1,6 @@
-from PyQt5 import QtWidgets, QtCore
+from PyQt5 import QtWidgets
 from gui.utils.get_qwidget_value import get_qwidget_value
+from gui.utils.configure_worker import configure_worker
 from implementations.utils import constants
 import datetime
 import dataset_manager
@@ -24,11 +25,12 @@ def plot_manager(window, *args, **kwargs):
            `implementations.devices.workers` namespace.
         5. Configure the worker with the reduced dataset, selected plot function,
            and options.
-        6. Move the worker to a `QThread`, wire up progress/finished signals, and
-           start the thread.
+        6. Submit the worker to the window's `JobScheduler`, which runs it in its
+           own `QThread` alongside up to `max_plot_jobs - 1` other runs and
+           reports its progress in the job queue view.
 
         The function logs a concise summary of the run (including a short run
-        identifier) to the GUI console once the worker is started.
+        identifier) to the GUI console once the worker is queued.
 
         Parameters
         ----------
@@ -70,6 +72,12 @@ def plot_manager(window, *args, **kwargs):
     options.add_option(label="presentation", value=get_qwidget_value(window.presentationCheckBox))
     options.add_option(label="legend_title", value=get_qwidget_value(window.legendTitleLineEdit))
 
+    # Downsampling of long traces, unless the device widget chose its own
+    if not options.has_options("decimation"):
+        options.add_option(label="decimation", value=window.config.get("decimation", "none"))
+    if not options.has_options("decimation_width"):
+        options.add_option(label="decimation_width", value=window.config.get("decimation_width", 2000))
+
     # Instantiate proper device class and set the data
     current_device_class = window.dataset.get_device()
     device_module = getattr(implementations.devices.workers, current_device_class.lower())
@@ -78,28 +86,9 @@ def plot_manager(window, *args, **kwargs):
     # # Grab the correct plotting function and pass all options to it
     plot_function = window.get_current_plot_function()
 
-    # Create a new thread for the device class to run in
-    window.thread = QtCore.QThread()
-    window.device_worker = device(current_device_class, dataset_selection, plot_function, options=options)
-    window.device_worker.moveToThread(window.thread)
-
-    # Connect signals and slots for the worker thread
-    window.thread.started.connect(window.device_worker.run)
-
-    # When the worker says "I'm done", stop the thread and schedule the worker for deletion
-    window.device_worker.finished.connect(window.thread.quit)
-    window.device_worker.finished.connect(window.device_worker.deleteLater)
-
-    # When the thread is actually finished, clean up and reset GUI
-    window.thread.finished.connect(window.thread.deleteLater)
-    window.thread.finished.connect(window.on_plot_thread_finished)
-
-    # Progress updates
-    window.device_worker.progress.connect(window.report_progress)
-
-    # Start the thread
-    window.thread.start()
+    # Queue the run, the scheduler starts it in its own thread as soon as fewer than max_plot_jobs are running
+    device_worker = device(current_device_class, dataset_selection, plot_function, options=options)
+    configure_worker(window, device_worker)
+    window.job_scheduler.submit(device_worker, f"{current_device_class}-{plot_function} plot for {window.get_dataset_name()}")
     window.console_print(
-        f"(run {window.device_worker.identifier}) producing {current_device_class}-{plot_function} plot for {window.get_dataset_name()} with options {options}")
-
-    window.plotBtn.setEnabled(False)
+        f"(run {device_worker.identifier}) producing {current_device_class}-{plot_function} plot for {window.get_dataset_name()} with options {options}")
@@ -8,7 +8,7 @@ def clear_all(window: QtWidgets.QMainWindow):
 
     This helper:
     - Clears the active `DataSet` and GUI fields via `clear_data`.
-    - Empties the console widget.
+    - Empties the console widget and the memory cache of data and processors.
     - Writes a confirmation message to the GUI console.
 
     Parameters
@@ -18,4 +18,7 @@ def clear_all(window: QtWidgets.QMainWindow):
     """
     clear_data(window)
     window.consoleTextEdit.clear()
+    window.memory_cache.clear()
+    if window.shared_outputs is not None:
+        window.shared_outputs.clear()
     window.console_print("Cleared memory")
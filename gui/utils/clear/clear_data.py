@@ -1,4 +1,5 @@
 from PyQt5 import QtWidgets
+from gui.utils.dataset_tools.prefetch_dataset import cancel_prefetch
 
 
 def clear_data(window: QtWidgets.QMainWindow):
@@ -9,6 +10,7 @@ def clear_data(window: QtWidgets.QMainWindow):
     - Stored `DataSet` object and its disk location.
     - Set name, device name, notes, and list widgets.
     - Plot type combobox and stacked widget view.
+    - Any prefetch still running for the dataset.
 
     A console message is printed to confirm completion.
 
@@ -17,6 +19,7 @@ def clear_data(window: QtWidgets.QMainWindow):
     window : QMainWindow
         Main GUI instance that holds dataset-related widgets.
     """
+    cancel_prefetch(window)
     window.dataset = None
     window.dataset_location = None
 
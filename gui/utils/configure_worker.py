@@ -0,0 +1,59 @@
+from PyQt5 import QtWidgets
+from cache_manager import DiskCache, ColumnarStore
+from contracts.device_worker import DeviceWorkerCore
+
+
+def create_disk_caches(config: dict) -> tuple[DiskCache | None, DiskCache | None, DiskCache | None]:
+    """
+    Create the disk caches set in the config, once per window.
+
+    Workers share these instances, so the size index of every cache is built
+    once and processors reused between runs keep their processed cache.
+
+    Parameters
+    ----------
+    config : dict
+        Application config (`disk_cache_dir`, `disk_cache_size_mb`, `disk_cache_format`,
+        `excel_sidecar_dir`, `excel_sidecar_size_mb`, `processed_cache_dir`, `processed_cache_size_mb`).
+
+    Returns
+    -------
+    tuple
+        The data, spreadsheet sidecar and processed caches, None for those that are not configured.
+    """
+    disk_cache = sidecar_cache = processed_cache = None
+    if config.get("disk_cache_dir"):
+        # The columnar format memory maps array observables instead of unpickling them
+        cache_class = ColumnarStore if config.get("disk_cache_format") == "columnar" else DiskCache
+        disk_cache = cache_class(config["disk_cache_dir"], config.get("disk_cache_size_mb", 1024))
+    if config.get("excel_sidecar_dir"):
+        sidecar_cache = DiskCache(config["excel_sidecar_dir"], config.get("excel_sidecar_size_mb", 1024))
+    if config.get("processed_cache_dir"):
+        processed_cache = DiskCache(config["processed_cache_dir"], config.get("processed_cache_size_mb", 1024))
+    return disk_cache, sidecar_cache, processed_cache
+
+
+def configure_worker(window: QtWidgets.QMainWindow, worker: DeviceWorkerCore):
+    """
+    Apply the ingestion settings from the window config to a device worker.
+
+    Sets:
+    - The number of worker processes (`ingestion_workers`).
+    - The window-wide disk cache, spreadsheet sidecar cache and persistent cache of
+      processed observables, see `create_disk_caches`.
+    - The window-wide memory cache shared with the dataset prefetcher.
+    - The window-wide cache of parsed outputs used to deduplicate identical files.
+
+    Parameters
+    ----------
+    window : QMainWindow
+        Main application window holding the config and the caches.
+    worker : DeviceWorkerCore
+        Worker to configure, before it reads any data.
+    """
+    worker.set_max_workers(window.config.get("ingestion_workers", 1))
+    worker.set_disk_cache(window.disk_cache)
+    worker.set_sidecar_cache(window.sidecar_cache)
+    worker.set_processed_cache(window.processed_cache)
+    worker.set_memory_cache(window.memory_cache)
+    worker.set_shared_outputs(window.shared_outputs)
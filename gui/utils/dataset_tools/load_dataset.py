@@ -1,6 +1,7 @@
 from PyQt5 import QtWidgets
 from utils.errors.errors import IncompatibleDeviceTypeFound
 from gui.utils.clear.clear_data import clear_data
+from gui.utils.dataset_tools.prefetch_dataset import cancel_prefetch, start_prefetch
 from utils.logging import with_logging
 import json
 import dataset_manager
@@ -70,6 +71,7 @@ def load_dataset(window: QtWidgets.QMainWindow):
     - Adds all dataset labels to the file selection list.
     - Selects all items by default.
     - Populates the plot-type combobox with device-appropriate plotting functions.
+    - Starts prefetching the dataset files in the background when enabled.
 
     Raises
     ------
@@ -100,3 +102,40 @@ def load_dataset(window: QtWidgets.QMainWindow):
         raise IncompatibleDeviceTypeFound
 
     window.console_print("DataSet loaded")
+    window.prefetcher = start_prefetch(window, window.dataset)
+
+
+@with_logging
+def refresh_dataset(window: QtWidgets.QMainWindow, *args, **kwargs):
+    """
+    Add the files that appeared since the current dataset was opened, for experiments that keep writing files.
+
+    Behaviour:
+    - Adds new files next to the existing ones via `DataSet.refresh_filepaths`.
+    - Appends their labels to the file selection list and selects them.
+    - Prefetches them when enabled, files already in memory are not read again.
+
+    The next plot run reuses the processors of the files it has seen before, so
+    only the new files are read and processed (see `DeviceWorkerCore.get_appended_data`).
+
+    Parameters
+    ----------
+    window : QMainWindow
+        GUI window containing the active dataset.
+    """
+    if window.get_dataset_name() is None:
+        return window.console_print("Err: Must first load dataset", level="warning")
+
+    try:
+        new_labels = window.dataset.refresh_filepaths()
+    except ValueError as error:
+        return window.console_print(f"Err: {error}", level="warning")
+
+    for label in new_labels:
+        window.selectedFilesList.addItem(label)
+        window.selectedFilesList.item(window.selectedFilesList.count() - 1).setSelected(True)
+    window.console_print(f"DataSet refreshed, {len(new_labels)} new files")
+
+    if new_labels:
+        cancel_prefetch(window)
+        window.prefetcher = start_prefetch(window, window.dataset)
@@ -0,0 +1,122 @@
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import threading
+import implementations.devices
+from cache_manager import MemoryCache
+from contracts.device_worker import memory_cache_key
+from contracts.plotter_options import PlotterOptions
+from dataset_manager.dataset import DataSet
+from gui.utils.configure_worker import configure_worker
+from utils.logging import DEBUG, ConsoleLogging, decorate_class_with_logging
+
+
+@decorate_class_with_logging(log_level=DEBUG)
+class DatasetPrefetcher:
+    """
+    Parse the files of a dataset in background threads ahead of the first plot.
+
+    Overview:
+        Reads every file with the same data type and caches as a plot run would,
+        and stores the data objects in a shared `MemoryCache`. A plot started
+        while files are still loading waits for those files instead of reading
+        them a second time.
+
+    - Files are claimed with `MemoryCache.reserve`, files that are already
+      cached or being loaded elsewhere are skipped.
+    - `cancel` stops queued files from starting and releases their reservations;
+      files that are already being parsed finish in the background.
+
+    Usage Notes:
+        Only full reads are prefetched, plot runs that request fewer observables
+        are served from them as well.
+    """
+    def __init__(self, read_function, data_type, memory_cache: MemoryCache, max_workers: int):
+        self.read_function = read_function
+        self.data_type = data_type
+        self.memory_cache = memory_cache
+        self.max_workers = max_workers
+
+        self._cancelled = threading.Event()
+        self._executor = None
+        self._remaining = 0
+        self._lock = threading.Lock()
+
+    def start(self, filepaths: dict) -> None:
+        # Directories and other non-file sources are left to the plot run
+        reserved = {}
+        for label, filepath in filepaths.items():
+            if not isinstance(filepath, str):
+                continue
+            memory_key = memory_cache_key(self.data_type, label, filepath)
+            if self.memory_cache.reserve(memory_key):
+                reserved[label] = (filepath, memory_key)
+
+        if not reserved:
+            return
+        self._remaining = len(reserved)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="prefetch")
+        for label, (filepath, memory_key) in reserved.items():
+            self._executor.submit(self._prefetch_file, label, filepath, memory_key)
+        self._executor.shutdown(wait=False)
+
+    def _prefetch_file(self, label: str, filepath: str, memory_key: tuple) -> None:
+        try:
+            if self._cancelled.is_set():
+                self.memory_cache.release(memory_key)
+                return
+            data, _ = self.read_function(label, filepath)
+            self.memory_cache.put(memory_key, data)
+        except Exception as exc:
+            # The plot run reads the file again and reports the error where it matters
+            self.memory_cache.release(memory_key)
+            ConsoleLogging().console_print(level=logging.DEBUG, message=f"Prefetching {label} failed: {exc}")
+        finally:
+            self._file_done()
+
+    def _file_done(self) -> None:
+        with self._lock:
+            self._remaining -= 1
+            done = self._remaining == 0
+        if done and not self._cancelled.is_set():
+            ConsoleLogging().console_print(level=logging.INFO, message="DataSet prefetched")
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+
+def start_prefetch(window, dataset: DataSet) -> DatasetPrefetcher | None:
+    """
+    Start prefetching all files of a freshly opened dataset into the window's memory cache.
+
+    Disabled unless `prefetch_workers` is set to a positive number in the config.
+
+    Parameters
+    ----------
+    window : QMainWindow
+        Main application window holding the config and the memory cache.
+    dataset : DataSet
+        Dataset whose files should be parsed.
+    """
+    max_workers = window.config.get("prefetch_workers", 0)
+    if not max_workers:
+        return None
+
+    # A worker that never runs provides the data type and the configured read function
+    device_name = dataset.get_device()
+    device_module = getattr(implementations.devices.workers, device_name.lower())
+    worker = getattr(device_module, device_name)(device_name, dataset, None, options=PlotterOptions())
+    configure_worker(window, worker)
+
+    prefetcher = DatasetPrefetcher(worker.get_read_function(), worker.data_type, window.memory_cache, max_workers)
+    prefetcher.start(dataset.get_filepaths())
+    return prefetcher
+
+
+def cancel_prefetch(window) -> None:
+    """ Cancel any prefetch that is still running for the previously opened dataset """
+    if getattr(window, "prefetcher", None) is not None:
+        window.prefetcher.cancel()
+        window.prefetcher = None
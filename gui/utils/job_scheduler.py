@@ -0,0 +1,194 @@
+from collections import deque
+from PyQt5 import QtCore
+from contracts.device_worker import DeviceWorker
+from utils.logging import DEBUG, decorate_class_with_logging
+
+
+@decorate_class_with_logging(log_level=DEBUG)
+class PlotJob(QtCore.QObject):
+    """
+    One plot run of a device worker, tracked by the `JobScheduler`.
+
+    Overview:
+        Lives in the GUI thread and receives the progress of its worker, so
+        every job reports its own progress while several run at once.
+
+    - `status` is "queued", "running", "cancelling", "cancelled", "failed" or "finished".
+    - `error` holds the error of a failed worker.
+    - `updated` is emitted whenever the status or progress changes, `finished`
+      with the job once its thread has stopped.
+    - `progress_status` holds the latest throughput and ETA reported by the
+      worker while it reads files.
+    """
+    updated = QtCore.pyqtSignal()
+    finished = QtCore.pyqtSignal(object)
+
+    def __init__(self, worker: DeviceWorker, description: str):
+        super().__init__()
+        self.worker = worker
+        self.thread = None
+        self.identifier = worker.identifier
+        self.description = description
+        self.status = "queued"
+        self.progress = 0
+        self.progress_status = ""
+        self.error = None
+        self._cancelled = False
+
+    def start(self) -> None:
+        self.thread = QtCore.QThread()
+        self.worker.moveToThread(self.thread)
+        self.thread.started.connect(self.worker.run)
+
+        # When the worker is done stop its thread, both are deleted once the thread has finished
+        self.worker.finished.connect(self.thread.quit)
+        self.worker.finished.connect(self.worker.deleteLater)
+        self.thread.finished.connect(self.thread.deleteLater)
+        self.thread.finished.connect(self.on_thread_finished)
+        self.worker.progress.connect(self.set_progress)
+        self.worker.progress_status.connect(self.set_progress_status)
+        self.worker.cancelled.connect(self.on_cancelled)
+        self.worker.failed.connect(self.on_failed)
+
+        self.status = "running"
+        self.thread.start()
+        self.updated.emit()
+
+    def set_progress(self, progress: int) -> None:
+        if not (isinstance(progress, int) and 0 <= progress <= 100):
+            raise ValueError("Progress must be an integer between 0 and 100")
+        self.progress = progress
+        self.updated.emit()
+
+    def set_progress_status(self, progress_status: str) -> None:
+        if not isinstance(progress_status, str):
+            raise TypeError("progress_status must be a string")
+        self.progress_status = progress_status
+        self.updated.emit()
+
+    def cancel(self) -> None:
+        """ Ask a running worker to stop, the job is cancelled once its thread has finished """
+        if self.status == "running":
+            self.worker.cancel()
+            self.status = "cancelling"
+            self.updated.emit()
+
+    def on_cancelled(self) -> None:
+        self._cancelled = True
+
+    def on_failed(self, error: str) -> None:
+        self.error = error
+
+    def on_thread_finished(self) -> None:
+        # Drop strong references so GC can do its thing
+        self.worker = None
+        self.thread = None
+        if self._cancelled:
+            self.status, self.progress = "cancelled", 0
+        elif self.error is not None:
+            self.status, self.progress = "failed", 0
+        else:
+            self.status, self.progress = "finished", 100
+        self.progress_status = ""
+        self.updated.emit()
+        self.finished.emit(self)
+
+    def __str__(self):
+        line = f"(run {self.identifier}) {self.description}: {self.status} {self.progress}%"
+        return f"{line} ({self.progress_status})" if self.progress_status else line
+
+
+@decorate_class_with_logging(log_level=DEBUG)
+class JobScheduler(QtCore.QObject):
+    """
+    Runs device workers as plot jobs, at most `max_jobs` at a time.
+
+    Overview:
+        Replaces the single plot thread of the main window. Every submitted
+        worker gets its own `QThread` once a slot is free, later jobs wait in a
+        queue in submission order.
+
+    - `jobs_changed` is emitted when a job is added, progresses or finishes,
+      `job_finished` with the finished job.
+    - Finished, failed and cancelled jobs are kept for display, the oldest are dropped
+      beyond `history`.
+    - `cancel` drops a queued job or asks a running one to stop, `cancel_all`
+      does so for every queued and running job.
+
+    Usage Notes:
+        Workers configured with the window memory cache share loaded files and
+        processors, a job waits for files another job is still reading instead
+        of reading them again.
+    """
+    jobs_changed = QtCore.pyqtSignal()
+    job_finished = QtCore.pyqtSignal(object)
+
+    def __init__(self, max_jobs: int = 2, history: int = 10):
+        super().__init__()
+        if not isinstance(max_jobs, int) or max_jobs < 1:
+            raise ValueError("max_jobs must be a positive integer")
+        self.max_jobs = max_jobs
+        self.history = history
+        self.jobs: list[PlotJob] = []
+        self._queue: deque[PlotJob] = deque()
+
+    def submit(self, worker: DeviceWorker, description: str) -> PlotJob:
+        """ Queue a worker, it starts right away when fewer than max_jobs are running """
+        job = PlotJob(worker, description)
+        job.updated.connect(self.jobs_changed)
+        job.finished.connect(self.on_job_finished)
+        self.jobs.append(job)
+        self._queue.append(job)
+        self._start_queued()
+        self.jobs_changed.emit()
+        return job
+
+    def _start_queued(self) -> None:
+        while self._queue and len(self.get_jobs("running")) + len(self.get_jobs("cancelling")) < self.max_jobs:
+            self._queue.popleft().start()
+
+    def cancel(self, job: PlotJob) -> None:
+        """ Drop a queued job or ask a running one to stop, other jobs are left alone """
+        if job in self._queue:
+            self._queue.remove(job)
+            job.worker = None
+            job.status = "cancelled"
+        else:
+            job.cancel()
+        self.jobs_changed.emit()
+
+    def cancel_all(self) -> None:
+        """ Drop the queued jobs and ask the running ones to stop """
+        while self._queue:
+            job = self._queue.popleft()
+            job.worker = None
+            job.status = "cancelled"
+        for job in self.get_jobs("running"):
+            job.cancel()
+        self.jobs_changed.emit()
+
+    def get_active_job(self) -> PlotJob | None:
+        """ The most recently submitted job that is still queued or running """
+        active = [job for job in self.jobs if job.status in ("queued", "running")]
+        return active[-1] if active else None
+
+    def on_job_finished(self, job: PlotJob) -> None:
+        self._start_queued()
+
+        finished = [old_job for old_job in self.jobs if old_job.status in ("finished", "failed", "cancelled")]
+        for old_job in finished[:max(len(finished) - self.history, 0)]:
+            self.jobs.remove(old_job)
+        self.job_finished.emit(job)
+        self.jobs_changed.emit()
+
+    def get_jobs(self, status: str = None) -> list[PlotJob]:
+        return [job for job in self.jobs if status is None or job.status == status]
+
+    def get_progress_status(self) -> str:
+        """ Throughput and ETA of the running jobs that reported one, one per job """
+        return " | ".join(job.progress_status for job in self.get_jobs("running") if job.progress_status)
+
+    def get_progress(self) -> int:
+        """ Mean progress of the running jobs, 0 when none are running """
+        running = self.get_jobs("running")
+        return int(sum(job.progress for job in running) / len(running)) if running else 0
@@ -23,6 +23,11 @@ import implementations.utils.constants
 from utils.class_utils.get_class_methods import get_class_methods
 from utils.console_colours import ConsoleColours
 from utils.read_config import read_config
+from cache_manager import MemoryCache
+from utils.precision import set_compact_precision
+from utils.expressions import set_configured_expressions
+from gui.utils.job_scheduler import JobScheduler
+from gui.utils.configure_worker import create_disk_caches
 
 # Local gui imports
 from gui.windows.dialogs.generate_about_dialog import generate_about_dialog
@@ -30,7 +35,7 @@ from gui.utils.clear.clear_data import clear_data
 from gui.utils.clear.clear_all import clear_all
 
 # DataSet file imports
-from gui.utils.dataset_tools.load_dataset import open_dataset_file
+from gui.utils.dataset_tools.load_dataset import open_dataset_file, refresh_dataset
 from gui.utils.dataset_tools.save_dataset import save_dataset
 from gui.utils.dataset_tools.create_dataset import create_dataset
 
@@ -69,7 +74,7 @@ class UiMainWindow(QtWidgets.QMainWindow):
     - Integrate logging with a QTextEdit-based console for time-stamped messages.
     - Provide a thin controller layer for:
         * Launching the plotting pipeline via `plot_manager`.
-        * Handling progress updates and console appends.
+        * Showing queued and running plot jobs with their progress, and console appends.
         * Adding notes and console history back into the dataset.
 
     On construction, the window:
@@ -84,10 +89,9 @@ class UiMainWindow(QtWidgets.QMainWindow):
     def __init__(self, demo_file_name: str = None):
         super(UiMainWindow, self).__init__()
 
-        self.thread = None
-        self.device_worker = None
         self.dataset = None
         self.dataset_location = None
+        self.prefetcher = None
 
         # Load the UI, Note that loadUI adds objects to 'self' using objectName
         self.dataWindow = None
@@ -96,6 +100,26 @@ class UiMainWindow(QtWidgets.QMainWindow):
         # Read the config file
         self.config = read_config(constant_paths.CONFIG_PATH)
 
+        # Numeric observables are stored as float32 when compact precision is enabled
+        set_compact_precision(self.config.get("compact_precision", False))
+        # Derived observables can be declared per processor class as expressions
+        set_configured_expressions(self.config.get("derived_observables", {}))
+
+        # Plot runs are queued and up to max_plot_jobs of them run at the same time
+        self.job_scheduler = JobScheduler(self.config.get("max_plot_jobs", 2))
+        self.job_scheduler.jobs_changed.connect(self.update_jobs_view)
+        self.job_scheduler.job_finished.connect(self.on_plot_job_finished)
+
+        # Data and processors are kept across runs, within a memory budget
+        self.memory_cache = MemoryCache(self.config.get("memory_cache_mb", 1024))
+
+        # Parsed file contents are shared between byte-identical files, 0 disables deduplication
+        dedup_cache_mb = self.config.get("dedup_cache_mb", 256)
+        self.shared_outputs = MemoryCache(dedup_cache_mb) if dedup_cache_mb else None
+
+        # Disk caches are shared by all runs, see configure_worker
+        self.disk_cache, self.sidecar_cache, self.processed_cache = create_disk_caches(self.config)
+
         # Create/Get a logger with the desired settings
         self.logger = logging.getLogger(constants.LOG_NAME)
         self.consoleTextEdit.setFormatter(
@@ -130,6 +154,7 @@ class UiMainWindow(QtWidgets.QMainWindow):
         self.actionCreate_Set.triggered.connect(partial(create_dataset, self))
         self.actionSave_Set.triggered.connect(partial(save_dataset, self))
         self.actionLoad_Set.triggered.connect(partial(open_dataset_file, self))
+        self.actionRefresh_Set.triggered.connect(partial(refresh_dataset, self))
         self.actionPreferences.triggered.connect(self.not_implemented)
         self.actionQuit.triggered.connect(self.quit)
 
@@ -152,9 +177,12 @@ class UiMainWindow(QtWidgets.QMainWindow):
 
         # Define stackedWidget widget actions
         self.plotBtn.clicked.connect(partial(plot_manager, self))
+        self.cancelBtn.clicked.connect(self.cancel_plot)
+        self.cancelAllBtn.clicked.connect(self.cancel_plots)
 
         # Make sure the progress bar is cleared
         self.progressBar.setValue(0)
+        self.progressLabel.setText("")
 
         # Show the app
         self.show()
@@ -250,23 +278,45 @@ class UiMainWindow(QtWidgets.QMainWindow):
         new_page = self.stackedWidget.widget(self.devices[self.dataset.get_device()])
         self.stackedWidget.setCurrentWidget(new_page)
 
-    def report_progress(self, progress: int):
-        if not (isinstance(progress, int) and 0 <= progress <= 100):
-            raise ValueError("Progress must be an integer between 0 and 100")
-
-        self.progressBar.setValue(progress)
-
-    def on_plot_thread_finished(self):
-        # Reset UI elements
-        self.progressBar.setValue(0)
-
-        # Free button and log to console
-        self.plotBtn.setEnabled(True)
-        self.console_print(f"(run {self.device_worker.identifier}) finished")
-
-        # Drop strong references so GC can do its thing
-        self.device_worker = None
-        self.thread = None
+    def update_jobs_view(self):
+        # One line per queued, running or recently finished plot job, the progress bar follows the running ones
+        # Items carry their job so the selection survives the refresh
+        selected = self.get_selected_job()
+        self.jobsList.clear()
+        for job in self.job_scheduler.get_jobs():
+            item = QtWidgets.QListWidgetItem(str(job))
+            item.setData(QtCore.Qt.UserRole, job)
+            self.jobsList.addItem(item)
+            if job is selected:
+                item.setSelected(True)
+        self.progressBar.setValue(self.job_scheduler.get_progress())
+        self.progressLabel.setText(self.job_scheduler.get_progress_status())
+
+    def on_plot_job_finished(self, job):
+        if job.error is not None:
+            self.console_print(f"(run {job.identifier}) {job.status}: {job.error}", level="alert")
+        else:
+            self.console_print(f"(run {job.identifier}) {job.status}")
+
+    def get_selected_job(self):
+        items = self.jobsList.selectedItems()
+        return items[0].data(QtCore.Qt.UserRole) if items else None
+
+    def cancel_plot(self):
+        # The job selected in the jobs list, otherwise the latest queued or running one
+        job = self.get_selected_job()
+        if job is None or job.status not in ("queued", "running"):
+            job = self.job_scheduler.get_active_job()
+        if job is None:
+            return
+        self.console_print(f"Cancelling plot run {job.identifier}")
+        self.job_scheduler.cancel(job)
+
+    def cancel_plots(self):
+        # Queued runs are dropped, running ones stop at their next check and release what they loaded
+        if self.job_scheduler.get_jobs("running") or self.job_scheduler.get_jobs("queued"):
+            self.console_print("Cancelling plot runs")
+        self.job_scheduler.cancel_all()
 
     def save_to_file(self, plaintext: str):
         file_dialog = QtWidgets.QFileDialog.getSaveFileName(self, "Save File", "", "Text Files (*.txt);;All Files (*)")
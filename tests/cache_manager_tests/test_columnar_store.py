@@ -0,0 +1,63 @@
+import datetime
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from cache_manager import ColumnarStore
+
+
+def export(values) -> dict:
+    return {"raw_data": {
+        "voltage": {"units": "V", "data": values},
+        "label": {"units": None, "data": "device 1"},
+        "datetime": {"units": None, "data": datetime.datetime(2024, 6, 14, 9)},
+    }}
+
+
+class CountingColumnarStore(ColumnarStore):
+    """ColumnarStore counting how often it lists the cache directory."""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.scans = 0
+
+    def _list_entries(self):
+        self.scans += 1
+        return super()._list_entries()
+
+
+class TestColumnarStore(unittest.TestCase):
+    """Memory-mapped entries and eviction of the columnar store."""
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_arrays_are_memory_mapped(self):
+        store = ColumnarStore(self.directory)
+        store.put("entry", export([1.0, 2.0, 3.0]))
+        restored = store.get("entry")["raw_data"]
+
+        self.assertIsInstance(restored["voltage"]["data"], np.memmap)
+        np.testing.assert_array_equal(restored["voltage"]["data"], [1.0, 2.0, 3.0])
+        self.assertEqual(restored["voltage"]["units"], "V")
+        self.assertEqual(restored["label"]["data"], "device 1")
+        self.assertEqual(restored["datetime"]["data"], datetime.datetime(2024, 6, 14, 9))
+
+    def test_written_size_matches_the_entry_on_disk(self):
+        store = ColumnarStore(self.directory)
+        store.put("first", export(np.arange(100.0)))
+        store.put("second", export(np.arange(1000.0)))
+        self.assertEqual(store._size, store.get_size())
+
+    def test_writes_do_not_scan_the_store(self):
+        store = CountingColumnarStore(self.directory, max_size_mb=50 * 1024 / 1024 ** 2)
+        for index in range(500):
+            store.put(str(index), export(np.arange(20.0)))
+        self.assertLess(store.scans, 50)
+        self.assertLessEqual(store.get_size(), store.max_size)
+        self.assertEqual(store._size, store.get_size())
+
+
+if __name__ == "__main__":
+    unittest.main()
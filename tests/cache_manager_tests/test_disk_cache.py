@@ -0,0 +1,108 @@
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from cache_manager import DiskCache
+
+
+class CountingDiskCache(DiskCache):
+    """DiskCache counting how often it lists the cache directory."""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.scans = 0
+
+    def _list_entries(self):
+        self.scans += 1
+        return super()._list_entries()
+
+
+class TestDiskCache(unittest.TestCase):
+    """Keys, eviction and purging of the persistent cache."""
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_round_trip_and_counters(self):
+        cache = DiskCache(self.directory)
+        key = cache.make_key("path", 10, 123, "IVData", "reader:1")
+        self.assertIsNone(cache.get(key))
+        cache.put(key, {"raw_data": {"voltage": [1.0, 2.0]}})
+        self.assertEqual(cache.get(key), {"raw_data": {"voltage": [1.0, 2.0]}})
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_keys_differ_per_part(self):
+        key = DiskCache.make_key("path", 10, 123, "IVData", "reader:1")
+        self.assertEqual(key, DiskCache.make_key("path", 10, 123, "IVData", "reader:1"))
+        for other in (("path", 11, 123, "IVData", "reader:1"), ("path", 10, 124, "IVData", "reader:1"),
+                      ("path", 10, 123, "IVData", "reader:2")):
+            self.assertNotEqual(key, DiskCache.make_key(*other))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = DiskCache(self.directory, max_size_mb=3 * 1024 / 1024 ** 2)
+        for index in range(3):
+            cache.put(str(index), b"x" * 900)
+            # Access times are file modification times, keep them apart
+            os.utime(cache._get_entry_path(str(index)), (index, index))
+        cache.get("0")
+        cache.put("3", b"x" * 900)
+
+        self.assertIsNotNone(cache.get("0"))
+        self.assertIsNone(cache.get("1"))
+        self.assertIsNotNone(cache.get("3"))
+        self.assertLessEqual(cache.get_size(), cache.max_size)
+
+    def test_writes_do_not_scan_the_cache(self):
+        cache = CountingDiskCache(self.directory, max_size_mb=20 * 1024 / 1024 ** 2)
+        start = time.perf_counter()
+        for index in range(1000):
+            cache.put(str(index), index)
+        self.assertLess(cache.scans, 100)
+        self.assertLess(time.perf_counter() - start, 30)
+        self.assertLessEqual(cache.get_size(), cache.max_size)
+        self.assertEqual(cache._size, cache.get_size())
+
+    def test_entries_of_other_instances_are_counted_before_evicting(self):
+        other = DiskCache(self.directory)
+        for index in range(10):
+            other.put(f"other{index}", b"x" * 900)
+        cache = DiskCache(self.directory, max_size_mb=5 * 1024 / 1024 ** 2)
+        cache.put("mine", b"x" * 900)
+        self.assertLessEqual(cache.get_size(), cache.max_size)
+
+    def test_purge(self):
+        cache = DiskCache(self.directory)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.purge(), 2)
+        self.assertEqual(cache.get_stats()["entries"], 0)
+        self.assertEqual(cache._size, 0)
+
+    def test_shared_instances_keep_their_index_consistent(self):
+        cache = DiskCache(self.directory)
+        cache.put("first", 0)
+
+        def write(prefix):
+            for index in range(50):
+                cache.put(f"{prefix}{index}", list(range(index)))
+        threads = [threading.Thread(target=write, args=(prefix,)) for prefix in "abcd"]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+        self.assertEqual(cache._size, cache.get_size())
+
+    def test_instances_can_be_sent_to_worker_processes(self):
+        cache = DiskCache(self.directory)
+        cache.put("a", 1)
+        copy = pickle.loads(pickle.dumps(cache))
+        copy.put("b", 2)
+        self.assertEqual(cache.get("b"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
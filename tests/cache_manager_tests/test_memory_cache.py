@@ -0,0 +1,103 @@
+import threading
+import unittest
+import numpy as np
+from cache_manager import MemoryCache, estimate_size
+
+MB = 1024 ** 2
+
+
+class Holder:
+    """Stand-in for a data object or a processor referencing one."""
+    def __init__(self, values, data=None):
+        self.values = values
+        self.data = data
+
+
+class TestMemoryCache(unittest.TestCase):
+    """Budget, eviction and reservations of the in-memory cache."""
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = MemoryCache(max_size_mb=3)
+        for key in "abc":
+            cache.put(key, Holder(np.zeros(MB // 8)), size=MB)
+        cache.get("a")
+        cache.put("d", Holder(np.zeros(MB // 8)), size=MB)
+
+        self.assertIsNone(cache.get("b", wait=False))
+        for key in "acd":
+            self.assertIsNotNone(cache.get(key, wait=False))
+        self.assertEqual(cache.get_size(), 3 * MB)
+
+    def test_budget_covers_data_kept_alive_by_children(self):
+        # 20 files of 8 MB in a 40 MB budget, every processor referencing its data object
+        cache = MemoryCache(max_size_mb=40)
+        for index in range(20):
+            data = Holder(np.zeros(8 * MB // 8))
+            cache.put(("data", index), data)
+            cache.put(("processor", index), Holder(np.zeros(10), data=data), parent=("data", index))
+
+        reachable = {}
+        for key in list(cache._entries):
+            value = cache.get(key, wait=False)
+            for holder in (value, value.data):
+                if holder is not None:
+                    reachable[id(holder.values)] = holder.values.nbytes
+        self.assertLessEqual(sum(reachable.values()), 40 * MB)
+        self.assertLessEqual(cache.get_size(), 40 * MB)
+        for index in range(20):
+            if cache.contains(("processor", index)):
+                self.assertTrue(cache.contains(("data", index)))
+
+    def test_child_size_excludes_its_parent(self):
+        cache = MemoryCache()
+        data = Holder(np.zeros(MB // 8))
+        cache.put("data", data)
+        cache.put("processor", Holder(np.zeros(10), data=data), parent="data")
+        self.assertLess(cache.get_size() - estimate_size(data), MB // 100)
+
+    def test_using_a_child_keeps_its_parent(self):
+        cache = MemoryCache(max_size_mb=3)
+        data = Holder(None)
+        cache.put("data", data, size=MB)
+        cache.put("processor", Holder(None, data=data), size=MB // 2, parent="data")
+        cache.put("other", Holder(None), size=MB)
+        cache.get("processor")
+        cache.put("newest", Holder(None), size=MB)
+
+        self.assertFalse(cache.contains("other"))
+        self.assertTrue(cache.contains("data"))
+        self.assertTrue(cache.contains("processor"))
+
+    def test_reserved_keys_make_readers_wait_for_the_loader(self):
+        cache = MemoryCache()
+        self.assertTrue(cache.reserve("file"))
+        self.assertFalse(cache.reserve("file"))
+        results = []
+        reader = threading.Thread(target=lambda: results.append(cache.get("file")))
+        reader.start()
+        cache.put("file", "loaded")
+        reader.join(timeout=5)
+        self.assertEqual(results, ["loaded"])
+
+    def test_released_keys_are_misses(self):
+        cache = MemoryCache()
+        cache.reserve("file")
+        cache.release("file")
+        self.assertIsNone(cache.get("file"))
+        self.assertTrue(cache.reserve("file"))
+
+    def test_waiting_ends_once_cancelled(self):
+        cache = MemoryCache()
+        cache.reserve("file")
+        cancelled = threading.Event()
+        results = []
+        reader = threading.Thread(target=lambda: results.append(cache.get("file", is_cancelled=cancelled.is_set)))
+        reader.start()
+        cancelled.set()
+        reader.join(timeout=5)
+        self.assertFalse(reader.is_alive())
+        self.assertEqual(results, [None])
+        self.assertTrue(cache.is_pending("file"))
+
+
+if __name__ == "__main__":
+    unittest.main()
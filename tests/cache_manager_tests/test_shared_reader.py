@@ -0,0 +1,79 @@
+import os
+import shutil
+import tempfile
+import unittest
+from cache_manager import MemoryCache, SharedReader, content_fingerprint, contents_match, file_fingerprint
+from cache_manager.fingerprint import CONTENT_SAMPLE_COUNT, CONTENT_SAMPLE_SIZE
+from contracts.device_worker import DeviceWorkerCore
+from contracts.plotter_options import PlotterOptions
+from dataset_manager import DataSet
+
+# Large enough to be hashed from samples, with a byte between the first two samples
+SIZE = 2 * CONTENT_SAMPLE_COUNT * CONTENT_SAMPLE_SIZE
+UNSAMPLED_OFFSET = CONTENT_SAMPLE_SIZE + 100
+
+
+class CountingReader:
+    """Reader returning the byte at UNSAMPLED_OFFSET and counting its calls."""
+    version = "1"
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, filepath: str) -> dict:
+        self.calls += 1
+        with open(filepath, "rb") as file:
+            file.seek(UNSAMPLED_OFFSET)
+            return {"byte": file.read(1)}
+
+
+class TestSharedReader(unittest.TestCase):
+    """Sharing parses between identical files, confirmed beyond the sampled hash."""
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.reader = CountingReader()
+        self.shared_reader = SharedReader(self.reader, MemoryCache())
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _write(self, name: str, byte: bytes = b"a") -> str:
+        contents = bytearray(SIZE)
+        contents[UNSAMPLED_OFFSET] = byte[0]
+        filepath = os.path.join(self.directory, name)
+        with open(filepath, "wb") as file:
+            file.write(contents)
+        return filepath
+
+    def test_identical_copies_share_one_parse(self):
+        outputs = [self.shared_reader(self._write(name)) for name in ("first", "copy")]
+        self.assertEqual(outputs, [{"byte": b"a"}] * 2)
+        self.assertEqual(self.reader.calls, 1)
+
+    def test_files_differing_outside_the_samples_are_parsed_separately(self):
+        first, other = self._write("first", b"a"), self._write("other", b"b")
+        self.assertEqual(content_fingerprint(first), content_fingerprint(other))
+        self.assertFalse(contents_match(file_fingerprint(first), file_fingerprint(other)))
+
+        self.assertEqual(self.shared_reader(first), {"byte": b"a"})
+        self.assertEqual(self.shared_reader(other), {"byte": b"b"})
+        # Copies of the colliding file are shared under its full hash
+        self.assertEqual(self.shared_reader(self._write("other_copy", b"b")), {"byte": b"b"})
+        self.assertEqual(self.reader.calls, 2)
+
+    def test_files_changed_since_they_were_parsed_do_not_match(self):
+        first = self._write("first")
+        fingerprint = file_fingerprint(first)
+        self._write("first", b"b")
+        os.utime(first, ns=(0, 0))
+        self.assertFalse(contents_match(fingerprint, file_fingerprint(self._write("copy"))))
+
+    def test_workers_only_group_files_with_matching_contents(self):
+        filepaths = {"first": self._write("first"), "copy": self._write("copy"), "other": self._write("other", b"b")}
+        worker = DeviceWorkerCore("Values", DataSet("2024.01.01_00.00.00"), None, PlotterOptions())
+        groups = sorted(sorted(group) for group in worker._group_by_content(filepaths))
+        self.assertEqual(groups, [["copy", "first"], ["other"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from cache_manager import MemoryCache
+from contracts.data_processors import DataProcessorCore
+from contracts.data_types import DataCore
+from contracts.device_worker import DeviceWorkerCore, memory_cache_key
+from contracts.plotter_options import PlotterOptions
+from dataset_manager import DataSet
+from utils.errors.errors import RunCancelledError
+
+
+def read_values(filepath: str) -> dict:
+    with open(filepath) as file:
+        return {"0": [float(line) for line in file if line.strip()]}
+
+
+class ValueData(DataCore):
+    def __init__(self, label):
+        super().__init__(file_reader=read_values)
+        self.raw_data = {"values": None}
+        self._allowed_observables = self.raw_data.keys()
+
+    def read_file(self, filepath: str) -> None:
+        self.raw_data["values"] = {"units": "V", "data": self.file_reader(filepath)["0"]}
+
+
+class ValueProcessor(DataProcessorCore):
+    def __init__(self, data):
+        super().__init__(data)
+        self.calls = 0
+        self._processing_functions["total"] = self.calculate_total
+        self._processed_observables = self._processing_functions.keys()
+        self.processed_data = {"total": None}
+
+    def calculate_total(self, offset: float = 0.0):
+        self.calls += 1
+        self.processed_data["total"] = {"units": "V", "data": sum(self.get_data("values")) + offset}
+        return self.processed_data["total"]
+
+    def validate_observables(self, *observables) -> None:
+        pass
+
+
+class ValueWorker(DeviceWorkerCore):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.set_data_type(ValueData)
+        self.set_processor_type(ValueProcessor)
+
+
+class TestConcurrentRuns(unittest.TestCase):
+    """Runs sharing the memory cache and its processors at the same time."""
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filepaths = {}
+        for index in range(2):
+            self.filepaths[f"file{index}"] = os.path.join(self.directory, f"file{index}.txt")
+            with open(self.filepaths[f"file{index}"], "w") as file:
+                file.write(f"{index}.0\n1.0\n")
+        self.memory_cache = MemoryCache()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _get_worker(self, *labels) -> ValueWorker:
+        dataset = DataSet("2024.01.01_00.00.00")
+        dataset.set_structure_type("flat")
+        for label in labels:
+            dataset.add_filepath(self.filepaths[label], label)
+        worker = ValueWorker("Values", dataset, None, PlotterOptions())
+        worker.set_memory_cache(self.memory_cache)
+        return worker
+
+    def _start(self, target) -> tuple[threading.Thread, list]:
+        errors = []
+
+        def run():
+            try:
+                target()
+            except BaseException as error:
+                errors.append(error)
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        return thread, errors
+
+    def test_runs_do_not_wait_while_holding_reservations(self):
+        # Another run is loading file1, this one stores file0 before waiting for it
+        other_key = memory_cache_key(ValueData, "file1", self.filepaths["file1"])
+        self.assertTrue(self.memory_cache.reserve(other_key))
+        worker = self._get_worker("file0", "file1")
+        thread, errors = self._start(lambda: worker.set_data(worker.dataset))
+
+        own_key = memory_cache_key(ValueData, "file0", self.filepaths["file0"])
+        for _ in range(500):
+            if self.memory_cache.contains(own_key):
+                break
+            thread.join(timeout=0.01)
+        self.assertTrue(self.memory_cache.contains(own_key))
+        self.assertTrue(thread.is_alive())
+
+        other_data = ValueData("file1")
+        other_data.read_file(self.filepaths["file1"])
+        self.memory_cache.put(other_key, other_data)
+        thread.join(timeout=5)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(errors, [])
+        self.assertIs(worker.data_processors["file1"].data, other_data)
+
+    def test_waiting_for_another_run_can_be_cancelled(self):
+        self.memory_cache.reserve(memory_cache_key(ValueData, "file1", self.filepaths["file1"]))
+        worker = self._get_worker("file1")
+        thread, errors = self._start(lambda: worker.set_data(worker.dataset))
+        worker.cancel()
+        thread.join(timeout=5)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual([type(error) for error in errors], [RunCancelledError])
+
+    def test_failed_loads_elsewhere_are_read_by_the_waiting_run(self):
+        other_key = memory_cache_key(ValueData, "file1", self.filepaths["file1"])
+        self.memory_cache.reserve(other_key)
+        worker = self._get_worker("file1")
+        thread, errors = self._start(lambda: worker.set_data(worker.dataset))
+        self.memory_cache.release(other_key)
+        thread.join(timeout=5)
+        self.assertEqual(errors, [])
+        self.assertEqual(worker.data_processors["file1"].get_data("values"), [1.0, 1.0])
+
+    def test_shared_processors_compute_each_result_once(self):
+        worker = self._get_worker("file0")
+        worker.set_data(worker.dataset)
+        processor = worker.data_processors["file0"]
+        barrier = threading.Barrier(8)
+        results = []
+
+        def request():
+            barrier.wait()
+            for offset in range(20):
+                results.append(processor.get_data("total", offset=float(offset % 4)))
+        runs = [self._start(request) for _ in range(8)]
+        for thread, errors in runs:
+            thread.join(timeout=10)
+            self.assertEqual(errors, [])
+
+        self.assertEqual(processor.calls, 4)
+        self.assertEqual(sorted(set(results)), [1.0, 2.0, 3.0, 4.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import datetime
+import pickle
+import unittest
+from unittest import mock
+import numpy as np
+from contracts.data_processors import DataProcessorCore, cpu_heavy, depends_on
+from contracts.data_types import DataCore
+from contracts.device_worker import DeviceWorkerCore, requires_observables
+from contracts.plotter_options import PlotterOptions
+from dataset_manager import DataSet
+
+
+def read_nothing(filepath: str) -> dict:
+    return {}
+
+
+class FitData(DataCore):
+    def __init__(self, label=None):
+        super().__init__(file_reader=read_nothing)
+        self.raw_data = {
+            "voltage": {"units": "V", "data": np.linspace(0.0, 1.0, 10)},
+            "current": {"units": "A", "data": np.linspace(1.0, 3.0, 10)},
+            "spectrum": {"units": "counts", "data": np.zeros(200_000)},
+            "datetime": {"units": None, "data": datetime.datetime(2024, 6, 14, 9)},
+        }
+        self._allowed_observables = self.raw_data.keys()
+
+    def read_file(self, filepath: str) -> None:
+        pass
+
+
+class FitProcessor(DataProcessorCore):
+    def __init__(self, data: FitData):
+        super().__init__(data)
+        self._processing_functions.update({
+            "slope": self.slope,
+            "hours_fit": self.hours_fit,
+        })
+        self.processed_data = {key: None for key in self._processing_functions}
+        self._processed_observables = self.processed_data.keys()
+
+    @cpu_heavy
+    @depends_on("voltage", "current")
+    def slope(self):
+        return {"units": "A/V", "data": np.polyfit(self.get_data("voltage"), self.get_data("current"), 1)[0]}
+
+    @cpu_heavy
+    @depends_on("elapsed_time")
+    def hours_fit(self, *args, **kwargs):
+        return {"units": "h", "data": self.get_data("elapsed_time", *args, **kwargs).total_seconds() / 3600}
+
+    def validate_observables(self, *observables) -> None:
+        pass
+
+
+class FitWorker(DeviceWorkerCore):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.set_data_type(FitData)
+        self.set_processor_type(FitProcessor)
+
+    @requires_observables("slope", "hours_fit")
+    def plot_fits(self):
+        pass
+
+
+class TestCpuHeavy(unittest.TestCase):
+    """Evaluation of cpu_heavy observables in worker processes."""
+    def _get_worker(self) -> FitWorker:
+        worker = FitWorker("Fits", DataSet("2024.01.01_00.00.00"), "plot_fits", PlotterOptions())
+        worker.set_max_workers(2)
+        worker.data_processors = {label: FitProcessor(FitData()) for label in ("a", "b")}
+        return worker
+
+    def test_observables_needing_arguments_are_left_to_the_plot(self):
+        worker = self._get_worker()
+        with mock.patch.object(worker, "evaluate_in_parallel", wraps=worker.evaluate_in_parallel) as evaluate:
+            worker._evaluate_cpu_heavy()
+        self.assertEqual([call.args for call in evaluate.call_args_list], [("slope",)])
+        for processor in worker.data_processors.values():
+            self.assertTrue(processor.has_result("slope"))
+            self.assertAlmostEqual(processor.get_data("slope"), 2.0)
+
+    def test_worker_processes_only_get_the_inputs(self):
+        processor = FitProcessor(FitData())
+        processor.get_data("elapsed_time", experiment_datetime=datetime.datetime(2024, 6, 14))
+        evaluation_copy = processor.get_evaluation_copy("slope")
+
+        self.assertLess(len(pickle.dumps(evaluation_copy)), len(pickle.dumps(processor)) // 10)
+        self.assertIsNone(evaluation_copy.data.raw_data["spectrum"])
+        self.assertEqual(evaluation_copy.get_memo_stats()["entries"], 0)
+        self.assertAlmostEqual(pickle.loads(pickle.dumps(evaluation_copy)).get_data("slope"), 2.0)
+        self.assertFalse(processor.has_result("slope"))
+
+    def test_undeclared_inputs_keep_all_raw_data(self):
+        processor = FitProcessor(FitData())
+        processor._processing_functions["slope"] = lambda: {"units": "A", "data": processor.get_data("spectrum").sum()}
+        self.assertIsNone(processor.get_inputs("slope"))
+        self.assertIsNotNone(processor.get_evaluation_copy("slope").data.raw_data["spectrum"])
+
+    def test_needs_arguments(self):
+        processor = FitProcessor(FitData())
+        self.assertFalse(processor.needs_arguments("slope"))
+        self.assertTrue(processor.needs_arguments("hours_fit"))
+        self.assertTrue(processor.needs_arguments("elapsed_time"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import datetime
+import unittest
+import numpy as np
+from contracts.data_processors import DataProcessorCore, DecimatedProcessor
+from contracts.data_types import DataCore
+
+
+def read_nothing(filepath: str) -> dict:
+    return {}
+
+
+class LongData(DataCore):
+    def __init__(self):
+        super().__init__(file_reader=read_nothing)
+        voltage = np.linspace(0.0, 1.0, 100_000)
+        self.raw_data = {
+            "voltage": {"units": "V", "data": voltage},
+            "current": {"units": "A", "data": np.sin(50 * voltage)},
+            "datetime": {"units": None, "data": datetime.datetime(2024, 6, 14, 9)},
+        }
+        self._allowed_observables = self.raw_data.keys()
+
+    def read_file(self, filepath: str) -> None:
+        pass
+
+
+class LongProcessor(DataProcessorCore):
+    def validate_observables(self, *observables) -> None:
+        pass
+
+
+class TestDecimatedProcessor(unittest.TestCase):
+    """Downsampled views of processors handed to plotters."""
+    def test_series_stay_paired(self):
+        processor = LongProcessor(LongData())
+        decimated = DecimatedProcessor(processor, "minmax", 100, frozenset({"voltage", "current"}))
+        voltage, current = decimated.get_data("voltage"), decimated.get_data("current")
+
+        self.assertEqual(len(voltage), len(current))
+        self.assertLessEqual(len(voltage), 2 * 2 * 100 + 4)
+        np.testing.assert_allclose(current, np.sin(50 * voltage))
+        self.assertEqual(len(processor.get_data("voltage")), 100_000)
+
+    def test_choosing_points_computes_nothing(self):
+        processor = LongProcessor(LongData())
+        decimated = DecimatedProcessor(processor, "lttb", 100, frozenset({"voltage", "elapsed_hours"}))
+
+        self.assertEqual(len(decimated.get_data("voltage")), 200)
+        self.assertIsNone(processor.processed_data["elapsed_hours"])
+        self.assertEqual(processor.get_memo_stats()["misses"], 0)
+        hours = decimated.get_data("elapsed_hours", experiment_datetime=datetime.datetime(2024, 6, 14))
+        self.assertEqual(hours, 9.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
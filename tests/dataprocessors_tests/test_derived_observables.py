@@ -0,0 +1,99 @@
+import datetime
+import unittest
+import numpy as np
+from contracts.data_processors import DataProcessorCore, depends_on
+from contracts.data_types import DataCore
+from utils.expressions import set_configured_expressions
+
+
+def read_nothing(filepath: str) -> dict:
+    return {}
+
+
+class DerivedData(DataCore):
+    def __init__(self):
+        super().__init__(file_reader=read_nothing)
+        self.raw_data = {
+            "voltage": {"units": "V", "data": np.array([0.0, 0.5, 1.0])},
+            "current": {"units": "A", "data": np.array([1.0, 2.0, 3.0])},
+            "datetime": {"units": None, "data": datetime.datetime(2024, 6, 14, 9)},
+        }
+        self._allowed_observables = self.raw_data.keys()
+
+    def read_file(self, filepath: str) -> None:
+        pass
+
+
+class DerivedProcessor(DataProcessorCore):
+    derived_observables = {
+        "power": "voltage * current",
+        "current_density": {"expression": "current / 0.16", "units": "A/cm^2"},
+        "elapsed_minutes": {"expression": "elapsed_hours * 60", "units": "min"},
+    }
+
+    def validate_observables(self, *observables) -> None:
+        pass
+
+
+class FitProcessor(DataProcessorCore):
+    def __init__(self, data):
+        super().__init__(data)
+        self._processing_functions["fit"] = self.compute_fit
+        self.processed_data = {key: None for key in self._processing_functions}
+        self._processed_observables = self.processed_data.keys()
+
+    @depends_on("current", provides="fit")
+    def compute_fit(self):
+        return {"units": "A", "data": self.get_data("current").mean()}
+
+    def validate_observables(self, *observables) -> None:
+        pass
+
+
+class TestDerivedObservables(unittest.TestCase):
+    """Observables declared as expressions in derived_observables."""
+    def test_expressions_are_evaluated_with_units(self):
+        processor = DerivedProcessor(DerivedData())
+        np.testing.assert_allclose(processor.get_data("power"), [0.0, 1.0, 3.0])
+        self.assertEqual(processor.get_units("power"), "V*A")
+        self.assertEqual(processor.get_units("current_density"), "A/cm^2")
+
+    def test_arguments_reach_processed_inputs(self):
+        processor = DerivedProcessor(DerivedData())
+        minutes = processor.get_data("elapsed_minutes", experiment_datetime=datetime.datetime(2024, 6, 14, 8))
+        self.assertEqual(minutes, 60.0)
+
+    def test_inputs_are_declared_as_dependencies(self):
+        self.assertEqual(DerivedProcessor.expand_dependencies({"power"}), frozenset({"power", "voltage", "current"}))
+
+    def test_collisions_with_processing_functions_are_rejected(self):
+        for derived in ({"elapsed_hours": "voltage * 2"}, {"compute_fit": "current"}, {"fit": "current * 2"}):
+            processor_type = type("CollidingProcessor", (FitProcessor,), {"derived_observables": derived})
+            with self.subTest(derived=derived), self.assertRaises(ValueError):
+                processor_type(DerivedData())
+
+    def test_configured_expressions_are_validated(self):
+        self.addCleanup(set_configured_expressions, {})
+        set_configured_expressions({"FitProcessor": {"elapsed_time": "current"}})
+        with self.assertRaises(ValueError):
+            FitProcessor.get_derived_observables()
+
+        set_configured_expressions({"FitProcessor": {"fit_percent": "fit * 100", "scaled": "resistance * 2"}})
+        with self.assertRaisesRegex(ValueError, "resistance"):
+            FitProcessor(DerivedData()).validate_derived_observables()
+
+    def test_derived_observables_are_checked_against_the_data(self):
+        DerivedProcessor(DerivedData()).validate_derived_observables()
+        shadowed = type("ShadowingProcessor", (FitProcessor,), {"derived_observables": {"voltage": "current * 2"}})
+        with self.assertRaisesRegex(ValueError, "raw data"):
+            shadowed(DerivedData()).validate_derived_observables()
+
+        replaced = type("ReplacedProcessor", (FitProcessor,), {"derived_observables": {"total": "current * 2"}})
+        processor = replaced(DerivedData())
+        processor._processing_functions["total"] = processor.compute_fit
+        with self.assertRaisesRegex(ValueError, "processing function"):
+            processor.validate_derived_observables()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import datetime
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+from cache_manager import DiskCache, MemoryCache, data_fingerprint
+from contracts.data_processors import DataProcessorCore
+from contracts.data_types import DataCore
+from contracts.device_worker import DeviceWorkerCore
+from contracts.plotter_options import PlotterOptions
+from dataset_manager import DataSet
+
+
+def read_values(filepath: str) -> dict:
+    with open(filepath) as file:
+        return {"0": [float(line) for line in file if line.strip()]}
+
+
+class ValueData(DataCore):
+    def __init__(self, label):
+        super().__init__(file_reader=read_values)
+        self.raw_data = {"values": None, "datetime": None}
+        self._allowed_observables = self.raw_data.keys()
+
+    def read_file(self, filepath: str) -> None:
+        self.raw_data["values"] = {"units": "V", "data": self.file_reader(filepath)["0"]}
+        self._get_datetime_from_filename(filepath)
+
+
+class ValueProcessor(DataProcessorCore):
+    def validate_observables(self, *observables) -> None:
+        pass
+
+
+class ValueWorker(DeviceWorkerCore):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.set_data_type(ValueData)
+        self.set_processor_type(ValueProcessor)
+
+
+class TestProcessedCache(unittest.TestCase):
+    """Keys of the persistent cache of processed observables."""
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.cache = DiskCache(os.path.join(self.directory, "processed"))
+        self.data_directory = os.path.join(self.directory, "data")
+        os.makedirs(self.data_directory)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _get_processors(self, *filenames, memory_cache: MemoryCache = None) -> dict:
+        dataset = DataSet("2024.01.01_00.00.00")
+        dataset.set_experiment_date("2024.06.14_00.00.00")
+        dataset.set_structure_type("flat")
+        for filename in filenames:
+            dataset.add_filepath(os.path.join(self.data_directory, filename), filename)
+        worker = ValueWorker("Values", dataset, None, PlotterOptions())
+        worker.set_processed_cache(self.cache)
+        worker.set_memory_cache(memory_cache)
+        worker.set_data(dataset)
+        return worker.data_processors
+
+    def test_identical_files_with_different_names_do_not_share_results(self):
+        for filename in ("IV_2024_06_14_09_00_00.txt", "IV_2024_06_15_09_00_00.txt"):
+            with open(os.path.join(self.data_directory, filename), "w") as file:
+                file.write("1.0\n2.0\n")
+        reference = datetime.datetime(2024, 6, 14)
+
+        first = self._get_processors("IV_2024_06_14_09_00_00.txt")["IV_2024_06_14_09_00_00.txt"]
+        self.assertEqual(first.get_data("elapsed_time", experiment_datetime=reference), datetime.timedelta(hours=9))
+        second = self._get_processors("IV_2024_06_15_09_00_00.txt")["IV_2024_06_15_09_00_00.txt"]
+        self.assertEqual(second.get_data("elapsed_time", experiment_datetime=reference), datetime.timedelta(hours=33))
+
+    def test_results_are_reused_for_unchanged_data(self):
+        with open(os.path.join(self.data_directory, "IV_2024_06_14_09_00_00.txt"), "w") as file:
+            file.write("1.0\n2.0\n")
+        reference = datetime.datetime(2024, 6, 14)
+
+        self._get_processors("IV_2024_06_14_09_00_00.txt")["IV_2024_06_14_09_00_00.txt"].get_data(
+            "elapsed_time", experiment_datetime=reference)
+        self.cache.hits = 0
+        self._get_processors("IV_2024_06_14_09_00_00.txt")["IV_2024_06_14_09_00_00.txt"].get_data(
+            "elapsed_time", experiment_datetime=reference)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_source_keys_are_remembered_per_file(self):
+        filename = "IV_2024_06_14_09_00_00.txt"
+        with open(os.path.join(self.data_directory, filename), "w") as file:
+            file.write("1.0\n2.0\n")
+        memory_cache = MemoryCache()
+
+        with mock.patch("contracts.device_worker.data_fingerprint", wraps=data_fingerprint) as fingerprint:
+            first = self._get_processors(filename, memory_cache=memory_cache)[filename]
+            second = self._get_processors(filename, memory_cache=memory_cache)[filename]
+        self.assertEqual(fingerprint.call_count, 1)
+        self.assertEqual(second.get_source_key(), first.get_source_key())
+
+        # An edited file is another data object, its key is computed again
+        with open(os.path.join(self.data_directory, filename), "w") as file:
+            file.write("1.0\n2.0\n3.0\n")
+        os.utime(os.path.join(self.data_directory, filename), ns=(0, 0))
+        edited = self._get_processors(filename, memory_cache=memory_cache)[filename]
+        self.assertNotEqual(edited.get_source_key(), first.get_source_key())
+
+    def test_data_fingerprint_covers_values_and_dtypes(self):
+        raw_data = {"values": {"units": "V", "data": np.array([1.0, 2.0])}}
+        same = {"values": {"units": "V", "data": np.array([1.0, 2.0])}}
+        other_dtype = {"values": {"units": "V", "data": np.array([1.0, 2.0], dtype=np.float32)}}
+        other_value = {"values": {"units": "V", "data": np.array([1.0, 3.0])}}
+        other_units = {"values": {"units": "A", "data": np.array([1.0, 2.0])}}
+
+        self.assertEqual(data_fingerprint(raw_data), data_fingerprint(same))
+        for other in (other_dtype, other_value, other_units):
+            self.assertNotEqual(data_fingerprint(raw_data), data_fingerprint(other))
+
+
+if __name__ == "__main__":
+    unittest.main()
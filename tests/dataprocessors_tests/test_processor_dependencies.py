@@ -0,0 +1,129 @@
+import datetime
+import unittest
+import numpy as np
+from contracts.data_processors import DataProcessorCore, depends_on
+from contracts.data_types import DataCore
+
+
+def read_nothing(filepath: str) -> dict:
+    return {}
+
+
+class GraphData(DataCore):
+    def __init__(self):
+        super().__init__(file_reader=read_nothing)
+        self.raw_data = {
+            "voltage": {"units": "V", "data": np.array([0.0, 0.5, 1.0])},
+            "current": {"units": "A", "data": np.array([1.0, 2.0, 3.0])},
+            "datetime": {"units": None, "data": datetime.datetime(2024, 6, 14, 9)},
+        }
+        self._allowed_observables = self.raw_data.keys()
+
+    def read_file(self, filepath: str) -> None:
+        pass
+
+
+class GraphProcessor(DataProcessorCore):
+    def __init__(self, data: GraphData):
+        super().__init__(data)
+        self._processing_functions.update({
+            "power": self.power,
+            "energy": self.energy,
+            "elapsed_days": self.elapsed_days,
+            "days_since_start": self.days_since_start,
+            "scaled_time": self.scaled_time,
+            "scaled_power": self.scaled_power,
+            "power_fit": self.power_fit,
+        })
+        self.processed_data = {key: None for key in self._processing_functions}
+        self._processed_observables = self.processed_data.keys()
+        self.calls = []
+
+    @depends_on("voltage", "current")
+    def power(self):
+        self.calls.append("power")
+        return {"units": "W", "data": self.get_data("voltage") * self.get_data("current")}
+
+    @depends_on("power")
+    def energy(self):
+        self.calls.append("energy")
+        return {"units": "J", "data": self.get_data("power").sum()}
+
+    @depends_on("elapsed_time")
+    def elapsed_days(self, *args, **kwargs):
+        return {"units": "days", "data": self.get_data("elapsed_time", *args, **kwargs).total_seconds() / 86400}
+
+    @depends_on("elapsed_time")
+    def days_since_start(self):
+        # Supplies the arguments of its input itself
+        elapsed = self.get_data("elapsed_time", experiment_datetime=datetime.datetime(2024, 6, 13, 9))
+        return {"units": "days", "data": elapsed.total_seconds() / 86400}
+
+    @depends_on("elapsed_time")
+    def scaled_time(self, factor: float = 1.0):
+        elapsed = self.get_data("elapsed_time", experiment_datetime=datetime.datetime(2024, 6, 13, 9))
+        return {"units": "days", "data": factor * elapsed.total_seconds() / 86400}
+
+    @depends_on("power")
+    def scaled_power(self, factor: float = 1.0):
+        self.calls.append("scaled_power")
+        return {"units": "W", "data": factor * self.get_data("power")}
+
+    @depends_on("scaled_power")
+    def power_fit(self, factor: float = 1.0, degree: int = 1):
+        self.calls.append("power_fit")
+        return {"units": "W", "data": np.polyfit(self.get_data("voltage"),
+                                                 self.get_data("scaled_power", factor=factor), degree)}
+
+    def validate_observables(self, *observables) -> None:
+        pass
+
+
+class TestProcessorDependencies(unittest.TestCase):
+    """Dependency graph of processing functions declared with depends_on."""
+    def test_inputs_are_evaluated_first(self):
+        processor = GraphProcessor(GraphData())
+        self.assertEqual(processor.get_evaluation_order("energy"), ["power", "energy"])
+        self.assertEqual(processor.get_data("energy"), 4.0)
+        self.assertEqual(processor.calls, ["power", "energy"])
+
+    def test_arguments_are_forwarded_to_inputs(self):
+        processor = GraphProcessor(GraphData())
+        days = processor.get_data("elapsed_days", experiment_datetime=datetime.datetime(2024, 6, 13, 9))
+        self.assertEqual(days, 1.0)
+        self.assertTrue(processor.has_result("elapsed_time", experiment_datetime=datetime.datetime(2024, 6, 13, 9)))
+
+    def test_inputs_needing_arguments_are_left_to_the_function(self):
+        processor = GraphProcessor(GraphData())
+        self.assertEqual(processor.get_data("days_since_start"), 1.0)
+
+    def test_only_named_arguments_are_forwarded_to_inputs(self):
+        processor = GraphProcessor(GraphData())
+        self.assertEqual(processor.get_data("scaled_time", factor=2.0), 2.0)
+        self.assertFalse(processor.has_result("elapsed_time", factor=2.0))
+
+        processor.get_data("power_fit", factor=2.0, degree=2)
+        self.assertEqual(processor.calls, ["power", "scaled_power", "power_fit"])
+        self.assertTrue(processor.has_result("scaled_power", factor=2.0))
+        self.assertEqual(processor.get_memo_stats()["entries"], 5)
+
+    def test_invalidate_clears_dependents_only(self):
+        processor = GraphProcessor(GraphData())
+        processor.get_data("energy")
+        processor.get_data("elapsed_days", experiment_datetime=datetime.datetime(2024, 6, 13, 9))
+
+        self.assertEqual(processor.invalidate("power"), {"power", "energy", "scaled_power", "power_fit"})
+        self.assertIsNone(processor.processed_data["energy"])
+        self.assertIsNotNone(processor.processed_data["elapsed_days"])
+
+    def test_new_arguments_keep_the_results_of_dependents(self):
+        processor = GraphProcessor(GraphData())
+        first, second = datetime.datetime(2024, 6, 13, 9), datetime.datetime(2024, 6, 12, 9)
+        for reference in (first, second, first):
+            processor.get_data("elapsed_days", experiment_datetime=reference)
+        self.assertTrue(processor.has_result("elapsed_days", experiment_datetime=second))
+        self.assertEqual(processor.get_memo_stats(), {"hits": 1, "misses": 4, "entries": 4})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import datetime
+import unittest
+import numpy as np
+from contracts.data_processors import DataProcessorCore, depends_on
+from contracts.data_types import DataCore
+
+
+def read_nothing(filepath: str) -> dict:
+    return {}
+
+
+class MemoData(DataCore):
+    def __init__(self):
+        super().__init__(file_reader=read_nothing)
+        self.raw_data = {
+            "voltage": {"units": "V", "data": np.array([0.0, 0.5, 1.0])},
+            "current": {"units": "A", "data": np.array([1.0, 2.0, 3.0])},
+            "datetime": {"units": None, "data": datetime.datetime(2024, 6, 14, 9)},
+        }
+        self._allowed_observables = self.raw_data.keys()
+
+    def read_file(self, filepath: str) -> None:
+        pass
+
+
+class MemoProcessor(DataProcessorCore):
+    def __init__(self, data: MemoData):
+        super().__init__(data)
+        self._processing_functions["power"] = self.power
+        self._processing_functions["scaled_power"] = self.scaled_power
+        self.processed_data = {key: None for key in self._processing_functions}
+        self._processed_observables = self.processed_data.keys()
+
+    @depends_on("voltage", "current")
+    def power(self):
+        return {"units": "W", "data": self.get_data("voltage") * self.get_data("current")}
+
+    @depends_on("power")
+    def scaled_power(self, factor: float = 1.0):
+        return {"units": "W", "data": factor * self.get_data("power")}
+
+    def validate_observables(self, *observables) -> None:
+        pass
+
+
+class TestProcessorMemo(unittest.TestCase):
+    """Memoisation of processed observables per argument set."""
+    def test_alternating_arguments_are_served_from_the_memo(self):
+        processor = MemoProcessor(MemoData())
+        processor.get_data("power")
+        first, second = datetime.datetime(2024, 6, 14), datetime.datetime(2024, 6, 13)
+
+        results = [processor.get_data("elapsed_time", experiment_datetime=reference)
+                   for reference in (first, second, first, second)]
+
+        self.assertEqual(results[0], datetime.timedelta(hours=9))
+        self.assertEqual(results[1], datetime.timedelta(hours=33))
+        self.assertEqual(results[2:], results[:2])
+        self.assertEqual(processor.get_memo_stats(), {"hits": 2, "misses": 3, "entries": 3})
+        # Unrelated results survive a change of arguments
+        self.assertIsNotNone(processor.processed_data["power"])
+
+    def test_calls_without_arguments_do_not_reuse_results_with_arguments(self):
+        processor = MemoProcessor(MemoData())
+        processor.get_data("scaled_power", factor=2.0)
+        np.testing.assert_array_equal(processor.get_data("scaled_power"), [0.0, 1.0, 3.0])
+        np.testing.assert_array_equal(processor.get_data("scaled_power", factor=2.0), [0.0, 2.0, 6.0])
+        self.assertEqual(processor.get_memo_stats(), {"hits": 3, "misses": 3, "entries": 3})
+
+    def test_memo_is_bounded(self):
+        processor = MemoProcessor(MemoData())
+        processor.memo_size = 2
+        for day in range(1, 5):
+            processor.get_data("elapsed_time", experiment_datetime=datetime.datetime(2024, 6, day))
+        self.assertEqual(processor.get_memo_stats()["entries"], 2)
+
+    def test_invalidate_clears_only_the_named_observable_and_its_dependents(self):
+        processor = MemoProcessor(MemoData())
+        processor.get_data("power")
+        processor.get_data("elapsed_time", experiment_datetime=datetime.datetime(2024, 6, 14))
+
+        self.assertEqual(processor.invalidate("power"), {"power", "scaled_power"})
+        self.assertIsNone(processor.processed_data["power"])
+        self.assertIsNotNone(processor.processed_data["elapsed_time"])
+        self.assertTrue(processor.has_result("elapsed_time", experiment_datetime=datetime.datetime(2024, 6, 14)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from PyQt5 import QtCore
+from contracts.device_worker import DeviceWorkerCore
+from contracts.plotter_options import PlotterOptions
+from dataset_manager import DataSet
+from gui.utils.job_scheduler import JobScheduler
+
+application = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+
+class FailingWorker(DeviceWorkerCore):
+    def set_data(self, dataset: DataSet):
+        raise OSError("file not found")
+
+
+class IdleWorker(DeviceWorkerCore):
+    def set_data(self, dataset: DataSet):
+        self.data_processors = {}
+
+    def plot_nothing(self, title: str):
+        pass
+
+
+class TestJobScheduler(unittest.TestCase):
+    """Plot jobs queued and run by the scheduler."""
+    def _run_until_done(self, scheduler: JobScheduler, timeout_ms: int = 5000) -> None:
+        loop = QtCore.QEventLoop()
+        scheduler.jobs_changed.connect(
+            lambda: loop.quit() if not scheduler.get_jobs("queued") and not scheduler.get_jobs("running") else None
+        )
+        QtCore.QTimer.singleShot(timeout_ms, loop.quit)
+        loop.exec_()
+
+    def _get_worker(self, worker_type):
+        return worker_type("Values", DataSet("2024.01.01_00.00.00"), "plot_nothing", PlotterOptions())
+
+    def test_failed_jobs_free_their_slot(self):
+        scheduler = JobScheduler(max_jobs=1)
+        for index in range(3):
+            scheduler.submit(self._get_worker(FailingWorker), f"job {index}")
+        scheduler.submit(self._get_worker(IdleWorker), "job 3")
+        self._run_until_done(scheduler)
+
+        self.assertEqual([job.status for job in scheduler.get_jobs()], ["failed"] * 3 + ["finished"])
+        self.assertEqual(scheduler.get_jobs()[0].error, "OSError('file not found')")
+        self.assertIsNone(scheduler.get_jobs()[3].error)
+
+    def test_cancel_drops_only_that_job(self):
+        scheduler = JobScheduler(max_jobs=1)
+        jobs = [scheduler.submit(self._get_worker(IdleWorker), f"job {index}") for index in range(3)]
+        self.assertIs(scheduler.get_active_job(), jobs[2])
+
+        scheduler.cancel(jobs[1])
+        self.assertEqual(jobs[1].status, "cancelled")
+        self.assertIs(scheduler.get_active_job(), jobs[2])
+        self._run_until_done(scheduler)
+
+        self.assertEqual([job.status for job in jobs], ["finished", "cancelled", "finished"])
+        self.assertIsNone(scheduler.get_active_job())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+import numpy as np
+from utils.aggregation import RunningStatistics
+
+
+class TestRunningStatistics(unittest.TestCase):
+    """Streaming statistics compared with NumPy over the full stack."""
+    def test_matches_numpy_for_equal_lengths(self):
+        rng = np.random.default_rng(0)
+        series = rng.normal(size=(50, 20)) * 1e3 + 1e6
+        statistics = RunningStatistics()
+        for values in series:
+            statistics.update(values)
+        result = statistics.result(ddof=1)
+
+        np.testing.assert_array_equal(result["count"], np.full(20, 50))
+        np.testing.assert_allclose(result["mean"], series.mean(axis=0))
+        np.testing.assert_allclose(result["std"], series.std(axis=0, ddof=1))
+        np.testing.assert_array_equal(result["min"], series.min(axis=0))
+        np.testing.assert_array_equal(result["max"], series.max(axis=0))
+
+    def test_ragged_series_align_on_their_first_point(self):
+        statistics = RunningStatistics()
+        statistics.update([1.0, 2.0, 3.0])
+        statistics.update([3.0])
+        result = statistics.result()
+
+        np.testing.assert_array_equal(result["count"], [2, 1, 1])
+        np.testing.assert_array_equal(result["mean"], [2.0, 2.0, 3.0])
+        np.testing.assert_array_equal(result["std"], [1.0, 0.0, 0.0])
+        self.assertEqual(statistics.nr_of_series, 2)
+
+    def test_nan_values_are_skipped(self):
+        statistics = RunningStatistics()
+        statistics.update([np.nan, 1.0])
+        statistics.update([np.nan, 3.0])
+        result = statistics.result()
+
+        np.testing.assert_array_equal(result["count"], [0, 2])
+        self.assertTrue(np.isnan(result["mean"][0]))
+        self.assertTrue(np.isnan(result["min"][0]))
+        self.assertEqual(result["mean"][1], 2.0)
+
+    def test_scalars_give_scalar_results(self):
+        statistics = RunningStatistics()
+        for value in (1.0, 2.0, 3.0):
+            statistics.update(value)
+        result = statistics.result()
+        self.assertEqual(result["count"], 3)
+        self.assertEqual(result["mean"], 2.0)
+        self.assertAlmostEqual(result["std"], np.std([1.0, 2.0, 3.0]))
+
+    def test_too_few_series_for_ddof_give_nan(self):
+        statistics = RunningStatistics()
+        statistics.update([1.0])
+        self.assertTrue(np.isnan(statistics.get_std(ddof=1)[0]))
+
+    def test_two_dimensional_values_are_rejected(self):
+        with self.assertRaises(ValueError):
+            RunningStatistics().update(np.zeros((2, 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+import numpy as np
+from utils.batching import AppendableBatch, batch_values, split_batch
+
+
+class TestBatchValues(unittest.TestCase):
+    """Layouts of per-file values combined into one array."""
+    def test_equal_shapes_are_stacked(self):
+        batched = batch_values([np.arange(3), np.arange(3) + 10])
+        self.assertEqual(batched["layout"], "stacked")
+        self.assertEqual(batched["data"].shape, (2, 3))
+        np.testing.assert_array_equal(batched["lengths"], [3, 3])
+        self.assertIsNone(batched["offsets"])
+
+    def test_scalars_become_a_series(self):
+        batched = batch_values([1.0, 2.0, 3.0])
+        self.assertEqual(batched["layout"], "stacked")
+        np.testing.assert_array_equal(batched["data"], [1.0, 2.0, 3.0])
+        np.testing.assert_array_equal(batched["lengths"], [1, 1, 1])
+
+    def test_ragged_integers_are_padded_with_nan(self):
+        batched = batch_values([np.array([1, 2, 3]), np.array([4])])
+        self.assertEqual(batched["layout"], "padded")
+        self.assertEqual(batched["data"].dtype.kind, "f")
+        np.testing.assert_array_equal(batched["data"], [[1, 2, 3], [4, np.nan, np.nan]])
+
+    def test_ragged_datetimes_are_padded_with_nat(self):
+        start = np.datetime64("2024-06-14T09:00")
+        batched = batch_values([np.array([start, start + 1]), np.array([start])])
+        self.assertTrue(np.isnat(batched["data"][1, 1]))
+
+    def test_ragged_series_with_offsets(self):
+        batched = batch_values([np.array([1.0, 2.0]), np.array([3.0, 4.0, 5.0])], ragged="offsets")
+        self.assertEqual(batched["layout"], "offsets")
+        np.testing.assert_array_equal(batched["data"], [1.0, 2.0, 3.0, 4.0, 5.0])
+        np.testing.assert_array_equal(batched["offsets"], [0, 2, 5])
+
+    def test_split_batch_undoes_every_layout(self):
+        values = [np.array([1.0, 2.0]), np.array([3.0, 4.0, 5.0])]
+        for ragged in ("padded", "offsets"):
+            for split, value in zip(split_batch(batch_values(values, ragged)), values):
+                np.testing.assert_array_equal(split, value)
+
+    def test_invalid_input_is_rejected(self):
+        with self.assertRaises(ValueError):
+            batch_values([np.arange(2)], ragged="sparse")
+        with self.assertRaises(ValueError):
+            batch_values([np.zeros((2, 2)), np.zeros((3, 2))])
+
+    def test_empty_input(self):
+        batched = batch_values([])
+        self.assertEqual(batched["data"].size, 0)
+        self.assertEqual(batched["lengths"].size, 0)
+
+
+class TestAppendableBatch(unittest.TestCase):
+    """Growing concatenation of per-label values."""
+    def _extend(self, batch, *labels):
+        for label in labels:
+            batch.extend(label, np.full(int(label[1:]), float(label[1:])), source_key=label, units="V")
+
+    def test_appended_labels_match_batch_values(self):
+        batch = AppendableBatch()
+        self._extend(batch, "a3", "b20", "c1")
+        batched = batch.to_batched()
+        expected = batch_values([np.full(3, 3.0), np.full(20, 20.0), np.full(1, 1.0)], ragged="offsets")
+
+        self.assertEqual(batched["labels"], ["a3", "b20", "c1"])
+        self.assertEqual(batched["units"], "V")
+        np.testing.assert_array_equal(batched["data"], expected["data"])
+        np.testing.assert_array_equal(batched["offsets"], expected["offsets"])
+
+    def test_earlier_results_survive_truncation_and_appends(self):
+        batch = AppendableBatch()
+        self._extend(batch, "a3", "b2")
+        earlier = batch.to_batched()["data"].copy()
+        view = batch.to_batched()["data"]
+        batch.truncate(1)
+        self._extend(batch, "c40")
+
+        np.testing.assert_array_equal(view, earlier)
+        self.assertEqual(batch.labels, ["a3", "c40"])
+        np.testing.assert_array_equal(batch.to_batched()["offsets"], [0, 3, 43])
+
+    def test_valid_prefix_compares_labels_and_source_keys(self):
+        batch = AppendableBatch()
+        self._extend(batch, "a1", "b2", "c3")
+        self.assertEqual(batch.valid_prefix(["a1", "b2", "c3", "d4"], ["a1", "b2", "c3", "d4"]), 3)
+        self.assertEqual(batch.valid_prefix(["a1", "b2", "c3"], ["a1", "changed", "c3"]), 1)
+        self.assertEqual(batch.valid_prefix(["a1", "c3"], ["a1", "c3"]), 1)
+        self.assertEqual(batch.valid_prefix(["a1"], [None]), 0)
+
+    def test_dtype_is_promoted(self):
+        batch = AppendableBatch()
+        batch.extend("ints", np.array([1, 2]))
+        batch.extend("floats", np.array([0.5]))
+        np.testing.assert_array_equal(batch.to_batched()["data"], [1.0, 2.0, 0.5])
+
+    def test_mismatched_units_and_shapes_are_rejected(self):
+        batch = AppendableBatch()
+        batch.extend("a", [1.0], units="V")
+        with self.assertRaises(ValueError):
+            batch.extend("b", [1.0], units="A")
+        with self.assertRaises(ValueError):
+            batch.extend("c", np.zeros((2, 2)), units="V")
+
+    def test_truncating_everything_resets_the_batch(self):
+        batch = AppendableBatch()
+        batch.extend("a", [1.0], units="V")
+        batch.truncate(0)
+        batch.extend("b", [2.0], units="A")
+        self.assertEqual(batch.to_batched()["units"], "A")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import threading
+import unittest
+from utils.cancellation import CancellationToken, raise_if_cancelled, set_current_token
+from utils.errors.errors import RunCancelledError
+
+
+class TestCancellation(unittest.TestCase):
+    """Cooperative cancellation through per-thread tokens."""
+    def tearDown(self):
+        set_current_token(None)
+
+    def test_token_raises_once_cancelled(self):
+        token = CancellationToken()
+        token.raise_if_cancelled()
+        token.cancel()
+        self.assertTrue(token.is_cancelled())
+        with self.assertRaises(RunCancelledError):
+            token.raise_if_cancelled()
+
+    def test_threads_only_see_their_own_token(self):
+        cancelled = CancellationToken()
+        cancelled.cancel()
+        set_current_token(cancelled)
+        errors = []
+
+        def run():
+            set_current_token(CancellationToken())
+            try:
+                raise_if_cancelled()
+            except RunCancelledError as error:
+                errors.append(error)
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join(timeout=5)
+
+        self.assertEqual(errors, [])
+        with self.assertRaises(RunCancelledError):
+            raise_if_cancelled()
+
+    def test_threads_without_a_token_are_never_cancelled(self):
+        set_current_token(None)
+        raise_if_cancelled()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+import numpy as np
+from utils.decimation import decimation_indices, lttb_indices, minmax_indices
+
+
+class TestDecimation(unittest.TestCase):
+    """Point selection of the minmax and LTTB decimation methods."""
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.y = rng.normal(size=100_000)
+        self.y[54_321] = 50.0
+        self.y[12_345] = -50.0
+
+    def test_minmax_keeps_extremes_and_end_points(self):
+        indices = minmax_indices(self.y, 500)
+        self.assertLessEqual(len(indices), 2 * 500 + 2)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+        for index in (0, len(self.y) - 1, 54_321, 12_345):
+            self.assertIn(index, indices)
+
+    def test_minmax_ignores_nans(self):
+        y = np.array([np.nan, 1.0, 5.0, np.nan, -3.0, 2.0, np.nan, np.nan, 0.0, 1.0])
+        indices = minmax_indices(y, 2)
+        self.assertIn(2, indices)
+        self.assertIn(4, indices)
+
+    def test_lttb_keeps_the_requested_number_of_points(self):
+        indices = lttb_indices(self.y, 1000)
+        self.assertEqual(len(indices), 1000)
+        self.assertEqual((indices[0], indices[-1]), (0, len(self.y) - 1))
+        self.assertTrue(np.all(np.diff(indices) > 0))
+        self.assertIn(54_321, indices)
+
+    def test_short_series_are_kept_whole(self):
+        y = np.arange(10.0)
+        np.testing.assert_array_equal(minmax_indices(y, 100), np.arange(10))
+        np.testing.assert_array_equal(lttb_indices(y, 100), np.arange(10))
+
+    def test_decimation_indices_validates_its_arguments(self):
+        self.assertEqual(len(decimation_indices(self.y, "lttb", 100)), 200)
+        with self.assertRaises(ValueError):
+            decimation_indices(self.y, "average", 100)
+        with self.assertRaises(ValueError):
+            decimation_indices(self.y, "minmax", 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import pickle
+import unittest
+import numpy as np
+from utils.expressions import CompiledExpression, compile_declarations, compile_expression, get_configured_expressions, \
+    set_configured_expressions
+
+
+class TestCompiledExpression(unittest.TestCase):
+    """Parsing, evaluation and units of derived observable expressions."""
+    def test_names_and_evaluation(self):
+        expression = compile_expression("sqrt(voltage ** 2) * current - 1")
+        self.assertEqual(expression.names, ("voltage", "current"))
+        np.testing.assert_allclose(expression.evaluate({"voltage": [1.0, -2.0], "current": [3.0, 4.0]}), [2.0, 7.0])
+
+    def test_rejected_syntax(self):
+        rejected = [
+            "voltage.__class__",
+            "__import__('os')",
+            "open('file')",
+            "sqrt(voltage, 2)",
+            "abs(x=voltage)",
+            "voltage[0]",
+            "[voltage]",
+            "lambda: voltage",
+            "voltage if current else 0",
+            "voltage == current",
+            "'text'",
+            "True * voltage",
+            "voltage +",
+            "voltage // 2",
+        ]
+        for expression in rejected:
+            with self.subTest(expression=expression):
+                with self.assertRaises(ValueError):
+                    CompiledExpression(expression)
+
+    def test_evaluation_has_no_builtins(self):
+        # Names that are not observables must be supplied like observables, builtins are not available
+        with self.assertRaises(ValueError):
+            compile_expression("len").evaluate({})
+
+    def test_units(self):
+        units = {"voltage": "V", "current": "A", "area": "cm^2"}
+        self.assertEqual(compile_expression("voltage * current").get_units(units), "V*A")
+        self.assertEqual(compile_expression("current / area").get_units(units), "A/cm^2")
+        self.assertEqual(compile_expression("voltage ** 2").get_units(units), "V^2")
+        self.assertEqual(compile_expression("log10(current)").get_units(units), None)
+        self.assertEqual(compile_expression("abs(voltage) - 1").get_units(units), "V")
+        with self.assertRaises(ValueError):
+            compile_expression("voltage + current").get_units(units)
+        with self.assertRaises(ValueError):
+            compile_expression("voltage ** current").get_units(units)
+
+    def test_compiled_expressions_are_shared_and_picklable(self):
+        self.assertIs(compile_expression("voltage * 2"), compile_expression("voltage * 2"))
+        restored = pickle.loads(pickle.dumps(compile_expression("voltage * 2")))
+        self.assertEqual(restored.evaluate({"voltage": 3.0}), 6.0)
+
+
+class TestConfiguredExpressions(unittest.TestCase):
+    """Derived observables declared in the config, checked when it is loaded."""
+    def tearDown(self):
+        set_configured_expressions({})
+
+    def test_declarations_are_compiled(self):
+        compiled = compile_declarations({"power": "voltage * current", "density": {"expression": "power / 2", "units": "W"}}, "IV")
+        self.assertEqual(compiled["power"][0].names, ("voltage", "current"))
+        self.assertEqual(compiled["density"][1], "W")
+
+    def test_invalid_declarations_are_rejected(self):
+        invalid = [
+            {"not a name": "voltage"},
+            {"log": "voltage"},
+            {"power": "voltage *"},
+            {"power": {"expression": "voltage", "unit": "V"}},
+            {"power": {"units": "V"}},
+            {"power": "power * 2"},
+            {"first": "second + 1", "second": "first - 1"},
+        ]
+        for declarations in invalid:
+            with self.subTest(declarations=declarations), self.assertRaises(ValueError):
+                compile_declarations(declarations, "IV")
+
+    def test_invalid_config_is_rejected_when_loaded(self):
+        set_configured_expressions({"IV": {"power": "voltage * current"}})
+        with self.assertRaises(ValueError):
+            set_configured_expressions({"IV": {"power": "voltage *"}})
+        with self.assertRaises(ValueError):
+            set_configured_expressions({"IV": ["power"]})
+        self.assertEqual(get_configured_expressions("IV"), {"power": "voltage * current"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+from utils.progress import ProgressTracker
+
+
+class TestProgressTracker(unittest.TestCase):
+    """Size-weighted progress and rate-limited reports."""
+    def test_progress_is_weighted_by_size(self):
+        tracker = ProgressTracker({"large": 900, "small": 100}, interval=0)
+        tracker.advance("small")
+        self.assertEqual(tracker.get_progress(), 10)
+        tracker.advance("large")
+        self.assertEqual(tracker.get_progress(), 100)
+
+    def test_unknown_sizes_count_files(self):
+        tracker = ProgressTracker({"a": 0, "b": 0, "c": 0, "d": 0}, interval=0)
+        tracker.advance("a")
+        self.assertEqual(tracker.get_progress(), 25)
+
+    def test_reports_are_rate_limited_but_the_last_is_always_due(self):
+        tracker = ProgressTracker({str(index): 1 for index in range(4)}, interval=3600)
+        self.assertTrue(tracker.advance("0"))
+        self.assertFalse(tracker.advance("1"))
+        self.assertFalse(tracker.advance("2"))
+        self.assertTrue(tracker.advance("3"))
+
+    def test_status_reports_throughput_and_eta(self):
+        tracker = ProgressTracker({"a": 1024 ** 2, "b": 1024 ** 2})
+        self.assertIn("ETA unknown", tracker.get_status())
+        tracker.advance("a")
+        self.assertIsNotNone(tracker.get_eta())
+        self.assertRegex(tracker.get_status(), r"^[\d.]+ MB/s, [\d.]+ files/s, ETA \d+:\d\d:\d\d$")
+
+    def test_negative_interval_is_rejected(self):
+        with self.assertRaises(ValueError):
+            ProgressTracker({}, interval=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from utils.read_delimited import DelimitedReader, StreamingDelimitedReader
+
+
+class TestDelimitedReader(unittest.TestCase):
+    """Layout sniffing and parsing of delimited text files."""
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _write(self, content: str) -> str:
+        filepath = os.path.join(self.directory, "measurement.txt")
+        with open(filepath, "w", encoding="utf-8") as file:
+            file.write(content)
+        return filepath
+
+    def test_delimiters_are_sniffed(self):
+        for delimiter in ("\t", ";", ",", " ", "   "):
+            with self.subTest(delimiter=delimiter):
+                filepath = self._write(f"1.5{delimiter}2\n3{delimiter}4.25\n")
+                columns = DelimitedReader()(filepath)
+                np.testing.assert_array_equal(columns["0"], [1.5, 3.0])
+                np.testing.assert_array_equal(columns["1"], [2.0, 4.25])
+
+    def test_header_names_the_columns(self):
+        filepath = self._write('"Voltage";"Current"\n0.1;1e-3\n0.2;2e-3\n')
+        columns = DelimitedReader()(filepath)
+        self.assertEqual(list(columns), ["Voltage", "Current"])
+        np.testing.assert_array_equal(columns["Current"], [1e-3, 2e-3])
+
+    def test_decimal_commas(self):
+        for content in ("1,5;2,5\n3,5;4,5\n", "1,5\t2,5\n3,5\t4,5\n", "1,5 2,5\n3,5 4,5\n"):
+            with self.subTest(content=content):
+                columns = DelimitedReader()(self._write(content))
+                np.testing.assert_array_equal(columns["0"], [1.5, 3.5])
+                np.testing.assert_array_equal(columns["1"], [2.5, 4.5])
+
+    def test_comma_delimited_integers_are_not_decimal_commas(self):
+        columns = DelimitedReader()(self._write("1,2,3\n4,5,6\n"))
+        self.assertEqual(len(columns), 3)
+        np.testing.assert_array_equal(columns["2"], [3.0, 6.0])
+
+    def test_forced_decimal_comma_cannot_be_the_delimiter(self):
+        with self.assertRaises(ValueError):
+            DelimitedReader(delimiter=",", decimal=",")(self._write("1,2\n"))
+        with self.assertRaises(ValueError):
+            DelimitedReader(decimal=";")
+
+    def test_comments_are_skipped_and_kept_on_request(self):
+        filepath = self._write("# sample A\n\n# 25 C\nV\tI\n1\t2 # first\n# skipped\n3\t4\n")
+        columns = DelimitedReader(keep_comments=True)(filepath)
+        self.assertEqual(columns["comments"], ["# sample A", "# 25 C"])
+        np.testing.assert_array_equal(columns["V"], [1.0, 3.0])
+        np.testing.assert_array_equal(columns["I"], [2.0, 4.0])
+
+    def test_columns_and_dtypes(self):
+        filepath = self._write("a,b,c\n1,2,3\n4,5,6\n")
+        columns = DelimitedReader(dtype={"c": np.int32})(filepath, columns=["c", "a"])
+        self.assertEqual(list(columns), ["c", "a"])
+        self.assertEqual(columns["c"].dtype, np.int32)
+        self.assertEqual(columns["a"].dtype, np.float64)
+        with self.assertRaises(KeyError):
+            DelimitedReader()(filepath, columns=["d"])
+
+    def test_forced_header_on_numeric_first_line(self):
+        columns = DelimitedReader(header=True)(self._write("1\t2\n3\t4\n"))
+        self.assertEqual(list(columns), ["1", "2"])
+        np.testing.assert_array_equal(columns["1"], [3.0])
+
+    def test_streaming_chunks_match_the_whole_file(self):
+        filepath = self._write("x;y\n" + "".join(f"{index},5;{index}\n" for index in range(25)))
+        whole = DelimitedReader()(filepath)
+        chunks = list(StreamingDelimitedReader()(filepath, chunk_size=10))
+        self.assertEqual([len(chunk["x"]) for chunk in chunks], [10, 10, 5])
+        np.testing.assert_array_equal(np.concatenate([chunk["x"] for chunk in chunks]), whole["x"])
+
+    def test_readers_are_picklable_and_versioned_by_settings(self):
+        reader = DelimitedReader(comments="%", dtype="float32")
+        self.assertEqual(pickle.loads(pickle.dumps(reader)).version, reader.version)
+        self.assertNotEqual(reader.version, DelimitedReader().version)
+
+
+if __name__ == "__main__":
+    unittest.main()
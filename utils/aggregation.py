@@ -0,0 +1,71 @@
+from typing import Any
+import numpy as np
+
+
+class RunningStatistics:
+    """
+    Point-wise count, mean, standard deviation, minimum and maximum over many series, in one pass.
+
+    Series are added one at a time with `update` and combined with Welford's
+    algorithm, so memory is bounded by the longest series rather than the number
+    of series. Series of different lengths are aligned on their first point, each
+    point only counts the series that reach it. NaN values are skipped. Scalars
+    are treated as series of one point and give scalar results.
+    """
+    def __init__(self):
+        self.count = np.zeros(0, dtype=np.int64)
+        self.mean = np.zeros(0)
+        self._m2 = np.zeros(0)
+        self.min = np.zeros(0)
+        self.max = np.zeros(0)
+        self._scalar = True
+        self.nr_of_series = 0
+
+    def update(self, value: Any) -> None:
+        series = np.asarray(value, dtype=np.float64)
+        if series.ndim > 1:
+            raise ValueError("Only scalars and 1-D series can be aggregated")
+        self._scalar = self._scalar and series.ndim == 0
+        series = np.atleast_1d(series)
+        self._grow(len(series))
+        self.nr_of_series += 1
+
+        # Only the points this series reaches, and that are not NaN, are updated
+        points = slice(0, len(series))
+        valid = ~np.isnan(series)
+        count = self.count[points] + valid
+        delta = np.where(valid, series - self.mean[points], 0.0)
+        self.mean[points] += np.divide(delta, count, out=np.zeros_like(delta), where=count > 0)
+        self._m2[points] += np.where(valid, delta * (series - self.mean[points]), 0.0)
+        self.count[points] = count
+        self.min[points] = np.fmin(self.min[points], series)
+        self.max[points] = np.fmax(self.max[points], series)
+
+    def _grow(self, length: int) -> None:
+        extra = length - len(self.count)
+        if extra <= 0:
+            return
+        self.count = np.concatenate((self.count, np.zeros(extra, dtype=np.int64)))
+        self.mean = np.concatenate((self.mean, np.zeros(extra)))
+        self._m2 = np.concatenate((self._m2, np.zeros(extra)))
+        self.min = np.concatenate((self.min, np.full(extra, np.inf)))
+        self.max = np.concatenate((self.max, np.full(extra, -np.inf)))
+
+    def get_std(self, ddof: int = 0) -> np.ndarray:
+        """ Standard deviation per point, NaN where fewer than ddof + 1 series contribute """
+        dof = self.count - ddof
+        return np.sqrt(np.divide(self._m2, dof, out=np.full_like(self._m2, np.nan), where=dof > 0))
+
+    def result(self, ddof: int = 0) -> dict[str, Any]:
+        """ Statistics per point as {"count", "mean", "std", "min", "max"}, NaN where no series contributes """
+        empty = self.count == 0
+        statistics = {
+            "count": self.count.copy(),
+            "mean": np.where(empty, np.nan, self.mean),
+            "std": self.get_std(ddof),
+            "min": np.where(empty, np.nan, self.min),
+            "max": np.where(empty, np.nan, self.max),
+        }
+        if self._scalar and len(self.count) == 1:
+            return {name: values[0] for name, values in statistics.items()}
+        return statistics
@@ -0,0 +1,142 @@
+from typing import Any
+import threading
+import numpy as np
+
+LAYOUTS = ("padded", "offsets")
+
+
+def batch_values(values: list[Any], ragged: str = "padded", fill_value=None) -> dict:
+    """
+    Combine per-file values of an observable into a single array.
+
+    Values of equal shape are stacked along a new first axis (layout "stacked"),
+    scalars become a 1-D array. Ragged 1-D series are either padded with
+    `fill_value` to the longest series (layout "padded", integer data is promoted
+    to hold the fill value, which defaults to NaN, or NaT for datetimes) or concatenated with the start of every series in
+    `offsets` (layout "offsets", series i is `data[offsets[i]:offsets[i + 1]]`).
+
+    Returns a dict with `layout`, `data`, `lengths` (points per value, 1 for
+    scalars) and `offsets` (None unless the layout is "offsets").
+    """
+    if ragged not in LAYOUTS:
+        raise ValueError(f"ragged must be one of {LAYOUTS}")
+
+    arrays = [np.asarray(value) for value in values]
+    lengths = np.array([array.shape[0] if array.ndim else 1 for array in arrays], dtype=np.int64)
+    if len({array.shape for array in arrays}) <= 1:
+        data = np.stack(arrays) if arrays else np.empty(0)
+        return {"layout": "stacked", "data": data, "lengths": lengths, "offsets": None}
+
+    if any(array.ndim != 1 for array in arrays):
+        raise ValueError("Only 1-D series of different lengths can be batched")
+
+    if ragged == "offsets":
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
+        return {"layout": "offsets", "data": np.concatenate(arrays), "lengths": lengths, "offsets": offsets}
+
+    if fill_value is None:
+        fill_value = np.datetime64("NaT") if arrays[0].dtype.kind in "mM" else np.nan
+    dtype = np.result_type(*arrays)
+    if dtype.kind in "biu" and isinstance(fill_value, float):
+        dtype = np.result_type(dtype, np.float64)
+    data = np.full((len(arrays), int(lengths.max())), fill_value, dtype=dtype)
+    for row, array in enumerate(arrays):
+        data[row, :len(array)] = array
+    return {"layout": "padded", "data": data, "lengths": lengths, "offsets": None}
+
+
+def split_batch(batched: dict) -> list[np.ndarray]:
+    """ Undo `batch_values`, returning one array per value without padding """
+    data, lengths = batched["data"], batched["lengths"]
+    if batched["layout"] == "offsets":
+        offsets = batched["offsets"]
+        return [data[offsets[index]:offsets[index + 1]] for index in range(len(lengths))]
+    if batched["layout"] == "padded":
+        return [data[index, :length] for index, length in enumerate(lengths)]
+    return list(data)
+
+
+class AppendableBatch:
+    """
+    Per-label values of an observable concatenated into one growing array.
+
+    Built for datasets that grow over time (e.g. stability experiments adding a
+    file every few minutes): values are appended in label order to a buffer that
+    doubles its capacity when full, so adding a label costs O(its length) instead
+    of re-concatenating everything before it. Every label keeps a `source_key`
+    (e.g. its file fingerprint), `valid_prefix` finds the labels that can be kept
+    for a new label order and `truncate` drops the rest.
+
+    `to_batched` returns the result in the "offsets" layout of `batch_values`,
+    its data is a view that stays valid while more labels are appended or
+    truncated. Threads sharing a batch hold `lock` while updating it.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.labels: list[str] = []
+        self.source_keys: list = []
+        self.units = None
+        self._lengths: list[int] = []
+        self._buffer: np.ndarray | None = None
+        self._size = 0
+
+    def extend(self, label: str, value: Any, source_key=None, units: str = None) -> None:
+        array = np.atleast_1d(np.asarray(value))
+        if array.ndim != 1:
+            raise ValueError("Only scalars and 1-D series can be appended")
+        if self.labels and units != self.units:
+            raise ValueError(f"{label} has units {units}, earlier labels have {self.units}")
+
+        self._reserve(self._size + len(array), array.dtype)
+        self._buffer[self._size:self._size + len(array)] = array
+        self._size += len(array)
+        self._lengths.append(len(array))
+        self.labels.append(label)
+        self.source_keys.append(source_key)
+        self.units = units
+
+    def _reserve(self, size: int, dtype) -> None:
+        if self._buffer is None:
+            self._buffer = np.empty(max(size, 16), dtype=dtype)
+            return
+        dtype = np.result_type(self._buffer.dtype, dtype)
+        if size <= len(self._buffer) and dtype == self._buffer.dtype:
+            return
+        buffer = np.empty(max(size, 2 * len(self._buffer)), dtype=dtype)
+        buffer[:self._size] = self._buffer[:self._size]
+        self._buffer = buffer
+
+    def valid_prefix(self, labels: list[str], source_keys: list) -> int:
+        """ Number of leading labels that match labels and source_keys, a None source key never matches """
+        count = 0
+        for stored, label, source_key, stored_key in zip(self.labels, labels, source_keys, self.source_keys):
+            if stored != label or source_key is None or source_key != stored_key:
+                break
+            count += 1
+        return count
+
+    def truncate(self, count: int) -> None:
+        """ Keep only the first count labels """
+        if count >= len(self.labels):
+            return
+        self._size = sum(self._lengths[:count])
+        del self.labels[count:], self.source_keys[count:], self._lengths[count:]
+        if not self.labels:
+            self._buffer, self.units = None, None
+            return
+        # Arrays returned by to_batched are views, later appends must not overwrite them
+        buffer = np.empty_like(self._buffer)
+        buffer[:self._size] = self._buffer[:self._size]
+        self._buffer = buffer
+
+    def to_batched(self) -> dict:
+        lengths = np.array(self._lengths, dtype=np.int64)
+        data = self._buffer[:self._size] if self._buffer is not None else np.empty(0)
+        return {
+            "labels": list(self.labels),
+            "units": self.units,
+            "layout": "offsets",
+            "data": data,
+            "lengths": lengths,
+            "offsets": np.concatenate(([0], np.cumsum(lengths))),
+        }
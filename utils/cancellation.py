@@ -0,0 +1,40 @@
+import threading
+from utils.errors.errors import RunCancelledError
+
+
+class CancellationToken:
+    """
+    Thread-safe flag through which the GUI asks a running worker to stop.
+
+    Cancellation is cooperative: long loops call `raise_if_cancelled` at safe
+    points (between files, before computing an observable), which raises
+    `RunCancelledError` so the run unwinds and cleans up on its way out.
+    """
+    def __init__(self):
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._cancelled.is_set():
+            raise RunCancelledError("Run was cancelled")
+
+
+# Token of the run executing on each thread, so processing code can check it without a reference to the worker
+_current = threading.local()
+
+
+def set_current_token(token: CancellationToken | None) -> None:
+    """ Make token the cancellation token of the calling thread, None clears it """
+    _current.token = token
+
+
+def raise_if_cancelled() -> None:
+    """ Raise `RunCancelledError` if the run executing on the calling thread was cancelled """
+    token = getattr(_current, "token", None)
+    if token is not None:
+        token.raise_if_cancelled()
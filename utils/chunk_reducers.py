@@ -0,0 +1,84 @@
+from typing import Any
+import numpy as np
+
+
+class ConcatenateReducer:
+    """
+    Join the chunks of a streamed key back into a single list or array.
+
+    This reproduces what a regular reader would have returned, so memory is
+    bounded by the file size rather than the chunk size.
+    """
+    def __init__(self):
+        self._parts = []
+
+    def update(self, chunk: Any) -> None:
+        self._parts.append(chunk)
+
+    def result(self) -> Any:
+        if any(isinstance(part, np.ndarray) for part in self._parts):
+            return np.concatenate(self._parts)
+        return [value for part in self._parts for value in part]
+
+
+class DecimateReducer:
+    """
+    Keep every `step`-th value of a streamed key, counted across chunk boundaries.
+    """
+    def __init__(self, step: int):
+        if not isinstance(step, int) or step < 1:
+            raise ValueError("step must be a positive integer")
+        self.step = step
+        self._offset = 0
+        self._kept = ConcatenateReducer()
+
+    def update(self, chunk: Any) -> None:
+        # Index of the first value in this chunk that lands on the global stride
+        start = (-self._offset) % self.step
+        self._kept.update(chunk[start::self.step])
+        self._offset += len(chunk)
+
+    def result(self) -> Any:
+        return self._kept.result()
+
+
+class MeanReducer:
+    """
+    Average all values of a streamed key without keeping them.
+    """
+    def __init__(self):
+        self._total = 0.0
+        self._count = 0
+
+    def update(self, chunk: Any) -> None:
+        self._total += float(np.sum(chunk))
+        self._count += len(chunk)
+
+    def result(self) -> float:
+        if self._count == 0:
+            raise ValueError("Cannot average an empty stream")
+        return self._total / self._count
+
+
+class FirstReducer:
+    """
+    Keep the value from the first chunk, used for metadata repeated in every chunk.
+    """
+    def __init__(self):
+        self._value = None
+        self._is_set = False
+
+    def update(self, chunk: Any) -> None:
+        if not self._is_set:
+            self._value = chunk
+            self._is_set = True
+
+    def result(self) -> Any:
+        return self._value
+
+
+def default_reducer(chunk: Any):
+    """ Concatenate sequences and keep the first value of anything else """
+    if isinstance(chunk, (list, tuple, np.ndarray)):
+        return ConcatenateReducer()
+    return FirstReducer()
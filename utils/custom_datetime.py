@@ -1,5 +1,7 @@
 import re
 from datetime import datetime
+from functools import lru_cache
+import numpy as np
 import unittest
 
 
@@ -10,6 +12,11 @@ class CustomDatetime:
     The helper supports flexible separators and format strings used to construct
     filenames and labels, and provides round-tripping between strings and
     :class:`datetime.datetime` objects.
+
+    Patterns are compiled once per instance, and `shared` returns one instance per
+    set of arguments, so parsing many filenames does not rebuild them. Purely
+    numeric dates and times skip `strptime`, and `create_datetimes_from_strings`
+    parses a whole list at once, optionally into a datetime64 array.
     """
     def __init__(self,
                  separators="-_",
@@ -25,6 +32,15 @@ class CustomDatetime:
         # If user didn't pass custom patterns, use default YYYY_MM_DD / HH_MM_SS
         self.date_pattern = date_pattern or rf"(\d{{4}})[{self.separators}](\d{{2}})[{self.separators}](\d{{2}})"
         self.time_pattern = time_pattern or rf"(\d{{2}})[{self.separators}](\d{{2}})[{self.separators}](\d{{2}})"
+        self._date_regex = re.compile(self.date_pattern)
+        self._time_regex = re.compile(self.time_pattern)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def shared(cls, separators="-_", label_format="%Y_%m_%d_%H_%M_%S", default_time="09_00_00",
+               date_pattern=None, time_pattern=None) -> "CustomDatetime":
+        """ Return a single shared instance per set of arguments, instances are not modified after construction """
+        return cls(separators, label_format, default_time, date_pattern, time_pattern)
 
     def create_datetime_from_string(self, input_datetime_str: str = None) -> datetime:
         """
@@ -37,7 +53,7 @@ class CustomDatetime:
             raise ValueError("Input datetime string cannot be None")
 
         # --- Find date ---
-        date_match = re.search(self.date_pattern, input_datetime_str)
+        date_match = self._date_regex.search(input_datetime_str)
         if not date_match:
             raise ValueError(f"Input string {input_datetime_str} does not contain a valid date")
 
@@ -57,7 +73,7 @@ class CustomDatetime:
 
         # --- Find time (search only after date to avoid picking up pre-date tokens) ---
         remaining_str = input_datetime_str[date_match.end():]
-        time_match = re.search(self.time_pattern, remaining_str)
+        time_match = self._time_regex.search(remaining_str)
 
         if time_match:
             time_groups = time_match.groups()
@@ -74,11 +90,32 @@ class CustomDatetime:
             time_str = self.default_time
             time_fmt = "%H_%M_%S"
 
+        # Purely numeric tokens need no strptime, datetime validates the ranges just the same
+        tokens = (*date_groups, *time_str.split("_"))
+        if len(tokens) == 6 and all(token.isdigit() for token in tokens):
+            year, month, day, hour, minute, second = map(int, tokens)
+            if len(year_token) == 2:
+                # Same pivot as %y: 69-99 are 1969-1999, 00-68 are 2000-2068
+                year += 1900 if year >= 69 else 2000
+            return datetime(year, month, day, hour, minute, second)
+
         # Final assemble + parse
         datetime_str = f"{date_str}_{time_str}"
         fmt = f"{date_fmt}_{time_fmt}"
         return datetime.strptime(datetime_str, fmt)
 
+    def create_datetimes_from_strings(self, input_datetime_strs, as_datetime64: bool = False):
+        """
+        Creates datetimes for a whole list of strings, e.g. all filenames in a dataset.
+
+        Returns a list of datetime objects, or a `datetime64[s]` array when
+        `as_datetime64` is set. Raises ValueError on the first string without a valid date.
+        """
+        datetimes = [self.create_datetime_from_string(input_datetime_str) for input_datetime_str in input_datetime_strs]
+        if as_datetime64:
+            return np.array(datetimes, dtype="datetime64[s]")
+        return datetimes
+
     def write_datetime_to_string(self, input_datetime: datetime) -> str:
         if input_datetime is None:
             raise ValueError("Input datetime cannot be None")
@@ -166,6 +203,37 @@ class TestCustomDatetime(unittest.TestCase):
         expected_datetime = datetime(2025, 8, 12, 13, 32, 0)
         self.assertEqual(dt_obj, expected_datetime)
 
+    def test_create_datetimes_from_strings(self):
+        sanitizer = CustomDatetime()
+        dt_objs = sanitizer.create_datetimes_from_strings(["IV_2024_06_14_12_30_45.txt", "IV_2024-06-15.txt"])
+        self.assertEqual(dt_objs, [datetime(2024, 6, 14, 12, 30, 45), datetime(2024, 6, 15, 9, 0, 0)])
+
+    def test_create_datetimes_from_strings_as_datetime64(self):
+        sanitizer = CustomDatetime()
+        dt_array = sanitizer.create_datetimes_from_strings(["2024_06_14_12_30_45", "2024_06_14_13_30_45"], as_datetime64=True)
+        self.assertEqual(dt_array.dtype, np.dtype("datetime64[s]"))
+        self.assertEqual(dt_array[1] - dt_array[0], np.timedelta64(3600, "s"))
+
+    def test_create_datetimes_from_strings_invalid(self):
+        sanitizer = CustomDatetime()
+        with self.assertRaises(ValueError):
+            sanitizer.create_datetimes_from_strings(["2024_06_14", "no date here"])
+
+    def test_two_digit_year_matches_strptime(self):
+        sanitizer = CustomDatetime(date_pattern=r"(\d{2})(\d{2})(\d{2})", time_pattern=r"(\d{2})(\d{2})")
+        for year in ("68", "69"):
+            dt_obj = sanitizer.create_datetime_from_string(f"QE {year}0812-1332")
+            self.assertEqual(dt_obj, datetime.strptime(f"{year}0812 1332", "%y%m%d %H%M"))
+
+    def test_invalid_month(self):
+        sanitizer = CustomDatetime()
+        with self.assertRaises(ValueError):
+            sanitizer.create_datetime_from_string("2024_13_14")
+
+    def test_shared_instance(self):
+        self.assertIs(CustomDatetime.shared(), CustomDatetime.shared())
+        self.assertIsNot(CustomDatetime.shared(), CustomDatetime.shared(separators="/-"))
+
     def test_get_current_timestamp_default_format(self):
         sanitizer = CustomDatetime()
         ts = sanitizer.get_current_timestamp(now=datetime(2024, 6, 14, 12, 30, 45))
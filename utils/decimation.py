@@ -0,0 +1,69 @@
+import numpy as np
+
+METHODS = ("minmax", "lttb")
+
+
+def minmax_indices(y: np.ndarray, nr_of_buckets: int) -> np.ndarray:
+    """
+    Indices of the minimum and maximum of y in each of nr_of_buckets equal buckets, plus the end points.
+
+    Keeps every peak and dip visible, at most 2 * nr_of_buckets + 2 points.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    length = len(y)
+    if length <= 2 * nr_of_buckets + 2:
+        return np.arange(length)
+
+    size = -(-length // nr_of_buckets)
+    padded = np.full(nr_of_buckets * size, np.nan)
+    padded[:length] = y
+    buckets = padded.reshape(nr_of_buckets, size)
+    # NaNs never win, so buckets of only NaNs or padding fall back on their first point
+    minima = np.argmin(np.where(np.isnan(buckets), np.inf, buckets), axis=1)
+    maxima = np.argmax(np.where(np.isnan(buckets), -np.inf, buckets), axis=1)
+
+    starts = np.arange(nr_of_buckets) * size
+    indices = np.concatenate(([0, length - 1], starts + minima, starts + maxima))
+    return np.unique(indices[indices < length])
+
+
+def lttb_indices(y: np.ndarray, nr_of_points: int, x: np.ndarray = None) -> np.ndarray:
+    """
+    Indices selected by Largest-Triangle-Three-Buckets, which keeps the visual shape of (x, y) with nr_of_points.
+
+    x defaults to the point index. The first and last points are always kept.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    length = len(y)
+    if nr_of_points >= length or nr_of_points < 3:
+        return np.arange(length)
+    x = np.arange(length, dtype=np.float64) if x is None else np.asarray(x, dtype=np.float64)
+
+    every = (length - 2) / (nr_of_points - 2)
+    indices = np.empty(nr_of_points, dtype=np.int64)
+    indices[0], indices[-1] = 0, length - 1
+    selected = 0
+    for bucket in range(nr_of_points - 2):
+        # The point of this bucket forming the largest triangle with the previous selection and the next bucket's mean
+        start, end = int(bucket * every) + 1, int((bucket + 1) * every) + 1
+        next_start, next_end = end, min(int((bucket + 2) * every) + 1, length)
+        mean_x, mean_y = x[next_start:next_end].mean(), np.nanmean(y[next_start:next_end])
+
+        areas = np.abs(
+            (x[selected] - mean_x) * (y[start:end] - y[selected])
+            - (x[selected] - x[start:end]) * (mean_y - y[selected])
+        )
+        selected = start + int(np.argmax(np.nan_to_num(areas, nan=-1.0)))
+        indices[bucket + 1] = selected
+    return indices
+
+
+def decimation_indices(y: np.ndarray, method: str, width: int) -> np.ndarray:
+    """ Indices that keep the shape of y on a plot width pixels wide, about two points per pixel """
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {METHODS}")
+    if not isinstance(width, int) or width < 1:
+        raise ValueError("width must be a positive integer")
+    if method == "minmax":
+        return minmax_indices(y, width)
+    return lttb_indices(y, 2 * width)
@@ -19,4 +19,9 @@ class IncompatibleDeviceTypeFound(KeyError):
 
 
 class ImplementationError(RuntimeError):
-    """Raised when the implementations package fails validation."""
\ No newline at end of file
+    """Raised when the implementations package fails validation."""
+
+
+class RunCancelledError(RuntimeError):
+    """Raised inside a worker run once its cancellation token has been cancelled."""
+    pass
@@ -0,0 +1,198 @@
+import ast
+from functools import lru_cache
+from typing import Any
+import numpy as np
+
+# NumPy functions available in expressions and how they transform units: "keep" the units of their
+#   argument, "wrap" them (sqrt(V)) or return a dimensionless result
+FUNCTIONS = {
+    "abs": (np.abs, "keep"),
+    "min": (np.min, "keep"),
+    "max": (np.max, "keep"),
+    "mean": (np.mean, "keep"),
+    "sum": (np.sum, "keep"),
+    "sqrt": (np.sqrt, "wrap"),
+    "exp": (np.exp, None),
+    "log": (np.log, None),
+    "log10": (np.log10, None),
+    "log2": (np.log2, None),
+    "sin": (np.sin, None),
+    "cos": (np.cos, None),
+    "tan": (np.tan, None),
+    "arcsin": (np.arcsin, None),
+    "arccos": (np.arccos, None),
+    "arctan": (np.arctan, None),
+}
+_OPERATORS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.USub, ast.UAdd)
+
+# Configured derived observables per processor class name, set from the "derived_observables" config key
+_configured_expressions: dict[str, dict] = {}
+
+
+def set_configured_expressions(expressions: dict) -> None:
+    """
+        Store derived observables declared in the config, as {processor class name: {observable: expression}}.
+        Every declaration is compiled here, so a malformed config is rejected when it is loaded
+    """
+    global _configured_expressions
+    if not isinstance(expressions, dict):
+        raise ValueError("derived_observables must be a dict of processor names to observables")
+    for processor_name, declarations in expressions.items():
+        if not isinstance(declarations, dict):
+            raise ValueError(f"derived_observables of {processor_name} must be a dict of observables to expressions")
+        compile_declarations(declarations, processor_name)
+    _configured_expressions = expressions
+
+
+def get_configured_expressions(processor_name: str) -> dict:
+    return _configured_expressions.get(processor_name, {})
+
+
+class CompiledExpression:
+    """
+    Arithmetic expression over observables, parsed once and evaluated with NumPy.
+
+    Expressions use observable names, numbers, `+ - * / **` and the functions in
+    `FUNCTIONS` (e.g. ``"current / 0.16"`` or ``"log10(absorbance)"``). Anything
+    else, such as attribute access or keyword arguments, is rejected when the
+    expression is compiled, so configured expressions cannot run arbitrary code.
+
+    - `names` lists the observables the expression reads, in order of appearance.
+    - `evaluate` computes the expression over whole arrays at once.
+    - `get_units` derives the units of the result from the units of its inputs:
+      sums need matching units, products and quotients combine them, powers
+      need a numeric exponent and functions follow `FUNCTIONS`.
+    """
+    def __init__(self, expression: str):
+        if not isinstance(expression, str):
+            raise ValueError("expression must be a string")
+        try:
+            tree = ast.parse(expression.strip(), mode="eval")
+        except SyntaxError as error:
+            raise ValueError(f"Invalid expression {expression!r}: {error.msg}") from None
+
+        self.expression = expression
+        self._tree = tree
+        names = []
+        for node in ast.walk(tree):
+            self._check_node(node)
+            if isinstance(node, ast.Name) and node.id not in FUNCTIONS:
+                names.append(node)
+        # ast.walk is breadth first, positions give the order of appearance
+        names.sort(key=lambda node: (node.lineno, node.col_offset))
+        self.names = tuple(dict.fromkeys(node.id for node in names))
+        self._code = compile(tree, f"<expression {expression}>", "eval")
+
+    def _check_node(self, node: ast.AST) -> None:
+        if isinstance(node, (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Name, ast.Load) + _OPERATORS):
+            return
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+            return
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in FUNCTIONS \
+                and len(node.args) == 1 and not node.keywords:
+            return
+        raise ValueError(f"Unsupported {type(node).__name__} in expression {self.expression!r}")
+
+    def evaluate(self, values: dict[str, Any]) -> Any:
+        """ Evaluate the expression, values maps every name in `names` to its data """
+        missing = [name for name in self.names if name not in values]
+        if missing:
+            raise ValueError(f"Missing values for {missing} in expression {self.expression!r}")
+        namespace = {name: function for name, (function, _) in FUNCTIONS.items()}
+        namespace.update({name: np.asarray(values[name]) for name in self.names})
+        return eval(self._code, {"__builtins__": {}}, namespace)
+
+    def get_units(self, units: dict[str, str | None]) -> str | None:
+        """ Units of the result, units maps every name in `names` to its units (None when unitless) """
+        return self._get_node_units(self._tree.body, units)
+
+    def _get_node_units(self, node: ast.AST, units: dict) -> str | None:
+        if isinstance(node, ast.Constant):
+            return None
+        if isinstance(node, ast.Name):
+            return units.get(node.id)
+        if isinstance(node, ast.UnaryOp):
+            return self._get_node_units(node.operand, units)
+        if isinstance(node, ast.Call):
+            argument_units = self._get_node_units(node.args[0], units)
+            transform = FUNCTIONS[node.func.id][1]
+            if transform == "keep":
+                return argument_units
+            if transform == "wrap" and argument_units is not None:
+                return f"{node.func.id}({argument_units})"
+            return None
+
+        left = self._get_node_units(node.left, units)
+        if isinstance(node.op, ast.Pow):
+            if left is None:
+                return None
+            if not isinstance(node.right, ast.Constant):
+                raise ValueError(f"Exponent of {left} must be a number in expression {self.expression!r}")
+            return f"{_group(left)}^{node.right.value}"
+
+        right = self._get_node_units(node.right, units)
+        if isinstance(node.op, (ast.Add, ast.Sub)):
+            if left is not None and right is not None and left != right:
+                raise ValueError(f"Cannot combine {left} and {right} in expression {self.expression!r}")
+            return left if left is not None else right
+        if isinstance(node.op, ast.Mult):
+            return "*".join(_group(part) for part in (left, right) if part is not None) or None
+        if right is None:
+            return left
+        return f"{_group(left) if left is not None else 1}/{_group(right)}"
+
+    def __reduce__(self):
+        # Code objects cannot be pickled, recompile from the source instead
+        return compile_expression, (self.expression,)
+
+
+def _group(units: str) -> str:
+    return f"({units})" if any(symbol in units for symbol in "*/") else units
+
+
+@lru_cache(maxsize=None)
+def compile_expression(expression: str) -> CompiledExpression:
+    """ Parse and compile an expression once, later calls with the same string share the result """
+    return CompiledExpression(expression)
+
+
+def compile_declarations(declarations: dict, owner: str) -> dict[str, tuple[CompiledExpression, str | None]]:
+    """
+        Compile derived observables declared as {observable: expression} or {observable: {"expression", "units"}}
+        into {observable: (expression, units)}. Names must be identifiers other than the functions in `FUNCTIONS`
+        and declarations may not depend on themselves, directly or through each other. owner names the declaring
+        processor in errors
+    """
+    compiled = {}
+    for observable, declaration in declarations.items():
+        if not isinstance(observable, str) or not observable.isidentifier() or observable in FUNCTIONS:
+            raise ValueError(f"Invalid derived observable name {observable!r} for {owner}")
+        if isinstance(declaration, dict):
+            unexpected = set(declaration) - {"expression", "units"}
+            if unexpected:
+                raise ValueError(f"Unexpected keys {sorted(unexpected)} for derived observable {observable} of {owner}")
+            expression, units = declaration.get("expression"), declaration.get("units")
+        else:
+            expression, units = declaration, None
+        if units is not None and not isinstance(units, str):
+            raise ValueError(f"Units of derived observable {observable} of {owner} must be a string")
+        try:
+            compiled[observable] = (compile_expression(expression), units)
+        except (TypeError, ValueError) as error:
+            raise ValueError(f"Derived observable {observable} of {owner}: {error}") from None
+
+    # Depth first through the derived inputs, a name met again on the current path closes a cycle
+    done = set()
+
+    def visit(observable: str, path: tuple) -> None:
+        if observable in path:
+            raise ValueError(f"Derived observables of {owner} depend on themselves: {' -> '.join(path + (observable,))}")
+        if observable in done or observable not in compiled:
+            return
+        for name in compiled[observable][0].names:
+            visit(name, path + (observable,))
+        done.add(observable)
+
+    for observable in compiled:
+        visit(observable, ())
+    return compiled
@@ -0,0 +1,45 @@
+from typing import Any
+import numpy as np
+
+# Application-wide default, set from the "compact_precision" config key
+_compact_precision = False
+COMPACT_FLOAT_DTYPE = np.float32
+
+
+def set_compact_precision(enabled: bool) -> None:
+    """ Store floating point observables as float32 instead of float64 unless they declare a dtype """
+    global _compact_precision
+    _compact_precision = bool(enabled)
+
+
+def get_compact_precision() -> bool:
+    return _compact_precision
+
+
+def as_typed_array(data: Any, dtype=None, compact: bool = None) -> Any:
+    """
+    Convert numeric observable data into a NumPy array of the requested dtype.
+
+    An explicit `dtype` always applies. Without one, floating point data is
+    narrowed to float32 in compact mode (`compact`, or the application-wide
+    setting when None) and integer data keeps its type. Data is returned
+    unchanged when no dtype applies or when it is not a numeric sequence
+    (scalars, strings, datetimes, ragged lists, ...), so conversion never
+    changes the meaning of an observable.
+    """
+    compact = _compact_precision if compact is None else compact
+    if dtype is None and not compact:
+        return data
+    if isinstance(data, (str, bytes, dict)):
+        return data
+
+    try:
+        array = np.asarray(data)
+    except (TypeError, ValueError):
+        return data
+    if array.ndim == 0 or array.dtype.kind not in "biuf":
+        return data
+
+    if dtype is None:
+        dtype = COMPACT_FLOAT_DTYPE if array.dtype.kind == "f" else array.dtype
+    return array.astype(dtype, copy=False)
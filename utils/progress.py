@@ -0,0 +1,79 @@
+import datetime
+import os
+import time
+
+# Seconds between two progress reports, however many files complete in between
+PROGRESS_INTERVAL = 0.25
+
+
+def get_file_size(filepath) -> int:
+    """ Size of filepath in bytes, 0 for anything that is not an existing file """
+    if isinstance(filepath, str) and os.path.isfile(filepath):
+        return os.path.getsize(filepath)
+    return 0
+
+
+class ProgressTracker:
+    """
+    Progress of reading a set of files, weighted by file size and reported at a limited rate.
+
+    Every file counts for its size in bytes, so one large file moves the progress
+    as much as it takes to read rather than as much as one small file. Files of
+    unknown size (0 bytes) fall back on weighting every file equally.
+
+    - `advance` marks files as done and returns True when a report is due: at most
+      once every `interval` seconds, and always once everything is done.
+    - `get_progress` is the weighted percentage, `get_status` the throughput in
+      MB/s and files/s with the estimated time remaining.
+    """
+    def __init__(self, sizes: dict[str, int], interval: float = PROGRESS_INTERVAL):
+        if interval < 0:
+            raise ValueError("interval must not be negative")
+        self.sizes = sizes
+        self.interval = interval
+        self.total_bytes = sum(sizes.values())
+        self.bytes_done = 0
+        self.files_done = 0
+        self._start = time.monotonic()
+        self._last_report = None
+
+    @classmethod
+    def from_filepaths(cls, filepaths: dict, interval: float = PROGRESS_INTERVAL) -> "ProgressTracker":
+        return cls({key: get_file_size(filepath) for key, filepath in filepaths.items()}, interval)
+
+    def advance(self, *keys: str) -> bool:
+        for key in keys:
+            self.bytes_done += self.sizes.get(key, 0)
+            self.files_done += 1
+
+        now = time.monotonic()
+        if self.files_done >= len(self.sizes) or self._last_report is None or now - self._last_report >= self.interval:
+            self._last_report = now
+            return True
+        return False
+
+    def _get_fraction(self) -> float:
+        # By bytes when the sizes are known and by files otherwise
+        if self.total_bytes > 0:
+            return self.bytes_done / self.total_bytes
+        return self.files_done / len(self.sizes) if self.sizes else 1.0
+
+    def get_progress(self) -> int:
+        """ Percentage done, weighted by file size """
+        return int(100 * self._get_fraction())
+
+    def get_eta(self) -> float | None:
+        """ Seconds remaining at the rate so far, None until something has been done """
+        elapsed = time.monotonic() - self._start
+        done = self._get_fraction()
+        if done <= 0 or elapsed <= 0:
+            return None
+        return elapsed * (1 - done) / done
+
+    def get_status(self) -> str:
+        """ Throughput and time remaining, e.g. "12.3 MB/s, 45.0 files/s, ETA 0:00:12" """
+        elapsed = max(time.monotonic() - self._start, 1e-9)
+        eta = self.get_eta()
+        eta = "unknown" if eta is None else str(datetime.timedelta(seconds=round(eta)))
+        return (f"{self.bytes_done / 1024 ** 2 / elapsed:.1f} MB/s, "
+                f"{self.files_done / elapsed:.1f} files/s, ETA {eta}")